@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+background.py
+
+Main menu background for Clash Royale — Guess Who?
+The source image is decoded once per process and scaled copies are cached
+per window size, so showing the menu again after a game costs nothing.
+While the window is being resized a cheap resample keeps up with the drag;
+once resizing settles the current size is re-rendered with LANCZOS.
+"""
+
+import os
+from collections import OrderedDict
+from typing import Tuple
+
+BACKGROUND_FILE = os.path.join("..", "clash_royale_background.png")
+SETTLE_MS = 150          # quiet period before the high-quality pass
+MAX_CACHED_SIZES = 4
+
+_sources = {}                        # path -> decoded Image, or None if unreadable
+_scaled = OrderedDict()              # (path, size) -> PhotoImage, high quality only, LRU
+
+
+def load_source(path: str = BACKGROUND_FILE):
+    """Decode the background once; a missing/corrupt file is remembered too"""
+    if path not in _sources:
+        if not os.path.exists(path):
+            # No background: skip importing Pillow altogether
+            _sources[path] = None
+            return None
+        try:
+            from PIL import Image
+            with Image.open(path) as image:
+                _sources[path] = image.convert("RGB")
+        except Exception as e:
+            print(f"Could not load background image: {e}")
+            _sources[path] = None
+    return _sources[path]
+
+
+def _cached(path: str, size: Tuple[int, int]):
+    photo = _scaled.get((path, size))
+    if photo is not None:
+        _scaled.move_to_end((path, size))
+    return photo
+
+
+def _store(path: str, size: Tuple[int, int], photo):
+    _scaled[(path, size)] = photo
+    _scaled.move_to_end((path, size))
+    while len(_scaled) > MAX_CACHED_SIZES:
+        _scaled.popitem(last=False)
+
+
+class BackgroundRenderer:
+    """Keeps a canvas image item filled with the background at the canvas size"""
+
+    def __init__(self, canvas, path: str = BACKGROUND_FILE, on_resize=None):
+        self.canvas = canvas
+        self.path = path
+        self.source = load_source(path)
+        self.on_resize = on_resize          # on_resize(width, height), e.g. to recenter widgets
+        self.item = canvas.create_image(0, 0, anchor="nw")
+        self.photo = None                   # keep a reference so Tk doesn't drop the image
+        self.size = None
+        self._settle_id = None
+        canvas.bind("<Configure>", self._on_configure, add="+")
+
+    @property
+    def available(self) -> bool:
+        return self.source is not None
+
+    def _on_configure(self, event):
+        size = (max(1, event.width), max(1, event.height))
+        if size == self.size:
+            return
+        self.size = size
+        if self.on_resize:
+            self.on_resize(*size)
+        if not self.available:
+            return
+        photo = _cached(self.path, size)
+        if photo is not None:
+            self._show(photo)
+            return
+        from PIL import Image, ImageTk
+        # Mid-drag: a fast resample now, the LANCZOS pass once the size settles
+        self._show(ImageTk.PhotoImage(self.source.resize(size, Image.NEAREST)))
+        if self._settle_id is not None:
+            self.canvas.after_cancel(self._settle_id)
+        self._settle_id = self.canvas.after(SETTLE_MS, self._render_final)
+
+    def _render_final(self):
+        self._settle_id = None
+        if self.size is None or not self.canvas.winfo_exists():
+            return
+        photo = _cached(self.path, self.size)
+        if photo is None:
+            from PIL import Image, ImageTk
+            photo = ImageTk.PhotoImage(self.source.resize(self.size, Image.LANCZOS))
+            _store(self.path, self.size, photo)
+        self._show(photo)
+
+    def _show(self, photo):
+        self.photo = photo
+        self.canvas.itemconfigure(self.item, image=photo)
+        self.canvas.tag_lower(self.item)
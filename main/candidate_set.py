@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+candidate_set.py
+
+Bitset-indexed candidate elimination for Clash Royale — Guess Who?
+Every card gets one bit; every (attribute, value) pair gets a precomputed
+mask, so answering a question is a single AND / AND-NOT on integers.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+
+if hasattr(int, "bit_count"):
+    def popcount(mask: int) -> int:
+        """Number of set bits in a (non-negative) mask"""
+        return mask.bit_count()
+else:
+    def popcount(mask: int) -> int:
+        """Number of set bits in a (non-negative) mask"""
+        return bin(mask).count("1")
+
+
+def mask_from_positions(positions: Iterable[int], size: int) -> int:
+    """Build a bitmask from bit positions in linear time"""
+    buf = bytearray((size + 7) // 8)
+    for i in positions:
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, "little")
+
+
+# Positions of the set bits of every byte value
+_BYTE_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yield the positions of the set bits in ascending order (linear in the mask's width)"""
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    for offset, byte in enumerate(data):
+        if byte:
+            base = offset << 3
+            for bit in _BYTE_BITS[byte]:
+                yield base + bit
+
+
+class CandidateIndex:
+    """Precomputed (attribute, value) -> bitmask index over a card pool"""
+
+    def __init__(self, cards, attributes: Dict[str, Callable[[Any], Any]]):
+        self.cards = list(cards)
+        self.attributes = attributes
+        self.full_mask = (1 << len(self.cards)) - 1
+        self.positions = {card.name: i for i, card in enumerate(self.cards)}
+
+        # attribute -> value -> mask of the cards holding that value
+        self.value_masks: Dict[str, Dict[Any, int]] = {}
+        for attr, keyfunc in attributes.items():
+            buckets: Dict[Any, List[int]] = {}
+            for i, card in enumerate(self.cards):
+                buckets.setdefault(keyfunc(card), []).append(i)
+            self.value_masks[attr] = {
+                value: mask_from_positions(idxs, len(self.cards))
+                for value, idxs in buckets.items()
+            }
+
+    @classmethod
+    def from_table(cls, table) -> "CandidateIndex":
+        """Build the index straight from a CardTable's columns"""
+        index = cls.__new__(cls)
+        index.cards = table
+        index.attributes = None
+        index.full_mask = table.full_mask
+        index.positions = {name: i for i, name in enumerate(table.names)}
+        index.value_masks = {
+            attr: table.value_masks(attr)
+            for attr in table.attribute_names
+        }
+        return index
+
+    def __len__(self):
+        return len(self.cards)
+
+    def bit(self, card) -> int:
+        """Mask holding only the given card"""
+        return 1 << self.positions[card.name]
+
+    def mask_where(self, attr: str, predicate: Callable[[Any], bool]) -> int:
+        """Mask of all cards whose attribute satisfies predicate.
+
+        The predicate runs once per distinct value, not once per card.
+        """
+        mask = 0
+        for value, value_mask in self.value_masks[attr].items():
+            if predicate(value):
+                mask |= value_mask
+        return mask
+
+    def cards_in(self, mask: int) -> List[Any]:
+        """Cards whose bits are set in mask, in pool order"""
+        cards = self.cards
+        return [cards[i] for i in iter_bits(mask)]
+
+
+class CandidateSet:
+    """The cards still in play, stored as a bitmask over a CandidateIndex"""
+
+    def __init__(self, index: CandidateIndex, mask: int = None):
+        self.index = index
+        self.mask = index.full_mask if mask is None else mask
+
+    def __len__(self):
+        return popcount(self.mask)
+
+    def __iter__(self):
+        return iter(self.index.cards_in(self.mask))
+
+    def __contains__(self, card):
+        return bool(self.mask & self.index.bit(card))
+
+    def cards(self) -> List[Any]:
+        """Remaining candidates as a list"""
+        return self.index.cards_in(self.mask)
+
+    def keep(self, mask: int) -> int:
+        """Keep only candidates inside mask; return the mask of removed cards"""
+        removed = self.mask & ~mask
+        self.mask &= mask
+        return removed
+
+    def answer(self, match_mask: int, truth: bool) -> int:
+        """Apply a yes/no answer to a question matching match_mask"""
+        return self.keep(match_mask if truth else ~match_mask)
+
+    def discard(self, card) -> int:
+        """Remove a single card; return the mask of removed cards"""
+        return self.keep(~self.index.bit(card))
+
+    def reset(self):
+        """Put every card back in play"""
+        self.mask = self.index.full_mask
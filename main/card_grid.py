@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+card_grid.py
+
+Virtualized card grid for Clash Royale — Guess Who?
+Cards are drawn as canvas items instead of one Frame/Label/Button set per
+card. Only the visible rows (plus a little overscan) are materialised, and
+their items are recycled as the user scrolls, so startup cost and memory
+do not grow with the size of the card pool.
+
+Card state is kept as bitmasks: the grid remembers what it last rendered,
+diffs that against the desired candidate mask, and applies the difference
+in one coalesced idle-time pass.
+"""
+
+from typing import Callable, Dict, List
+
+CARD_W, CARD_H, PADDING = 150, 190, 8
+CELL_W, CELL_H = CARD_W + 2 * PADDING, CARD_H + 2 * PADDING
+OVERSCAN_ROWS = 1
+
+RARITY_COLORS = {
+    'common': '#95a5a6',
+    'rare': '#3498db',
+    'epic': '#9b59b6',
+    'legendary': '#f39c12'
+}
+
+# state -> (button text, button fill, button outline, text color, card outline, outline width)
+STATE_STYLES = {
+    "active": ("Guess This!", "#ffffff", "#28a745", "#28a745", "#ced4da", 1),
+    "eliminated": ("Eliminated", "#e9ecef", "#adb5bd", "#6c757d", "#dee2e6", 1),
+    "winner": ("🎉 Winner!", "#28a745", "#28a745", "#ffffff", "#212529", 3),
+}
+
+
+class CardGrid:
+    """Draws cards on a Canvas, materialising only what is on screen"""
+
+    def __init__(self, canvas, cards, image_for: Callable, on_guess: Callable, scrollbar=None):
+        self.canvas = canvas
+        self.cards = cards
+        self.image_for = image_for      # image_for(card, state) -> PhotoImage
+        self.on_guess = on_guess        # on_guess(card), only for active cards
+        self.scrollbar = scrollbar
+        self.positions = {name: i for i, name in enumerate(self._names())}
+        self.full_mask = (1 << len(cards)) - 1
+        # Desired look (alive mask + winner) and what was last rendered
+        self.alive_mask = self.full_mask
+        self.winner = None
+        self.rendered_mask = self.full_mask
+        self.rendered_winner = None
+        self._sync_id = None
+        self.cols = 5
+        self.slots: List[dict] = []
+        self.visible: Dict[int, dict] = {}
+        self.free: List[dict] = []
+        self._render_id = None
+
+        canvas.configure(yscrollcommand=self._on_yscroll)
+        canvas.bind("<Configure>", self._on_configure, add="+")
+        self.update_scrollregion()
+        self.schedule_render()
+
+    def _names(self):
+        names = getattr(self.cards, "names", None)
+        return names if names is not None else [card.name for card in self.cards]
+
+    # ---------- GEOMETRY ----------
+    def update_scrollregion(self):
+        rows = (len(self.cards) + self.cols - 1) // self.cols
+        self.canvas.configure(scrollregion=(0, 0, self.cols * CELL_W, rows * CELL_H))
+
+    def visible_range(self) -> range:
+        top = self.canvas.canvasy(0)
+        height = max(self.canvas.winfo_height(), CELL_H)
+        first_row = max(0, int(top // CELL_H) - OVERSCAN_ROWS)
+        last_row = int((top + height) // CELL_H) + OVERSCAN_ROWS
+        return range(first_row * self.cols, min(len(self.cards), (last_row + 1) * self.cols))
+
+    def _on_configure(self, event):
+        cols = max(1, event.width // CELL_W)
+        if cols != self.cols:
+            self.cols = cols
+            self.update_scrollregion()
+            # Every visible card moves; redraw them in their new cells
+            for i, slot in self.visible.items():
+                self._draw(slot, i)
+        self.schedule_render()
+
+    def _on_yscroll(self, first, last):
+        if self.scrollbar is not None:
+            self.scrollbar.set(first, last)
+        self.schedule_render()
+
+    def yview(self, *args):
+        """Scrollbar command"""
+        self.canvas.yview(*args)
+
+    # ---------- RENDERING ----------
+    def schedule_render(self):
+        """Coalesce redraw requests into one idle-time pass"""
+        if self._render_id is None:
+            self._render_id = self.canvas.after_idle(self.render)
+
+    def render(self):
+        """Materialise the visible cards, recycling slots that scrolled away"""
+        self._render_id = None
+        if not self.canvas.winfo_exists():
+            return
+        needed = self.visible_range()
+        for i in [i for i in self.visible if i not in needed]:
+            slot = self.visible.pop(i)
+            for item in slot["items"]:
+                self.canvas.itemconfigure(item, state="hidden")
+            self.free.append(slot)
+        for i in needed:
+            if i not in self.visible:
+                slot = self.free.pop() if self.free else self._new_slot()
+                self.visible[i] = slot
+                self._draw(slot, i)
+
+    def _new_slot(self) -> dict:
+        c = self.canvas
+        slot = {"index": None}
+        slot["frame"] = c.create_rectangle(0, 0, 0, 0, fill="#ffffff")
+        slot["image"] = c.create_image(0, 0, anchor="center")
+        slot["name"] = c.create_text(0, 0, font=("Orbitron", 11, "bold"), anchor="center",
+                                     justify="center", width=CARD_W - 10)
+        slot["detail"] = c.create_text(0, 0, font=("Arial", 9), anchor="center")
+        slot["button"] = c.create_rectangle(0, 0, 0, 0, width=1)
+        slot["label"] = c.create_text(0, 0, font=("Arial", 9), anchor="center")
+        slot["items"] = [slot[k] for k in ("frame", "image", "name", "detail", "button", "label")]
+        for item in (slot["button"], slot["label"]):
+            c.tag_bind(item, "<Button-1>", lambda e, s=slot: self._click(s))
+            c.tag_bind(item, "<Enter>", lambda e, s=slot: self._hover(s, True))
+            c.tag_bind(item, "<Leave>", lambda e, s=slot: self._hover(s, False))
+        self.slots.append(slot)
+        return slot
+
+    def _draw(self, slot: dict, i: int):
+        c = self.canvas
+        card = self.cards[i]
+        state = self.state_of(i)
+        text, fill, outline, text_color, frame_outline, frame_width = STATE_STYLES[state]
+        r, col = divmod(i, self.cols)
+        x0, y0 = col * CELL_W + PADDING, r * CELL_H + PADDING
+        cx = x0 + CARD_W // 2
+
+        slot["index"] = i
+        slot["state"] = state
+        c.coords(slot["frame"], x0, y0, x0 + CARD_W, y0 + CARD_H)
+        c.itemconfigure(slot["frame"], outline=frame_outline, width=frame_width, state="normal")
+        c.coords(slot["image"], cx, y0 + 58)
+        c.itemconfigure(slot["image"], image=self.image_for(card, state), state="normal")
+        c.coords(slot["name"], cx, y0 + 124)
+        c.itemconfigure(slot["name"], text=card.name, state="normal")
+        c.coords(slot["detail"], cx, y0 + 142)
+        c.itemconfigure(slot["detail"], text=f"{card.rarity.title()} • {card.elixir}⚡",
+                        fill=RARITY_COLORS.get(card.rarity, '#95a5a6'), state="normal")
+        c.coords(slot["button"], x0 + 20, y0 + CARD_H - 36, x0 + CARD_W - 20, y0 + CARD_H - 10)
+        c.itemconfigure(slot["button"], fill=fill, outline=outline, state="normal")
+        c.coords(slot["label"], cx, y0 + CARD_H - 23)
+        c.itemconfigure(slot["label"], text=text, fill=text_color, state="normal")
+
+    def _click(self, slot: dict):
+        i = slot["index"]
+        if i is None:
+            return
+        if self.state_of(i) == "active":
+            self.on_guess(self.cards[i])
+
+    def _hover(self, slot: dict, inside: bool):
+        i = slot["index"]
+        active = i is not None and self.state_of(i) == "active"
+        self.canvas.configure(cursor="hand2" if inside and active else "")
+
+    # ---------- STATE ----------
+    def state_of(self, i: int) -> str:
+        if i == self.winner:
+            return "winner"
+        return "active" if self.alive_mask >> i & 1 else "eliminated"
+
+    def sync(self, alive_mask: int, winner=None):
+        """Set the desired candidate mask (and winner card); redraw on idle.
+
+        Any number of calls before the next idle pass collapse into one diff.
+        """
+        self.alive_mask = alive_mask & self.full_mask
+        self.winner = None if winner is None else self.positions.get(winner.name)
+        if self._sync_id is None:
+            self._sync_id = self.canvas.after_idle(self._apply_sync)
+
+    def _apply_sync(self):
+        """Redraw only on-screen cards whose state changed since the last pass"""
+        self._sync_id = None
+        changed = self.rendered_mask ^ self.alive_mask
+        if self.winner != self.rendered_winner:
+            for i in (self.winner, self.rendered_winner):
+                if i is not None:
+                    changed |= 1 << i
+        self.rendered_mask = self.alive_mask
+        self.rendered_winner = self.winner
+        if not changed or not self.canvas.winfo_exists():
+            return
+        for i, slot in self.visible.items():
+            if changed >> i & 1 and slot.get("state") != self.state_of(i):
+                self._draw(slot, i)
+
+    def set_state(self, card, state: str):
+        """Change a single card's look"""
+        i = self.positions[card.name]
+        bit = 1 << i
+        alive = self.alive_mask & ~bit if state == "eliminated" else self.alive_mask | bit
+        winner = card if state == "winner" else (None if self.winner == i else self._winner_card())
+        self.sync(alive, winner)
+
+    def _winner_card(self):
+        return None if self.winner is None else self.cards[self.winner]
+
+    def refresh(self, card):
+        """Redraw a card if it is currently materialised (e.g. its image arrived)"""
+        i = self.positions.get(card.name)
+        slot = self.visible.get(i)
+        if slot is not None:
+            self._draw(slot, i)
+
+    def reset(self):
+        """Put every card back to the active look"""
+        self.sync(self.full_mask)
+
+    def set_cards(self, cards):
+        """Swap in a different card pool (e.g. a newly loaded deck), keeping the canvas items"""
+        self.cards = cards
+        self.positions = {name: i for i, name in enumerate(self._names())}
+        self.full_mask = (1 << len(cards)) - 1
+        self.alive_mask = self.rendered_mask = self.full_mask
+        self.winner = self.rendered_winner = None
+        for slot in self.visible.values():
+            for item in slot["items"]:
+                self.canvas.itemconfigure(item, state="hidden")
+            slot["index"] = None
+            self.free.append(slot)
+        self.visible.clear()
+        self.update_scrollregion()
+        self.canvas.yview_moveto(0)
+        self.schedule_render()
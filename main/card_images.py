@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+card_images.py
+
+Card art loading for Clash Royale — Guess Who?
+WebP decoding and LANCZOS resizing run on a thread pool; finished
+thumbnails are packed into one sprite atlas and turned into PhotoImages
+on the Tk thread, so the game screen appears immediately with
+placeholders and fills in as images become ready.
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple
+
+from PIL import Image, ImageDraw, ImageTk
+
+THUMB_SIZE = (120, 100)
+PLACEHOLDER_COLOR = (200, 200, 200)
+FADE_ALPHA = 128
+POLL_MS = 15
+ATLAS_COLS, ATLAS_ROWS = 8, 8   # slots per atlas page
+WINNER_BORDER = (243, 156, 18, 255)
+VARIANTS = ("normal", "faded", "winner")
+
+
+def placeholder_image(size=THUMB_SIZE, fade=False) -> Image.Image:
+    """Flat grey stand-in for missing or not-yet-loaded art"""
+    return Image.new("RGBA", size, PLACEHOLDER_COLOR + (FADE_ALPHA if fade else 255,))
+
+
+def render_thumbnail(path: str, size=THUMB_SIZE, fade=False) -> Image.Image:
+    """Decode, resize and centre one card image on a transparent canvas.
+
+    Safe to call from worker threads (no Tk involved).
+    """
+    im = Image.open(path).convert("RGBA")
+    im.thumbnail(size, Image.LANCZOS)
+    if fade:
+        im.putalpha(FADE_ALPHA)  # 50% transparency
+    bg = Image.new("RGBA", size, (255, 255, 255, 0))
+    bg.paste(im, ((size[0] - im.width) // 2, (size[1] - im.height) // 2), im)
+    return bg
+
+
+def load_thumbnail(card, size=THUMB_SIZE, fade=False, cache=None) -> Image.Image:
+    """render_thumbnail() with the placeholder fallback used by the game.
+
+    With a ThumbnailCache, a hit skips decoding and resampling entirely.
+    """
+    if card.image_file and os.path.exists(card.image_file):
+        try:
+            if cache is not None:
+                cached = cache.get(card.image_file, size, fade)
+                if cached is not None:
+                    return cached
+            thumb = render_thumbnail(card.image_file, size, fade)
+            if cache is not None:
+                cache.put(card.image_file, size, fade, thumb)
+            return thumb
+        except Exception as e:
+            print(f"Error loading image for {card.name}: {e}")
+    return placeholder_image(size, fade)
+
+
+def derive_variant(base: Image.Image, variant: str) -> Image.Image:
+    """Derive a display variant from a decoded thumbnail, in memory"""
+    if variant == "normal":
+        return base
+    if variant == "faded":
+        faded = base.copy()
+        faded.putalpha(base.getchannel("A").point(lambda a: a * FADE_ALPHA // 255))
+        return faded
+    if variant == "winner":
+        winner = base.copy()
+        ImageDraw.Draw(winner).rectangle((0, 0, base.width - 1, base.height - 1), outline=WINNER_BORDER, width=4)
+        return winner
+    raise ValueError(f"Unknown image variant '{variant}'")
+
+
+class ImageVariants:
+    """Keeps one decoded thumbnail per card and derives variants from it.
+
+    Eliminating or restoring a card swaps to a cached PhotoImage instead of
+    reopening and resampling the source file.
+    """
+
+    def __init__(self, size=THUMB_SIZE, cache=None):
+        self.size = size
+        self.cache = cache
+        self.bases: Dict[str, Image.Image] = {}
+        self.photos: Dict[Tuple[str, str], ImageTk.PhotoImage] = {}
+
+    def clear(self):
+        """Forget every card (a new deck may reuse a name with different art)"""
+        self.bases.clear()
+        self.photos.clear()
+
+    def has(self, card, variant="normal") -> bool:
+        return (card.name, variant) in self.photos
+
+    def set_base(self, card, image: Image.Image, photo=None):
+        """Register a decoded thumbnail (and optionally its ready-made normal photo)"""
+        self.bases[card.name] = image
+        for key in [k for k in self.photos if k[0] == card.name]:
+            del self.photos[key]
+        if photo is not None:
+            self.photos[(card.name, "normal")] = photo
+
+    def base(self, card) -> Image.Image:
+        if card.name not in self.bases:
+            self.bases[card.name] = load_thumbnail(card, self.size, cache=self.cache)
+        return self.bases[card.name]
+
+    def photo(self, card, variant="normal") -> ImageTk.PhotoImage:
+        """PhotoImage for a card variant (must be called on the Tk thread)"""
+        key = (card.name, variant)
+        if key not in self.photos:
+            self.photos[key] = ImageTk.PhotoImage(derive_variant(self.base(card), variant))
+        return self.photos[key]
+
+
+class CardImagePipeline:
+    """Background decoder feeding a sprite atlas and the Tk thread"""
+
+    def __init__(self, root, size=THUMB_SIZE, workers=4, cache=None):
+        self.root = root
+        self.size = size
+        self.cache = cache
+        self.workers = workers
+        self.executor = None
+        self.results = queue.Queue()
+        self.pages: List[Image.Image] = []
+        self.slots: Dict[str, Tuple[int, Tuple[int, int, int, int]]] = {}
+        self.next_slot = 0           # slots are never reused, even after cancel() drops some
+        self.ready = set()
+        self.atlas_lock = threading.Lock()
+        self.pending = 0
+        self.after_id = None
+        self.cancelled = False
+        self.generation = 0          # bumped on cancel; stale decodes are dropped
+        self._placeholder = None
+
+    @property
+    def placeholder(self):
+        """Shared placeholder PhotoImage shown until a card's art is ready"""
+        if self._placeholder is None:
+            self._placeholder = ImageTk.PhotoImage(placeholder_image(self.size))
+        return self._placeholder
+
+    def load(self, cards: List, on_ready: Callable):
+        """Queue cards for background decoding; on_ready(card, photo) runs on the Tk thread.
+
+        Cards already queued are skipped, so this can be called every time
+        new cards scroll into view.
+        """
+        self.cancelled = False
+        self.on_ready = on_ready
+        cards = [card for card in cards if card.name not in self.slots]
+        if not cards:
+            return
+        w, h = self.size
+        per_page = ATLAS_COLS * ATLAS_ROWS
+        with self.atlas_lock:
+            for card in cards:
+                page, slot = divmod(self.next_slot, per_page)
+                self.next_slot += 1
+                if page == len(self.pages):
+                    self.pages.append(Image.new("RGBA", (ATLAS_COLS * w, ATLAS_ROWS * h), (255, 255, 255, 0)))
+                r, c = divmod(slot, ATLAS_COLS)
+                self.slots[card.name] = (page, (c * w, r * h, c * w + w, r * h + h))
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="card-images")
+        self.pending += len(cards)
+        for card in cards:
+            self.executor.submit(self._decode, card, self.generation)
+        self._schedule()
+
+    def _decode(self, card, generation: int):
+        """Worker: decode one card and pack it into its atlas slot"""
+        if self.cancelled or generation != self.generation:
+            return
+        thumb = load_thumbnail(card, self.size, cache=self.cache)
+        with self.atlas_lock:
+            # Cancelled (or cleared for a new deck) while decoding
+            if generation != self.generation:
+                return
+            page, box = self.slots[card.name]
+            self.pages[page].paste(thumb, box[:2])
+            self.results.put(card)
+
+    def _schedule(self):
+        if self.after_id is None and not self.cancelled:
+            self.after_id = self.root.after(POLL_MS, self._drain)
+
+    def _drain(self):
+        """Tk thread: turn every finished atlas slot into a PhotoImage"""
+        self.after_id = None
+        if self.cancelled:
+            return
+        while True:
+            try:
+                card = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            self.ready.add(card.name)
+            sprite = self.sprite(card)
+            self.on_ready(card, ImageTk.PhotoImage(sprite))
+        if self.pending > 0:
+            self._schedule()
+
+    def sprite(self, card):
+        """Decoded thumbnail for a card from the atlas, or None if not loaded"""
+        if card.name not in self.ready:
+            return None
+        page, box = self.slots[card.name]
+        with self.atlas_lock:
+            return self.pages[page].crop(box)
+
+    def cancel(self):
+        """Stop decoding and drop pending callbacks (e.g. when the screen closes)"""
+        self.cancelled = True
+        with self.atlas_lock:
+            self.generation += 1
+        if self.after_id is not None:
+            try:
+                self.root.after_cancel(self.after_id)
+            except Exception:
+                pass
+            self.after_id = None
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self.pending = 0
+        self.results = queue.Queue()
+        # Undelivered cards must be decoded again if the pipeline is reused
+        for name in [n for n in self.slots if n not in self.ready]:
+            del self.slots[name]
+
+    def clear(self):
+        """Drop every decoded card and the atlas (a new deck may reuse names with different art)"""
+        self.cancel()
+        with self.atlas_lock:
+            self.pages = []
+            self.slots = {}
+            self.next_slot = 0
+            self.ready = set()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+cards.py
+
+Card pool for Clash Royale — Guess Who?
+Holds the Card record, the built-in deck, and a columnar CardTable that
+stores large pools as compact per-attribute arrays.
+"""
+
+from array import array
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+from candidate_set import mask_from_positions, iter_bits
+
+# ---------- CARD DATA ----------
+@dataclass
+class Card:
+    name: str
+    rarity: str
+    card_type: str
+    elixir: int
+    melee: bool
+    flying: bool
+    target: str
+    role: str
+    image_file: str = None
+
+CARDS: List[Card] = [
+    Card("Knight", "common", "troop", 3, True, False, "ground", "defense", "card images/clash-knight.webp"),
+    Card("Archers", "common", "troop", 3, False, False, "both", "support", "card images/clash-archers.webp"),
+    Card("Giant", "rare", "troop", 5, False, False, "ground", "win_condition", "card images/clash-giant.webp"),
+    Card("Baby Dragon", "epic", "troop", 4, False, True, "air", "support", "card images/clash-baby-dragon.webp"),
+    Card("Hog Rider", "rare", "troop", 4, True, False, "ground", "win_condition", "card images/clash-hog-rider.webp"),
+    Card("Wizard", "rare", "troop", 5, False, False, "both", "support", "card images/clash-wizard.webp"),
+    Card("Inferno Tower", "rare", "building", 5, False, False, "ground", "defense", "card images/clash-inferno-tower.webp"),
+    Card("Balloon", "epic", "troop", 5, False, True, "air", "win_condition", "card images/clash-balloon.webp"),
+    Card("Electro Wizard", "legendary", "troop", 4, False, False, "both", "support", "card images/clash-electro-wizard.webp"),
+    Card("Skeletons", "common", "troop", 1, False, False, "ground", "swarm", "card images/clash-skeletons.webp"),
+    Card("Prince", "epic", "troop", 5, True, False, "ground", "win_condition","card images/clash-prince.webp"),
+    Card("Miner", "legendary", "troop", 3, False, False, "ground", "support","card images/clash-royale-miner.webp"),
+    Card("Princess", "legendary", "troop", 3, False, True, "both", "support","card images/clash-princess.webp"),
+    Card("Goblin Barrel", "epic", "spell", 3, False, False, "ground", "win_condition","card images/clash-goblin-barrel.webp"),
+    Card("Fireball", "rare", "spell", 4, False, False, "ground", "support","card images/clash-fireball.webp"),
+    Card("Mortar", "common", "building", 4, False, False, "ground", "defense","card images/clash-mortar.webp"),
+    Card("Musketeer", "rare", "troop", 4, False, False, "both", "support","card images/clash-musketeer.webp"),
+    Card("Goblin Gang", "common", "troop", 3, False, False, "ground", "swarm","card images/clash-goblin-gang.webp"),
+    Card("Minion Horde", "common", "troop", 5, False, True, "air", "swarm","card images/clash-minion-horde.webp"),
+    Card("Lava Hound", "legendary", "troop", 7, False, True, "air", "win_condition","card images/clash-lava-hound.webp"),
+]
+
+ATTRIBUTES: Dict[str, Callable[[Card], Any]] = {
+    "rarity": lambda c: c.rarity,
+    "type": lambda c: c.card_type,
+    "elixir": lambda c: c.elixir,
+    "melee": lambda c: c.melee,
+    "flying": lambda c: c.flying,
+    "target": lambda c: c.target,
+    "role": lambda c: c.role,
+}
+
+# Value type of each attribute, used to parse question values
+ATTRIBUTE_TYPES: Dict[str, type] = {
+    "rarity": str,
+    "type": str,
+    "elixir": int,
+    "melee": bool,
+    "flying": bool,
+    "target": str,
+    "role": str,
+}
+
+# Attribute name -> Card field, for the columns the table stores
+CATEGORICAL_COLUMNS = {"rarity": "rarity", "type": "card_type", "target": "target", "role": "role"}
+FLAG_COLUMNS = {"melee": "melee", "flying": "flying"}
+
+# ---------- COLUMNAR CARD TABLE ----------
+class CardTable:
+    """Column-oriented card pool.
+
+    elixir is an int8 array, categorical attributes are dictionary-encoded
+    (a list of distinct strings plus one small code per card) and boolean
+    attributes are bitmasks. Indexing returns a Card view built on demand.
+    """
+
+    attribute_names = tuple(ATTRIBUTES)
+
+    def __init__(self, names, image_files, elixir, codes, dictionaries, flags):
+        self.names: List[str] = names
+        self.image_files: List[str] = image_files
+        self.elixir: array = elixir
+        self.codes: Dict[str, array] = codes
+        self.dictionaries: Dict[str, List[str]] = dictionaries
+        self.flags: Dict[str, int] = flags
+        self.full_mask = (1 << len(names)) - 1
+
+    @classmethod
+    def from_cards(cls, cards: List[Card]) -> "CardTable":
+        """Build a table from Card objects"""
+        names = [c.name for c in cards]
+        image_files = [c.image_file for c in cards]
+        elixir = array("b", (c.elixir for c in cards))
+
+        codes, dictionaries = {}, {}
+        for attr, field in CATEGORICAL_COLUMNS.items():
+            lookup: Dict[str, int] = {}
+            column = [lookup.setdefault(getattr(c, field), len(lookup)) for c in cards]
+            codes[attr] = array("B" if len(lookup) <= 256 else "H", column)
+            dictionaries[attr] = list(lookup)
+
+        flags = {
+            attr: mask_from_positions((i for i, c in enumerate(cards) if getattr(c, field)), len(cards))
+            for attr, field in FLAG_COLUMNS.items()
+        }
+        return cls(names, image_files, elixir, codes, dictionaries, flags)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, i) -> Card:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        dicts, codes = self.dictionaries, self.codes
+        return Card(
+            self.names[i],
+            dicts["rarity"][codes["rarity"][i]],
+            dicts["type"][codes["type"][i]],
+            self.elixir[i],
+            bool(self.flags["melee"] >> i & 1),
+            bool(self.flags["flying"] >> i & 1),
+            dicts["target"][codes["target"][i]],
+            dicts["role"][codes["role"][i]],
+            self.image_files[i],
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def column(self, attr: str) -> List[Any]:
+        """Decoded values of one attribute for every card"""
+        if attr == "elixir":
+            return list(self.elixir)
+        if attr in FLAG_COLUMNS:
+            mask = self.flags[attr]
+            return [bool(mask >> i & 1) for i in range(len(self))]
+        dictionary = self.dictionaries[attr]
+        return [dictionary[code] for code in self.codes[attr]]
+
+    def value_masks(self, attr: str) -> Dict[Any, int]:
+        """Distinct value -> mask of the cards holding it"""
+        if attr in FLAG_COLUMNS:
+            mask = self.flags[attr]
+            masks = {True: mask, False: self.full_mask & ~mask}
+            return {value: m for value, m in masks.items() if m}
+        column = self.elixir if attr == "elixir" else self.codes[attr]
+        buckets: Dict[int, List[int]] = {}
+        for i, code in enumerate(column):
+            buckets.setdefault(code, []).append(i)
+        if attr == "elixir":
+            return {v: mask_from_positions(idxs, len(self)) for v, idxs in buckets.items()}
+        dictionary = self.dictionaries[attr]
+        return {dictionary[c]: mask_from_positions(idxs, len(self)) for c, idxs in buckets.items()}
+
+    def cards_in(self, mask: int) -> List[Card]:
+        """Card views for the set bits of mask"""
+        return [self[i] for i in iter_bits(mask)]
+
+
+CARD_TABLE = CardTable.from_cards(CARDS)
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+decision_tree.py
+
+Precomputed question tree for Clash Royale — Guess Who?
+For a fixed card pool the best sequence of questions is static, so it is
+built once (minimising the expected number of questions, memoised over
+candidate bitmasks), written to a compact binary file keyed by a hash of
+the card data, and loaded lazily. Looking up the next question for a
+candidate mask is then a single dict lookup.
+"""
+
+import hashlib
+import os
+import struct
+from typing import Dict, List, Optional, Tuple
+
+from candidate_set import CandidateIndex, popcount
+from hint_solver import Suggestion, split_entropy
+from query import OPERATORS, compile_question
+
+FORMAT_VERSION = 2
+MAGIC = b"CRDT"
+LEAF = 0xFFFF
+DEFAULT_BRANCH = 3
+# Larger pools (e.g. community decks) fall back to the live entropy solver
+MAX_TREE_CARDS = 2000
+
+_HEADER = struct.Struct("<4sBIHI")   # magic, version, cards, questions, nodes
+_QUESTION = struct.Struct("<BBI")     # attribute, operator, value length (UTF-8 bytes)
+_NODE = struct.Struct("<HII")         # question (or LEAF), yes child / card, no child
+
+Question = Tuple[str, str, str]       # (attr, op, value text)
+
+
+def pool_hash(index: CandidateIndex, branch: int = DEFAULT_BRANCH) -> str:
+    """Stable hash of the card data (and build parameters) behind an index"""
+    digest = hashlib.sha256(f"v{FORMAT_VERSION}:b{branch}:{len(index)}".encode())
+    for attr in sorted(index.value_masks):
+        for value, mask in sorted(index.value_masks[attr].items(), key=lambda kv: str(kv[0])):
+            digest.update(f"{attr}={value}:{mask:x};".encode())
+    return digest.hexdigest()[:16]
+
+
+def all_questions(index: CandidateIndex) -> List[Tuple[Question, int]]:
+    """Every '=' question, plus '<=' thresholds for numeric attributes, with its mask"""
+    questions = []
+    for attr, value_masks in index.value_masks.items():
+        for value in value_masks:
+            text = str(value)
+            questions.append(((attr, "=", text), compile_question(attr, "=", text).mask(index)))
+        if all(type(v) is int for v in value_masks):
+            for value in sorted(value_masks)[:-1]:
+                text = str(value)
+                questions.append(((attr, "<=", text), compile_question(attr, "<=", text).mask(index)))
+    return questions
+
+
+class DecisionTree:
+    """Question tree: next question for any candidate mask reached by following it"""
+
+    def __init__(self, index: CandidateIndex, questions: List[Question], nodes: List[Tuple[int, int, int]]):
+        self.index = index
+        self.questions = questions
+        self.nodes = nodes
+        self.question_masks = [compile_question(*q).mask(index) for q in questions]
+        # candidate mask -> node number, rebuilt by replaying the tree
+        self.by_mask: Dict[int, int] = {}
+        stack = [(index.full_mask, 0)] if nodes else []
+        while stack:
+            mask, node = stack.pop()
+            self.by_mask[mask] = node
+            question, yes, no = nodes[node]
+            if question != LEAF:
+                q_mask = self.question_masks[question]
+                stack.append((mask & q_mask, yes))
+                stack.append((mask & ~q_mask, no))
+
+    # ---------- LOOKUP ----------
+    def question_for(self, mask: int) -> Optional[Question]:
+        """The tree's question for this candidate mask, if it lies on the tree"""
+        node = self.by_mask.get(mask)
+        if node is None:
+            return None
+        question = self.nodes[node][0]
+        return None if question == LEAF else self.questions[question]
+
+    def suggest(self, mask: int) -> Optional[Suggestion]:
+        """question_for() packaged as a hint Suggestion"""
+        node = self.by_mask.get(mask)
+        if node is None or self.nodes[node][0] == LEAF:
+            return None
+        question = self.nodes[node][0]
+        attr, op, value = self.questions[question]
+        total = popcount(mask)
+        yes = popcount(mask & self.question_masks[question])
+        return Suggestion(attr, op, value, yes, total, split_entropy(yes, total))
+
+    def expected_depth(self) -> float:
+        """Average number of questions to reach a leaf (uniform secret)"""
+        total = 0
+        stack = [(self.index.full_mask, 0, 0)] if self.nodes else []
+        while stack:
+            mask, node, depth = stack.pop()
+            question, yes, no = self.nodes[node]
+            if question == LEAF:
+                total += depth * popcount(mask)
+            else:
+                q_mask = self.question_masks[question]
+                stack.append((mask & q_mask, yes, depth + 1))
+                stack.append((mask & ~q_mask, no, depth + 1))
+        return total / len(self.index) if len(self.index) else 0.0
+
+    # ---------- BUILD ----------
+    @classmethod
+    def build(cls, index: CandidateIndex, branch: int = DEFAULT_BRANCH) -> "DecisionTree":
+        """Minimum expected-depth tree, considering the `branch` most balanced
+        questions at each node. Subproblems are memoised by candidate mask."""
+        candidates = all_questions(index)
+        memo: Dict[int, Tuple[float, int]] = {}
+
+        def solve(mask: int) -> float:
+            if mask in memo:
+                return memo[mask][0]
+            size = popcount(mask)
+            best = (0.0, -1)
+            if size > 1:
+                splits = []
+                for q, (_, q_mask) in enumerate(candidates):
+                    yes = popcount(mask & q_mask)
+                    if 0 < yes < size:
+                        splits.append((-min(yes, size - yes), q, yes))
+                splits.sort()
+                for _, q, yes in splits[:branch]:
+                    q_mask = candidates[q][1]
+                    cost = 1 + (yes * solve(mask & q_mask) + (size - yes) * solve(mask & ~q_mask)) / size
+                    if best[1] < 0 or cost < best[0]:
+                        best = (cost, q)
+            memo[mask] = best
+            return best[0]
+
+        solve(index.full_mask)
+
+        # Flatten the memo into numbered nodes, keeping only the questions used
+        questions: List[Question] = []
+        question_ids: Dict[int, int] = {}
+        nodes: List[Tuple[int, int, int]] = []
+
+        def emit(mask: int) -> int:
+            node = len(nodes)
+            nodes.append((LEAF, 0, 0))
+            q = memo.get(mask, (0.0, -1))[1]
+            if q < 0:
+                lowest = (mask & -mask).bit_length() - 1
+                nodes[node] = (LEAF, max(lowest, 0), 0)
+                return node
+            if q not in question_ids:
+                question_ids[q] = len(questions)
+                questions.append(candidates[q][0])
+            q_mask = candidates[q][1]
+            yes = emit(mask & q_mask)
+            no = emit(mask & ~q_mask)
+            nodes[node] = (question_ids[q], yes, no)
+            return node
+
+        emit(index.full_mask)
+        return cls(index, questions, nodes)
+
+    # ---------- SERIALISATION ----------
+    def to_bytes(self) -> bytes:
+        attr_names = list(self.index.value_masks)
+        parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, len(self.index), len(self.questions), len(self.nodes))]
+        for attr, op, value in self.questions:
+            encoded = value.encode("utf-8")
+            parts.append(_QUESTION.pack(attr_names.index(attr), OPERATORS.index(op), len(encoded)))
+            parts.append(encoded)
+        parts.extend(_NODE.pack(*node) for node in self.nodes)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, index: CandidateIndex, data: bytes) -> "DecisionTree":
+        attr_names = list(index.value_masks)
+        magic, version, cards, n_questions, n_nodes = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != FORMAT_VERSION or cards != len(index):
+            raise ValueError("Decision tree file does not match this card pool")
+        offset = _HEADER.size
+        questions = []
+        for _ in range(n_questions):
+            attr, op, length = _QUESTION.unpack_from(data, offset)
+            offset += _QUESTION.size
+            value = data[offset:offset + length].decode("utf-8")
+            offset += length
+            questions.append((attr_names[attr], OPERATORS[op], value))
+        nodes = [tuple(n) for n in _NODE.iter_unpack(data[offset:offset + n_nodes * _NODE.size])]
+        return cls(index, questions, nodes)
+
+
+def cache_path(index: CandidateIndex, cache_dir: str = "data", branch: int = DEFAULT_BRANCH) -> str:
+    return os.path.join(cache_dir, f"decision_tree_{pool_hash(index, branch)}.bin")
+
+
+def load_decision_tree(index: CandidateIndex, cache_dir: str = "data",
+                       branch: int = DEFAULT_BRANCH) -> DecisionTree:
+    """Load the cached tree for this card pool, building and saving it if missing"""
+    path = cache_path(index, cache_dir, branch)
+    try:
+        with open(path, "rb") as f:
+            return DecisionTree.from_bytes(index, f.read())
+    except (OSError, ValueError, struct.error):
+        pass
+
+    tree = DecisionTree.build(index, branch)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(tree.to_bytes())
+        os.replace(tmp_path, path)
+    except (OSError, struct.error) as e:
+        print(f"Error saving decision tree: {e}")
+    return tree
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+deck_loader.py
+
+Card pool files for Clash Royale — Guess Who?
+Decks are written by hand as JSON or CSV, validated once, and compiled to
+a compact binary file: a fixed-width record per card plus one string
+table. Loading memory-maps the binary file and slices each column straight
+out of the records into a CardTable, so even a 50k-card community pool
+loads in milliseconds without creating a Card object per card.
+
+Binary layout (little-endian):
+    header      magic "CRDK", version, record size, card count,
+                string table size, source stamp
+    dict sizes  one u16 per categorical attribute (CATEGORICAL_COLUMNS order)
+    records     count x (elixir i8, rarity u8, type u8, target u8, role u8, flags u8)
+    strings     UTF-8, NUL-separated: names, image files, then the
+                dictionary values of each categorical attribute
+"""
+
+import csv
+import json
+import mmap
+import os
+import struct
+from array import array
+from typing import Dict, List, Optional
+
+from cards import CardTable, CATEGORICAL_COLUMNS, FLAG_COLUMNS
+from query import TRUE_WORDS, FALSE_WORDS
+
+FORMAT_VERSION = 1
+MAGIC = b"CRDK"
+DECK_EXTENSION = ".crdk"
+DEFAULT_CACHE_DIR = os.path.join("data", "decks")
+
+_HEADER = struct.Struct("<4sHHIIQ")   # magic, version, record size, count, strings size, stamp
+_RECORD = struct.Struct("<bBBBBB")    # elixir, rarity, type, target, role, flags
+_FLAG_BITS = {attr: 1 << i for i, attr in enumerate(FLAG_COLUMNS)}
+_CATEGORICAL = tuple(CATEGORICAL_COLUMNS)
+
+# Column name in a source file -> attribute (accepts Card field names too)
+_FIELD_ALIASES = {"card_type": "type", "image": "image_file"}
+
+
+class DeckError(ValueError):
+    """A deck file that is malformed or fails validation"""
+
+
+# ---------- SOURCE FILES ----------
+def source_stamp(path: str) -> int:
+    """Identity of a source file's current contents (mtime and size)"""
+    st = os.stat(path)
+    return (st.st_mtime_ns ^ (st.st_size << 1)) & 0xFFFFFFFFFFFFFFFF
+
+
+def read_source(path: str) -> List[dict]:
+    """Raw card rows from a JSON (list, or {"cards": [...]}) or CSV file"""
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        if ext == ".json":
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            rows = data.get("cards") if isinstance(data, dict) else data
+            if not isinstance(rows, list):
+                raise DeckError(f"{path}: expected a list of cards")
+            return rows
+        if ext == ".csv":
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                return list(csv.DictReader(f))
+    except (OSError, ValueError, csv.Error) as e:
+        if isinstance(e, DeckError):
+            raise
+        raise DeckError(f"{path}: {e}") from None
+    raise DeckError(f"{path}: unsupported deck format '{ext}' (use .json or .csv)")
+
+
+def _parse_bool(value, field: str) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in TRUE_WORDS:
+        return True
+    if text in FALSE_WORDS:
+        return False
+    raise ValueError(f"{field} must be true or false, not '{value}'")
+
+
+def _text(value, field: str) -> str:
+    text = str(value if value is not None else "").strip()
+    if "\0" in text:
+        raise ValueError(f"{field} contains a NUL character")
+    return text
+
+
+def validate(rows: List[dict]) -> dict:
+    """Check every row and encode the pool as columns; raises DeckError listing the problems"""
+    names, images = [], []
+    elixir = array("b")
+    dictionaries: Dict[str, Dict[str, int]] = {attr: {} for attr in _CATEGORICAL}
+    codes = {attr: array("B") for attr in _CATEGORICAL}
+    flags = bytearray()
+    seen = set()
+    errors = []
+
+    for number, raw in enumerate(rows, 1):
+        try:
+            if not isinstance(raw, dict):
+                raise ValueError("not an object")
+            row = {_FIELD_ALIASES.get(k.strip().lower(), k.strip().lower()): v for k, v in raw.items() if k}
+            name = _text(row.get("name"), "name")
+            if not name:
+                raise ValueError("name is required")
+            if name.lower() in seen:
+                raise ValueError(f"duplicate card name '{name}'")
+            try:
+                cost = int(str(row.get("elixir", "")).strip())
+            except ValueError:
+                raise ValueError(f"elixir must be a whole number, not '{row.get('elixir')}'") from None
+            if not 0 <= cost <= 127:
+                raise ValueError(f"elixir {cost} is out of range")
+            values = {}
+            for attr in _CATEGORICAL:
+                value = _text(row.get(attr), attr).lower()
+                if not value:
+                    raise ValueError(f"{attr} is required")
+                values[attr] = value
+            bits = 0
+            for attr, bit in _FLAG_BITS.items():
+                # Missing column or blank cell (common in hand-edited CSV) means False
+                if _parse_bool(row.get(attr) or False, attr):
+                    bits |= bit
+            image = _text(row.get("image_file"), "image_file")
+        except ValueError as e:
+            errors.append(f"card {number}: {e}")
+            continue
+
+        for attr, value in values.items():
+            lookup = dictionaries[attr]
+            code = lookup.setdefault(value, len(lookup))
+            if code > 255:
+                raise DeckError(f"card {number}: more than 256 distinct {attr} values")
+            codes[attr].append(code)
+        seen.add(name.lower())
+        names.append(name)
+        images.append(image)
+        elixir.append(cost)
+        flags.append(bits)
+
+    if errors:
+        shown = "\n".join(errors[:10])
+        more = f"\n... and {len(errors) - 10} more" if len(errors) > 10 else ""
+        raise DeckError(f"{len(errors)} invalid card(s):\n{shown}{more}")
+    if not names:
+        raise DeckError("deck has no cards")
+    return {"names": names, "images": images, "elixir": elixir, "codes": codes,
+            "dictionaries": {attr: list(lookup) for attr, lookup in dictionaries.items()},
+            "flags": bytes(flags)}
+
+
+# ---------- BINARY FORMAT ----------
+def write_deck(path: str, columns: dict, stamp: int = 0):
+    """Write validated columns as a binary deck (atomically)"""
+    count = len(columns["names"])
+    strings = list(columns["names"]) + [image or "" for image in columns["images"]]
+    for attr in _CATEGORICAL:
+        strings.extend(columns["dictionaries"][attr])
+    blob = "\0".join(strings).encode("utf-8")
+
+    records = bytearray(count * _RECORD.size)
+    records[0::_RECORD.size] = columns["elixir"].tobytes()
+    for j, attr in enumerate(_CATEGORICAL, 1):
+        records[j::_RECORD.size] = columns["codes"][attr].tobytes()
+    records[len(_CATEGORICAL) + 1::_RECORD.size] = columns["flags"]
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, _RECORD.size, count, len(blob), stamp))
+        f.write(struct.pack(f"<{len(_CATEGORICAL)}H", *(len(columns["dictionaries"][a]) for a in _CATEGORICAL)))
+        f.write(records)
+        f.write(blob)
+    os.replace(tmp_path, path)
+
+
+def read_stamp(path: str) -> Optional[int]:
+    """Source stamp stored in a binary deck, or None if unreadable"""
+    try:
+        with open(path, "rb") as f:
+            magic, version, _, _, _, stamp = _HEADER.unpack(f.read(_HEADER.size))
+    except (OSError, struct.error):
+        return None
+    return stamp if magic == MAGIC and version == FORMAT_VERSION else None
+
+
+def _bit_mask(column: bytes, bit: int) -> int:
+    """Bitmask of the records whose flag byte has `bit` set"""
+    if not column:
+        return 0
+    table = bytes(0x31 if v & bit else 0x30 for v in range(256))   # -> b"1"/b"0"
+    return int(column.translate(table)[::-1], 2)
+
+
+def read_deck(path: str) -> CardTable:
+    """Memory-map a binary deck and build a CardTable from its columns"""
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, version, record_size, count, strings_size, _ = _HEADER.unpack_from(mm, 0)
+            if magic != MAGIC or version != FORMAT_VERSION or record_size != _RECORD.size:
+                raise DeckError(f"{path}: not a version {FORMAT_VERSION} deck file")
+            pos = _HEADER.size
+            sizes = struct.unpack_from(f"<{len(_CATEGORICAL)}H", mm, pos)
+            start = pos + 2 * len(_CATEGORICAL)
+            end = start + count * record_size
+            if end + strings_size != len(mm):
+                raise DeckError(f"{path}: truncated or corrupt deck file")
+
+            # Each column is a strided slice of the record array
+            elixir = array("b", mm[start:end:record_size])
+            codes = {attr: array("B", mm[start + j:end:record_size]) for j, attr in enumerate(_CATEGORICAL, 1)}
+            flag_column = mm[start + len(_CATEGORICAL) + 1:end:record_size]
+            strings = mm[end:end + strings_size].decode("utf-8").split("\0")
+    except (OSError, ValueError, struct.error) as e:
+        if isinstance(e, DeckError):
+            raise
+        raise DeckError(f"{path}: {e}") from None
+
+    if len(strings) != 2 * count + sum(sizes):
+        raise DeckError(f"{path}: string table does not match the header")
+    names = strings[:count]
+    image_files = [image or None for image in strings[count:2 * count]]
+    dictionaries, pos = {}, 2 * count
+    for attr, size in zip(_CATEGORICAL, sizes):
+        dictionaries[attr] = strings[pos:pos + size]
+        pos += size
+    flags = {attr: _bit_mask(flag_column, bit) for attr, bit in _FLAG_BITS.items()}
+    return CardTable(names, image_files, elixir, codes, dictionaries, flags)
+
+
+# ---------- LOADING ----------
+def compile_deck(source: str, target: str = None) -> str:
+    """Validate a JSON/CSV deck and write its binary form; returns the binary path"""
+    if target is None:
+        target = os.path.join(DEFAULT_CACHE_DIR, os.path.splitext(os.path.basename(source))[0] + DECK_EXTENSION)
+    stamp = source_stamp(source)
+    try:
+        columns = validate(read_source(source))
+    except DeckError as e:
+        raise DeckError(f"{source}: {e}") from None
+    write_deck(target, columns, stamp)
+    return target
+
+
+def load_deck(path: str, cache_dir: str = DEFAULT_CACHE_DIR) -> CardTable:
+    """Load a deck file, recompiling a JSON/CSV source only when it has changed"""
+    if path.lower().endswith(DECK_EXTENSION):
+        return read_deck(path)
+    if not os.path.exists(path):
+        raise DeckError(f"{path}: no such deck file")
+    target = os.path.join(cache_dir, os.path.splitext(os.path.basename(path))[0] + DECK_EXTENSION)
+    if read_stamp(target) != source_stamp(path):
+        compile_deck(path, target)
+    return read_deck(target)
+
+
+def export_table(table: CardTable, path: str):
+    """Write an existing CardTable (e.g. the built-in pool) as a binary deck"""
+    columns = {
+        "names": table.names,
+        "images": table.image_files,
+        "elixir": table.elixir,
+        "codes": {attr: array("B", table.codes[attr]) for attr in _CATEGORICAL},
+        "dictionaries": table.dictionaries,
+        "flags": bytes(sum(bit for attr, bit in _FLAG_BITS.items() if table.flags[attr] >> i & 1)
+                       for i in range(len(table))),
+    }
+    write_deck(path, columns)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Validate and compile a deck file")
+    parser.add_argument("source", help="deck in .json or .csv format")
+    parser.add_argument("-o", "--output", help=f"binary deck to write (default: {DEFAULT_CACHE_DIR}/<name>{DECK_EXTENSION})")
+    args = parser.parse_args()
+    try:
+        target = compile_deck(args.source, args.output)
+    except DeckError as e:
+        raise SystemExit(f"Invalid deck: {e}")
+    table = read_deck(target)
+    print(f"Compiled {len(table)} cards to {target}")
+
+
+if __name__ == "__main__":
+    main()
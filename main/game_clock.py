@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+game_clock.py
+
+Elapsed-time display for Clash Royale — Guess Who?
+Refreshes a label only while it is actually on screen, pauses when it is
+hidden, and cancels its pending `after` callback when the widget is
+destroyed, so a torn-down game screen leaves no timer running behind it.
+"""
+
+from typing import Callable
+
+DEFAULT_INTERVAL_MS = 100
+
+
+class ClockDisplay:
+    """Drives a StringVar from an elapsed-time source at a fixed refresh rate"""
+
+    def __init__(self, widget, variable, elapsed: Callable[[], float], running: Callable[[], bool],
+                 interval_ms: int = DEFAULT_INTERVAL_MS, fmt: str = "Time: {:.1f}s"):
+        self.widget = widget
+        self.variable = variable
+        self.elapsed = elapsed
+        self.running = running
+        self.interval_ms = interval_ms
+        self.fmt = fmt
+        self.after_id = None
+        self.destroyed = False
+
+        widget.bind("<Map>", lambda e: self.resume(), add="+")
+        widget.bind("<Visibility>", lambda e: self.resume(), add="+")
+        widget.bind("<Unmap>", lambda e: self.pause(), add="+")
+        widget.bind("<Destroy>", self._on_destroy, add="+")
+        self.refresh()
+
+    def refresh(self):
+        """Show the current elapsed time once"""
+        if not self.destroyed:
+            self.variable.set(self.fmt.format(self.elapsed()))
+
+    def resume(self):
+        """(Re)start ticking if the game is running and nothing is scheduled"""
+        if self.after_id is None and not self.destroyed and self.running():
+            self._tick()
+
+    def pause(self):
+        """Stop ticking until the widget is shown again"""
+        if self.after_id is not None:
+            try:
+                self.widget.after_cancel(self.after_id)
+            except Exception:
+                pass
+            self.after_id = None
+
+    def stop(self):
+        """Show the final time and stop ticking (e.g. when the game is won)"""
+        self.pause()
+        self.refresh()
+
+    def _tick(self):
+        self.after_id = None
+        self.refresh()
+        if not self.running():
+            return
+        # Hidden (e.g. window iconified): wait for <Map>/<Visibility> instead of polling
+        if not self.widget.winfo_viewable():
+            return
+        self.after_id = self.widget.after(self.interval_ms, self._tick)
+
+    def _on_destroy(self, event):
+        if event.widget is self.widget:
+            self.pause()
+            self.destroyed = True
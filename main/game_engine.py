@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+game_engine.py
+
+Headless game core for Clash Royale — Guess Who?
+Owns the secret card, the candidates, timing and scoring without touching
+Tkinter, so games can be played by the UI, by bots or in batch simulation.
+"""
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+from candidate_set import CandidateIndex, CandidateSet
+from cards import Card, CARD_TABLE
+from decision_tree import DecisionTree, MAX_TREE_CARDS, load_decision_tree
+from hint_solver import HintSolver, Suggestion
+from query import CompiledQuery, compile_expression, compile_question
+from value_index import ValueIndex
+
+CARD_INDEX = CandidateIndex.from_table(CARD_TABLE)
+
+# Scoring: 1000 points, minus 10 per second, capped at a 900 point penalty
+BASE_SCORE = 1000
+PENALTY_PER_SECOND = 10
+MAX_TIME_PENALTY = 900
+MIN_SCORE = 100
+
+
+def score_for(elapsed: float) -> int:
+    """Points awarded for finding the secret card after elapsed seconds"""
+    time_penalty = min(elapsed * PENALTY_PER_SECOND, MAX_TIME_PENALTY)
+    return int(max(BASE_SCORE - time_penalty, MIN_SCORE))
+
+
+@dataclass
+class AskResult:
+    """Outcome of a question"""
+    query: CompiledQuery
+    answer: bool
+    removed_mask: int
+
+    def removed(self, index: CandidateIndex) -> List[Card]:
+        return index.cards_in(self.removed_mask)
+
+
+@dataclass
+class GuessResult:
+    """Outcome of a guess; elapsed and score are only set when correct"""
+    card: Card
+    correct: bool
+    removed_mask: int = 0
+    elapsed: Optional[float] = None
+    score: Optional[int] = None
+
+
+class GameEngine:
+    """One game of Guess Who: secret, candidates, timing and scoring"""
+
+    def __init__(self, index: CandidateIndex = None, rng: random.Random = None,
+                 clock: Callable[[], float] = time.perf_counter, track_hints: bool = True,
+                 decision_tree_dir: str = None):
+        self.index = index or CARD_INDEX
+        self.rng = rng or random.Random()
+        self.clock = clock
+        self.candidate_set = CandidateSet(self.index)
+        # Live attribute -> value -> bitset view for question-bar suggestions
+        self.value_index = ValueIndex(self.index, self.candidate_set)
+        # Histogram bookkeeping is only worth paying for when hints are used
+        self.hint_solver = HintSolver(self.index) if track_hints else None
+        # Precomputed question tree, loaded (or built) on the first hint
+        self.decision_tree_dir = decision_tree_dir
+        self.decision_tree: Optional[DecisionTree] = None
+        self.new_game()
+
+    # ---------- LIFECYCLE ----------
+    def new_game(self, secret: Card = None):
+        """Pick a new secret card and put every card back in play"""
+        if secret is None:
+            secret = self.index.cards[self.rng.randrange(len(self.index))]
+        self.secret = secret
+        self.secret_bit = self.index.bit(secret)
+        self.reset()
+
+    def reset(self):
+        """Restart the round with the same secret card"""
+        self.candidate_set.reset()
+        if self.hint_solver:
+            self.hint_solver.reset()
+        self.questions_asked = 0
+        self.guesses_made = 0
+        self.start_time = self.clock()
+        self.end_time = None
+
+    @property
+    def finished(self) -> bool:
+        return self.end_time is not None
+
+    @property
+    def in_progress(self) -> bool:
+        """Questions or guesses have been made and the round is not over yet"""
+        return not self.finished and bool(self.questions_asked or self.guesses_made)
+
+    def give_up(self) -> float:
+        """End the round without a win; returns the elapsed seconds"""
+        self.end_time = self.clock()
+        return round(self.end_time - self.start_time, 2)
+
+    @property
+    def elapsed(self) -> float:
+        return (self.end_time or self.clock()) - self.start_time
+
+    @property
+    def candidates(self) -> List[Card]:
+        return self.candidate_set.cards()
+
+    @property
+    def remaining(self) -> int:
+        return len(self.candidate_set)
+
+    # ---------- PLAY ----------
+    def ask(self, attr: str, op: str, value: Any) -> AskResult:
+        """Answer a question about the secret card and eliminate candidates.
+
+        Raises QueryError if the question is invalid.
+        """
+        query = compile_question(attr, op, str(value))
+        return self.ask_query(query)
+
+    def ask_expression(self, text: str) -> AskResult:
+        """Answer a compound question such as "elixir in 3..5 and not flying".
+
+        Raises QueryError if the expression is invalid.
+        """
+        return self.ask_query(compile_expression(text))
+
+    def ask_query(self, query: CompiledQuery) -> AskResult:
+        """Answer an already compiled question"""
+        matches = query.mask(self.index)
+        answer = bool(matches & self.secret_bit)
+        removed_mask = self.candidate_set.answer(matches, answer)
+        if self.hint_solver:
+            self.hint_solver.remove(removed_mask)
+        self.questions_asked += 1
+        return AskResult(query, answer, removed_mask)
+
+    def guess(self, card: Card) -> GuessResult:
+        """Guess a card; a wrong guess eliminates it, a right one ends the game"""
+        self.guesses_made += 1
+        if card.name == self.secret.name:
+            self.end_time = self.clock()
+            elapsed = round(self.end_time - self.start_time, 2)
+            return GuessResult(card, True, elapsed=elapsed, score=score_for(elapsed))
+
+        removed_mask = self.candidate_set.discard(card)
+        if self.hint_solver:
+            self.hint_solver.remove(removed_mask)
+        return GuessResult(card, False, removed_mask=removed_mask)
+
+    def hint(self) -> Optional[Suggestion]:
+        """Most informative question for the remaining candidates.
+
+        Uses the precomputed decision tree while play stays on it, and the
+        entropy solver otherwise.
+        """
+        if self.decision_tree_dir is not None and len(self.index) <= MAX_TREE_CARDS:
+            if self.decision_tree is None:
+                self.decision_tree = load_decision_tree(self.index, self.decision_tree_dir)
+            suggestion = self.decision_tree.suggest(self.candidate_set.mask)
+            if suggestion is not None:
+                return suggestion
+        if self.hint_solver is None:
+            self.hint_solver = HintSolver(self.index, self.candidate_set.mask)
+        return self.hint_solver.best_question()
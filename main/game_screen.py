@@ -0,0 +1,628 @@
+#!/usr/bin/env python3
+"""
+game_screen.py
+
+Game screen for Clash Royale — Guess Who? (Pro)
+Imported when the first game starts, so the engine, deck loader, question
+compiler, card grid and image pipeline stay off the path to the first
+menu frame.
+"""
+
+from typing import List
+import tkinter as tk
+from tkinter import ttk, messagebox, simpledialog, filedialog
+import ttkbootstrap as tb
+from services import get_services, SETTINGS_CHANGED
+from keybindings import KeyBindings
+from modals import ModalCache, show_leaderboard
+from cards import Card, ATTRIBUTES
+from candidate_set import CandidateIndex
+from deck_loader import DeckError, load_deck
+from query import QueryError
+from game_engine import GameEngine, CARD_INDEX
+from card_grid import CardGrid
+from game_clock import ClockDisplay, DEFAULT_INTERVAL_MS
+from card_images import CardImagePipeline, ImageVariants, THUMB_SIZE
+from thumbnail_cache import ThumbnailCache
+
+THUMBNAIL_CACHE = ThumbnailCache()
+
+GAME_TITLE = "Clash Royale — Guess Who? (Pro)"
+VALUE_PLACEHOLDER = "e.g. rare, 4, True"
+EXPRESSION_PLACEHOLDER = "e.g. elixir in 3..5 and not flying"
+
+MAX_LEADERS = 10
+
+# ---------- ENHANCED GAME CLASS ----------
+class GuessWhoPro:
+    def __init__(self, root: tb.Window, return_to_menu_callback=None, timer_interval_ms=DEFAULT_INTERVAL_MS,
+                 services=None, parent=None):
+        self.root = root
+        self.frame = parent or root   # container the game screen is built into
+        self.return_to_menu_callback = return_to_menu_callback
+        self.timer_interval_ms = timer_interval_ms
+        self.root.title(GAME_TITLE)
+        self.style = tb.Style(theme="flatly")
+        # All game rules live in the headless engine; this class is its UI
+        self.services = services or get_services()
+        self.engine = GameEngine(self._startup_index(), decision_tree_dir="data")
+        self.image_variants = ImageVariants(THUMB_SIZE, cache=THUMBNAIL_CACHE)
+        self.image_pipeline = CardImagePipeline(self.root, THUMB_SIZE, cache=THUMBNAIL_CACHE)
+
+        # Enhanced leaderboard integration (shared with the menu)
+        self.leaderboard_manager = self.services.leaderboard
+
+        self.create_ui()
+
+    def _startup_index(self) -> CandidateIndex:
+        """The deck chosen last time (memory-mapped), or the built-in cards"""
+        deck_file = self.services.settings.settings.get("deck_file")
+        if deck_file:
+            try:
+                return CandidateIndex.from_table(load_deck(deck_file))
+            except DeckError as e:
+                print(f"Could not load deck, using built-in cards: {e}")
+        return CARD_INDEX
+
+    @property
+    def secret(self) -> Card:
+        return self.engine.secret
+
+    @property
+    def candidates(self) -> List[Card]:
+        """Cards still in play, in deck order"""
+        return self.engine.candidates
+
+    # ---------- UI ----------
+    def create_ui(self):
+        # Top bar with enhanced styling
+        top = ttk.Frame(self.frame, padding=(12,12))
+        top.pack(fill="x", padx=8, pady=6)
+        
+        title_label = ttk.Label(
+            top, 
+            text="Clash Royale — Guess Who?", 
+            font=("Orbitron", 18, "bold"),
+            foreground="#e74c3c"
+        )
+        title_label.pack(side="left")
+        
+        right = ttk.Frame(top)
+        right.pack(side="right")
+        
+        # Enhanced buttons with better styling
+        ttk.Button(
+            right, 
+            text="Main Menu", 
+            command=self.return_to_menu,
+            bootstyle="secondary-outline"
+        ).pack(side="left", padx=4)
+        
+        ttk.Button(
+            right, 
+            text="New Game", 
+            command=self.new_game,
+            bootstyle="success-outline"
+        ).pack(side="left", padx=4)
+        
+        ttk.Button(
+            right, 
+            text="Give Up", 
+            command=self.give_up,
+            bootstyle="danger-outline"
+        ).pack(side="left", padx=4)
+        
+        ttk.Button(
+            right, 
+            text="Show All", 
+            command=self.reset_visuals,
+            bootstyle="info-outline"
+        ).pack(side="left", padx=4)
+        
+        ttk.Button(
+            right, 
+            text="Leaderboard", 
+            command=self.show_leaderboard_ui,
+            bootstyle="warning-outline"
+        ).pack(side="left", padx=4)
+
+        ttk.Button(
+            right, 
+            text="Load Deck", 
+            command=self.load_deck,
+            bootstyle="primary-outline"
+        ).pack(side="left", padx=4)
+
+        # Enhanced controls with better layout
+        control = ttk.Frame(self.frame, padding=(12,6))
+        control.pack(fill="x", padx=8)
+        
+        # Question building section
+        question_frame = ttk.LabelFrame(control, text="Ask a Question", padding=10)
+        question_frame.pack(fill="x", pady=5)
+        
+        controls_inner = ttk.Frame(question_frame)
+        controls_inner.pack(fill="x")
+        
+        property_label = ttk.Label(controls_inner, text="Property:")
+        property_label.grid(row=0, column=0, sticky="w", padx=(0,5))
+        self.attr_var = tk.StringVar(value="rarity")
+        attr_combo = ttk.Combobox(
+            controls_inner, 
+            textvariable=self.attr_var, 
+            values=list(ATTRIBUTES.keys()), 
+            state="readonly", 
+            width=14
+        )
+        attr_combo.grid(row=0, column=1, padx=(0,8))
+        
+        operator_label = ttk.Label(controls_inner, text="Operator:")
+        operator_label.grid(row=0, column=2, sticky="w", padx=(0,5))
+        self.op_var = tk.StringVar(value="=")
+        op_combo = ttk.Combobox(
+            controls_inner, 
+            textvariable=self.op_var, 
+            values=["=", ":", "<", "<=", ">", ">="], 
+            width=4, 
+            state="readonly"
+        )
+        op_combo.grid(row=0, column=3, padx=(0,8))
+        
+        self.value_label = ttk.Label(controls_inner, text="Value:")
+        self.value_label.grid(row=0, column=4, sticky="w", padx=(0,5))
+        self.value_var = tk.StringVar()
+        # Editable combobox: free text, with the remaining values offered as completions
+        self.value_entry = ttk.Combobox(
+            controls_inner,
+            textvariable=self.value_var,
+            width=20,
+            postcommand=self.update_value_completions
+        )
+        self.value_entry.grid(row=0, column=5, padx=(0,8))
+        self.value_entry.insert(0, VALUE_PLACEHOLDER)
+        # Hidden in expression mode, where the entry takes a whole question
+        self.simple_question_widgets = [property_label, attr_combo, operator_label, op_combo]
+        
+        # Add placeholder text handling
+        self.value_entry.bind('<FocusIn>', self.clear_placeholder)
+        self.value_entry.bind('<FocusOut>', self.add_placeholder)
+        
+        button_frame = ttk.Frame(controls_inner)
+        button_frame.grid(row=0, column=6, padx=(10,0))
+        
+        ttk.Button(
+            button_frame, 
+            text="Ask", 
+            command=self.ask,
+            bootstyle="primary"
+        ).pack(side="left", padx=2)
+        
+        ttk.Button(
+            button_frame, 
+            text="Hint", 
+            command=self.hint,
+            bootstyle="info"
+        ).pack(side="left", padx=2)
+
+        self.expression_mode = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            controls_inner,
+            text="Expression",
+            variable=self.expression_mode,
+            command=self.toggle_expression_mode,
+            bootstyle="round-toggle"
+        ).grid(row=0, column=7, padx=(10,0))
+
+        # Live "would eliminate N cards" preview, refreshed on every keystroke
+        self.preview_var = tk.StringVar()
+        ttk.Label(
+            controls_inner,
+            textvariable=self.preview_var,
+            foreground="#6c757d"
+        ).grid(row=1, column=0, columnspan=8, sticky="w", pady=(6,0))
+        for var in (self.value_var, self.attr_var, self.op_var, self.expression_mode):
+            var.trace_add("write", lambda *_: self.update_preview())
+
+        # Enhanced status bar with more information
+        status_frame = ttk.Frame(self.frame, padding=(12,6))
+        status_frame.pack(fill="x", padx=8)
+        
+        self.status_var = tk.StringVar()
+        self.time_var = tk.StringVar()
+        self.update_status()
+        
+        ttk.Label(status_frame, textvariable=self.status_var, anchor="w").pack(side="left")
+        time_label = ttk.Label(status_frame, textvariable=self.time_var, anchor="e")
+        time_label.pack(side="right")
+        
+        # Elapsed-time display: ticks only while visible, cancelled on destroy
+        self.clock = ClockDisplay(
+            time_label,
+            self.time_var,
+            elapsed=lambda: self.engine.elapsed,
+            running=lambda: not self.engine.finished,
+            interval_ms=self.timer_interval_ms
+        )
+
+        # Scrollable card grid, drawn on the canvas and virtualized
+        self.canvas_frame = ttk.Frame(self.frame)
+        self.canvas_frame.pack(fill="both", expand=True, padx=12, pady=8)
+        self.canvas = tk.Canvas(self.canvas_frame, bg='#f8f9fa', highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self.canvas_frame, orient="vertical", command=self.canvas.yview)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        # Bind mousewheel to canvas
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))
+        # Stop background image work when the game screen is torn down
+        self.canvas_frame.bind("<Destroy>", lambda e: self.image_pipeline.cancel())
+
+        self.load_card_grid()
+        self.setup_keybinds()
+
+    def setup_keybinds(self, **_):
+        """Game-screen shortcuts, layered over the menu's in the shared dispatcher"""
+        settings = self.services.settings
+        actions = {
+            "submit": self.ask,
+            "hint": self.hint,
+            "guess": self.guess_last,
+            "new_game": self.new_game,
+        }
+        self.keybindings = KeyBindings.for_window(self.root)
+        self.keybindings.set_bindings(
+            "game", {action: settings.get_keybind(action) for action in actions}, actions)
+        if not hasattr(self, "_unsubscribe_settings"):
+            self.keybindings.activate("game", owner=self.canvas_frame)
+            # Pick up keys rebound in the settings dialog
+            self._unsubscribe_settings = self.services.events.subscribe(SETTINGS_CHANGED, self.setup_keybinds)
+            self.canvas_frame.bind("<Destroy>", lambda e: self._unsubscribe_settings(), add="+")
+
+    def on_show(self):
+        """Screen shown (the game screen is built once and reused)"""
+        self.root.title(GAME_TITLE)
+        self.keybindings.activate("game")
+
+    def on_hide(self):
+        ModalCache.for_window(self.root).hide()
+        self.keybindings.deactivate("game")
+
+    def _on_mousewheel(self, event):
+        """Handle mousewheel scrolling"""
+        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+
+    def placeholder(self) -> str:
+        return EXPRESSION_PLACEHOLDER if self.expression_mode.get() else VALUE_PLACEHOLDER
+
+    def clear_placeholder(self, event):
+        """Clear placeholder text when entry is focused"""
+        if self.value_entry.get() in (VALUE_PLACEHOLDER, EXPRESSION_PLACEHOLDER):
+            self.value_entry.delete(0, tk.END)
+
+    def add_placeholder(self, event):
+        """Add placeholder text when entry loses focus and is empty"""
+        if not self.value_entry.get():
+            self.value_entry.insert(0, self.placeholder())
+
+    def question_text(self) -> str:
+        """What the player has typed, ignoring the placeholder"""
+        text = self.value_var.get()
+        return "" if text in (VALUE_PLACEHOLDER, EXPRESSION_PLACEHOLDER) else text
+
+    def update_value_completions(self):
+        """Offer the values still held by remaining cards, filtered by what is typed"""
+        if self.expression_mode.get():
+            self.value_entry.configure(values=[])
+            return
+        completions = self.engine.value_index.completions(self.attr_var.get(), self.question_text())
+        if not completions:
+            # Nothing matches the typed prefix; offer every remaining value instead
+            completions = self.engine.value_index.completions(self.attr_var.get())
+        self.value_entry.configure(values=[text for text, _ in completions])
+
+    def update_preview(self):
+        """Show how the question being typed would split the remaining cards"""
+        preview = self.engine.value_index.preview(
+            self.attr_var.get(), self.op_var.get(), self.question_text(),
+            expression=self.expression_mode.get()
+        )
+        self.preview_var.set(preview or "")
+
+    def toggle_expression_mode(self):
+        """Switch the question bar between property/operator/value and a typed expression"""
+        expression = self.expression_mode.get()
+        for widget in self.simple_question_widgets:
+            if expression:
+                widget.grid_remove()
+            else:
+                widget.grid()
+        self.value_label.configure(text="Question:" if expression else "Value:")
+        self.value_entry.configure(width=42 if expression else 20)
+        self.value_entry.delete(0, tk.END)
+        self.value_entry.insert(0, self.placeholder())
+
+    def update_timer(self):
+        """Refresh the elapsed time display and keep it ticking while the game runs"""
+        self.clock.refresh()
+        self.clock.resume()
+
+    def load_deck(self, path: str = None):
+        """Hot-swap the card pool from a deck file (.json, .csv or compiled .crdk)"""
+        if path is None:
+            path = filedialog.askopenfilename(
+                title="Load Deck",
+                filetypes=[("Deck files", "*.json *.csv *.crdk"), ("All files", "*.*")]
+            )
+            if not path:
+                return
+        try:
+            table = load_deck(path)
+        except DeckError as e:
+            messagebox.showerror("Invalid Deck", str(e))
+            return
+
+        self.abandon_round()
+        self.engine = GameEngine(CandidateIndex.from_table(table), decision_tree_dir="data")
+        # Art is cached by card name; the new deck may reuse a name with different art
+        self.image_pipeline.clear()
+        self.image_variants.clear()
+        self.card_grid.set_cards(table)
+        self.update_timer()
+        self.update_status()
+        # Remember the choice; the compiled deck is memory-mapped next startup
+        settings = self.services.settings
+        settings.settings["deck_file"] = path
+        settings.save_settings()
+        messagebox.showinfo("Deck Loaded", f"Loaded {len(table)} cards. A new secret card has been chosen!")
+
+    # ---------- ENHANCED LOAD CARDS ----------
+    def load_card_grid(self):
+        """Create the virtualized grid; cards are drawn as they scroll into view"""
+        self.canvas.delete("all")
+        self.card_grid = CardGrid(
+            self.canvas,
+            self.engine.index.cards,
+            image_for=self._card_image,
+            on_guess=self.guess,
+            scrollbar=self.scrollbar
+        )
+
+    def _card_image(self, card: Card, state: str):
+        """Image for a card in the given grid state, queueing decode if needed"""
+        if not self.image_variants.has(card):
+            self.image_pipeline.load([card], self._on_card_image_ready)
+            return self.image_pipeline.placeholder
+        variant = {"eliminated": "faded", "winner": "winner"}.get(state, "normal")
+        return self.image_variants.photo(card, variant)
+
+    def _on_card_image_ready(self, card: Card, photo):
+        """Swap a card's placeholder for its decoded image (runs on the Tk thread)"""
+        self.image_variants.set_base(card, self.image_pipeline.sprite(card), photo)
+        self.card_grid.refresh(card)
+
+    # ---------- ENHANCED GAME LOGIC ----------
+    def ask(self):
+        val = self.value_var.get().strip()
+        if not val or val in (VALUE_PLACEHOLDER, EXPRESSION_PLACEHOLDER): 
+            messagebox.showwarning("Empty Value", "Please enter a value to compare against")
+            return
+            
+        attr = self.attr_var.get()
+        op = self.op_var.get()
+        try:
+            if self.expression_mode.get():
+                # Whole compound question answered in one round-trip
+                result = self.engine.ask_expression(val)
+            else:
+                result = self.engine.ask(attr, op, val)
+        except QueryError as e:
+            messagebox.showerror("Invalid Value", f"{e}\n\nPlease check your input.")
+            return
+        
+        # Enhanced answer dialog
+        answer_text = "✅ YES" if result.answer else "❌ NO"
+        if self.expression_mode.get():
+            question_text = f"Does the secret card match: {val}?"
+        else:
+            question_text = f"Is the secret card's {attr} {op} {val}?"
+        
+        messagebox.showinfo("Answer", f"{question_text}\n\n{answer_text}")
+        
+        self.update_status()
+        self.update_visuals()
+        
+        # Clear the entry for next question
+        self.value_entry.delete(0, tk.END)
+
+    def guess(self, card: Card):
+        """Enhanced guess handling with better feedback"""
+        if self.engine.finished:
+            return
+        result = self.engine.guess(card)
+        if result.correct:
+            elapsed, final_score = result.elapsed, result.score
+            self.clock.stop()
+            
+            # Victory message
+            messagebox.showinfo(
+                "🎉 Correct!", 
+                f"Congratulations! You found the secret card!\n\n"
+                f"Card: {card.name}\n"
+                f"Time: {elapsed} seconds\n"
+                f"Score: {final_score} points"
+            )
+            
+            self.reveal_secret(card)
+            self.check_leaderboard(elapsed, final_score)
+        else:
+            messagebox.showwarning(
+                "❌ Incorrect", 
+                f"{card.name} is not the secret card.\nKeep trying!"
+            )
+            self.update_status()
+            self.update_visuals()
+
+    def guess_last(self):
+        """Keyboard guess: only unambiguous once a single candidate is left"""
+        if self.engine.finished:
+            return
+        if self.engine.remaining == 1:
+            self.guess(self.candidates[0])
+        else:
+            self.root.bell()
+
+    # ---------- ENHANCED STATUS & VISUALS ----------
+    def update_status(self):
+        """Enhanced status with more information"""
+        self.update_preview()
+        remaining = self.engine.remaining
+        total = len(self.engine.index)
+        eliminated = total - remaining
+        
+        status_text = f"Cards remaining: {remaining}/{total} | Eliminated: {eliminated}"
+        
+        if remaining <= 3:
+            status_text += " | 🔥 Getting close!"
+        elif remaining <= 1:
+            status_text += " | 🎯 Final card!"
+            
+        self.status_var.set(status_text)
+
+    def update_visuals(self, removed=None):
+        """Bring the grid in line with the engine's candidates.
+
+        The grid diffs against what it last drew and redraws only changed,
+        on-screen cards in one idle pass, however many were eliminated.
+        """
+        self.card_grid.sync(self.engine.candidate_set.mask)
+
+    def reset_visuals(self):
+        """Enhanced reset with better feedback"""
+        self.engine.reset()
+        self.card_grid.reset()
+        self.update_timer()
+            
+        self.update_status()
+        messagebox.showinfo("Reset", "All cards are back in play! Good luck!")
+
+    def restart(self):
+        """Start a fresh game on the existing UI (no rebuild, no dialogs)"""
+        self.engine.new_game()
+        self.card_grid.reset()
+        self.update_timer()
+        self.update_status()
+
+    def new_game(self):
+        """Enhanced new game with confirmation"""
+        if messagebox.askyesno("New Game", "Start a new game? This will reset your progress."):
+            self.abandon_round()
+            self.engine.new_game()
+            self.reset_visuals()
+            messagebox.showinfo("New Game", f"New secret card selected! Can you guess it?")
+
+    def reveal_secret(self, card: Card):
+        """Enhanced secret reveal with visual highlight"""
+        self.card_grid.sync(self.engine.candidate_set.mask, winner=card)
+
+    # ---------- ENHANCED LEADERBOARD ----------
+    def check_leaderboard(self, elapsed_time, score):
+        """Record every win; only a score that makes the board asks for a name"""
+        name = self.player_name()
+        if self.leaderboard_manager.qualifies(score):
+            entered = simpledialog.askstring(
+                "🏆 New High Score!", 
+                f"Congratulations! You scored {score} points!\n"
+                f"You made it to the leaderboard!\n\n"
+                "Enter your name:",
+                initialvalue=name
+            )
+            if entered and entered.strip():
+                name = entered.strip()
+                self.remember_player_name(name)
+            self.leaderboard_manager.record_result(name, score, elapsed_time)
+            self.show_leaderboard_ui()
+        else:
+            # Still part of the player's history (games played, win rate)
+            self.leaderboard_manager.record_result(name, score, elapsed_time)
+
+    def record_loss(self):
+        """End the round as a loss and add it to the player's history"""
+        elapsed = self.engine.give_up()
+        self.clock.stop()
+        self.leaderboard_manager.record_result(self.player_name(), 0, elapsed, won=False)
+
+    def abandon_round(self):
+        """A round left after playing it (new game, menu, deck swap, quit) counts as lost"""
+        if self.engine.in_progress:
+            self.record_loss()
+
+    def give_up(self):
+        """Reveal the secret card and count the round as a loss"""
+        if self.engine.finished:
+            return
+        if not messagebox.askyesno("Give Up", "Give up and reveal the secret card?"):
+            return
+        secret = self.engine.secret
+        self.record_loss()
+        self.reveal_secret(secret)
+        messagebox.showinfo("Game Over", f"The secret card was {secret.name}.")
+
+    def player_name(self) -> str:
+        """Name results are recorded under when nobody is asked (last one entered)"""
+        return self.services.settings.settings.get("player_name") or "Anonymous"
+
+    def remember_player_name(self, name: str):
+        settings = self.services.settings
+        if settings.settings.get("player_name") != name:
+            settings.settings["player_name"] = name
+            settings.save_settings()
+
+    def show_leaderboard_ui(self):
+        """Enhanced leaderboard UI (the dialog is shared with the menu and reused)"""
+        show_leaderboard(self.root, self.services, MAX_LEADERS)
+
+    # ---------- ENHANCED NAVIGATION ----------
+    def return_to_menu(self):
+        """Return to main menu with confirmation"""
+        if messagebox.askyesno("Return to Menu", "Return to main menu? Current game progress will be lost."):
+            self.abandon_round()
+            if self.return_to_menu_callback:
+                self.return_to_menu_callback()
+            else:
+                # Fallback - recreate main menu
+                from clash_royale_game import ClashRoyaleApp
+                for widget in self.root.winfo_children(): 
+                    widget.destroy()
+                ClashRoyaleApp(self.root)
+
+    def hint(self):
+        """Enhanced hint system"""
+        if self.engine.remaining <= 1:
+            messagebox.showinfo("Hint", "You're down to the final card! Make your guess!")
+            return
+            
+        suggestion = self.engine.hint()
+        if suggestion is None:
+            messagebox.showinfo(
+                "💡 Hint",
+                "No single question can tell the remaining cards apart.\nTime to start guessing!"
+            )
+            return
+        
+        # Pre-fill the question bar with the most informative question
+        self.attr_var.set(suggestion.attr)
+        self.op_var.set(suggestion.op)
+        self.value_entry.delete(0, tk.END)
+        if self.expression_mode.get():
+            self.value_entry.insert(0, f"{suggestion.attr} {suggestion.op} {suggestion.value_text}")
+        else:
+            self.value_entry.insert(0, suggestion.value_text)
+        
+        messagebox.showinfo(
+            "💡 Hint",
+            f"Try asking: {suggestion.attr} {suggestion.op} {suggestion.value_text}\n\n"
+            f"It splits the {suggestion.total} remaining cards into "
+            f"{suggestion.yes} yes / {suggestion.no} no."
+        )
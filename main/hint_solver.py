@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+hint_solver.py
+
+Information-gain hint solver for Clash Royale — Guess Who?
+Keeps a value histogram per attribute for the cards still in play and
+scores every askable question by the entropy of its yes/no split, so a
+hint costs O(distinct values) rather than O(questions x candidates).
+Histograms are popcounts of the index's value bitmasks, so building and
+updating them never walks individual cards.
+"""
+
+import math
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from candidate_set import CandidateIndex, popcount
+
+
+@dataclass
+class Suggestion:
+    """A question worth asking and how it splits the candidates"""
+    attr: str
+    op: str
+    value: Any
+    yes: int
+    total: int
+    gain: float
+
+    @property
+    def value_text(self) -> str:
+        return str(self.value)
+
+    @property
+    def no(self) -> int:
+        return self.total - self.yes
+
+
+def split_entropy(yes: int, total: int) -> float:
+    """Expected information (bits) from a yes/no answer splitting total cards"""
+    if yes <= 0 or yes >= total:
+        return 0.0
+    p = yes / total
+    return -(p * math.log2(p) + (1 - p) * math.log2(1 - p))
+
+
+class HintSolver:
+    """Suggests the question with the highest expected entropy reduction"""
+
+    def __init__(self, index: CandidateIndex, mask: int = None):
+        self.index = index
+        self.reset(mask)
+
+    def _histogram(self, value_masks: Dict[Any, int], mask: int) -> Dict[Any, int]:
+        hist = {}
+        for value, value_mask in value_masks.items():
+            count = popcount(value_mask & mask)
+            if count:
+                hist[value] = count
+        return hist
+
+    def reset(self, mask: int = None):
+        """Rebuild the histograms for a fresh candidate mask"""
+        self.mask = self.index.full_mask if mask is None else mask
+        self.total = popcount(self.mask)
+        # One AND + popcount per (attribute, value): no per-card work at all
+        self.histograms: Dict[str, Dict[Any, int]] = {
+            attr: self._histogram(value_masks, self.mask)
+            for attr, value_masks in self.index.value_masks.items()
+        }
+
+    def remove(self, removed_mask: int):
+        """Account for eliminated cards (bits outside the current mask are ignored)"""
+        removed_mask &= self.mask
+        if not removed_mask:
+            return
+        self.mask &= ~removed_mask
+        self.total -= popcount(removed_mask)
+        for attr, hist in self.histograms.items():
+            value_masks = self.index.value_masks[attr]
+            for value in list(hist):
+                count = popcount(value_masks[value] & removed_mask)
+                if count:
+                    hist[value] -= count
+                    if not hist[value]:
+                        del hist[value]
+
+    def questions(self) -> Iterator[Tuple[str, str, Any, int]]:
+        """Every useful question as (attr, op, value, yes_count)"""
+        for attr, hist in self.histograms.items():
+            if len(hist) < 2:
+                continue
+            for value, count in hist.items():
+                yield attr, "=", value, count
+            if all(type(v) is int for v in hist):
+                running = 0
+                for value in sorted(hist)[:-1]:
+                    running += hist[value]
+                    yield attr, "<=", value, running
+
+    def best_question(self) -> Optional[Suggestion]:
+        """The most informative question, or None if nothing splits the candidates"""
+        best = None
+        for attr, op, value, yes in self.questions():
+            gain = split_entropy(yes, self.total)
+            if best is None or gain > best.gain:
+                best = Suggestion(attr, op, value, yes, self.total, gain)
+        return best if best and best.gain > 0 else None
+
+
+# ---------- BENCHMARK ----------
+def benchmark(pool_size=10_000, rounds=200):
+    """Time hint latency over a synthetic card pool"""
+    from cards import Card, ATTRIBUTES
+    from query import compile_question
+
+    rng = random.Random(42)
+    cards = [
+        Card(
+            f"Card {i}",
+            rng.choice(["common", "rare", "epic", "legendary", "champion"]),
+            rng.choice(["troop", "spell", "building"]),
+            rng.randint(1, 10),
+            rng.random() < 0.3,
+            rng.random() < 0.2,
+            rng.choice(["ground", "air", "both", "buildings"]),
+            rng.choice(["defense", "support", "win_condition", "swarm", "tank"]),
+        )
+        for i in range(pool_size)
+    ]
+
+    start = time.perf_counter()
+    index = CandidateIndex(cards, ATTRIBUTES)
+    solver = HintSolver(index)
+    print(f"Index + histograms for {pool_size} cards: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        suggestion = solver.best_question()
+    per_hint = (time.perf_counter() - start) / rounds * 1000
+    print(f"Hint latency: {per_hint:.3f} ms  ({suggestion.attr} {suggestion.op} {suggestion.value}, "
+          f"{suggestion.gain:.3f} bits)")
+
+    secret = rng.randrange(pool_size)
+    start = time.perf_counter()
+    questions = 0
+    while solver.total > 1:
+        suggestion = solver.best_question()
+        if suggestion is None:
+            break
+        match_mask = compile_question(suggestion.attr, suggestion.op, suggestion.value_text).mask(index)
+        truth = bool(match_mask >> secret & 1)
+        solver.remove(solver.mask & ~(match_mask if truth else ~match_mask))
+        questions += 1
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"Played one game: {questions} questions, {elapsed:.1f} ms total "
+          f"({elapsed / max(questions, 1):.3f} ms per question incl. bookkeeping)")
+
+
+if __name__ == "__main__":
+    benchmark()
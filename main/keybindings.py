@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+keybindings.py
+
+Keyboard shortcut dispatch for Clash Royale — Guess Who?
+Key names are normalized once, when bindings are set, into a canonical
+form such as "N", "Enter" or "Ctrl+Shift+N". One <KeyPress> handler per
+window turns each event into the same form and looks it up in a prebuilt
+key -> callable table for each active scope ("menu", "game", ...), so a
+keypress is a dictionary lookup and rebinding never touches Tk bindings.
+"""
+
+import sys
+import weakref
+from typing import Callable, Dict, List, Optional
+
+# Tk keysym (lowercased) -> display name used in settings
+SPECIAL_KEYS = {
+    'return': 'Enter',
+    'kp_enter': 'Enter',
+    'enter': 'Enter',
+    'escape': 'Esc',
+    'esc': 'Esc',
+    'space': 'Space',
+    'tab': 'Tab',
+    'backspace': 'Backspace',
+    'delete': 'Del',
+    'del': 'Del',
+    'up': 'Up',
+    'down': 'Down',
+    'left': 'Left',
+    'right': 'Right',
+}
+
+MODIFIER_ORDER = ("Ctrl", "Alt", "Shift")
+MODIFIER_ALIASES = {'ctrl': 'Ctrl', 'control': 'Ctrl', 'alt': 'Alt', 'option': 'Alt', 'shift': 'Shift'}
+# event.state bits (Alt is Mod1 on X11/macOS but its own bit on Windows, where 0x8 is NumLock)
+ALT_MASK = 0x20000 if sys.platform == "win32" else 0x0008
+STATE_MASKS = (("Shift", 0x0001), ("Ctrl", 0x0004), ("Alt", ALT_MASK))
+MODIFIER_KEYSYMS = {'Shift_L', 'Shift_R', 'Control_L', 'Control_R', 'Alt_L', 'Alt_R',
+                    'Super_L', 'Super_R', 'Caps_Lock', 'Meta_L', 'Meta_R'}
+
+
+def _key_name(keysym: str) -> str:
+    special = SPECIAL_KEYS.get(keysym.lower())
+    if special:
+        return special
+    if len(keysym) == 1:
+        return keysym.upper()
+    if keysym[:1] in "fF" and keysym[1:].isdigit():
+        return keysym.upper()
+    return keysym
+
+
+def _join(modifiers, key: str) -> str:
+    # Shift is implied by the keysym for printable characters
+    if len(key) == 1:
+        modifiers = set(modifiers) - {"Shift"}
+    return "+".join([m for m in MODIFIER_ORDER if m in modifiers] + [key])
+
+
+def canonical_key(text: str) -> str:
+    """Normalize a stored key name ("ctrl+n", "Return", "h") to canonical form"""
+    if not text:
+        return ""
+    parts = [p.strip() for p in text.split("+")]
+    if text.endswith("+"):   # the "+" key itself
+        parts = parts[:-2] + ["+"]
+    modifiers = {MODIFIER_ALIASES[p.lower()] for p in parts[:-1] if p.lower() in MODIFIER_ALIASES}
+    return _join(modifiers, _key_name(parts[-1]))
+
+
+def event_key(event) -> Optional[str]:
+    """Canonical key for a Tk key event, or None for a bare modifier press"""
+    if event.keysym in MODIFIER_KEYSYMS:
+        return None
+    modifiers = {name for name, mask in STATE_MASKS if event.state & mask}
+    return _join(modifiers, _key_name(event.keysym))
+
+
+def is_printable(key: str) -> bool:
+    """A plain character that would otherwise be typed into a text field"""
+    return len(key) == 1 or key == "Space"
+
+
+class KeyBindings:
+    """Scoped key -> action dispatch for one window"""
+
+    _instances = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def for_window(cls, root) -> "KeyBindings":
+        """The shared dispatcher for a window, created (and bound) on first use"""
+        bindings = cls._instances.get(root)
+        if bindings is None:
+            bindings = cls._instances[root] = cls(root)
+        return bindings
+
+    def __init__(self, root):
+        self.root = root
+        self.tables: Dict[str, Dict[str, Callable]] = {}
+        self.active: List[str] = []          # most recently activated last
+        self.owners: Dict[str, object] = {}
+        self.capture: Optional[Callable] = None   # gets every key instead, e.g. while recording one
+        root.bind('<KeyPress>', self.dispatch, add="+")
+
+    def attach(self, window, scope: str):
+        """Dispatch one scope's keys in another toplevel (a dialog's bindtags never include the root)"""
+        window.bind('<KeyPress>', lambda e: self.dispatch(e, scopes=(scope,)), add="+")
+
+    def set_bindings(self, scope: str, keymap: Dict[str, str], actions: Dict[str, Callable]) -> List[str]:
+        """(Re)build a scope's table from action -> key name and action -> callable.
+
+        A key can only belong to one action per scope: later actions that
+        reuse a key are left unbound and returned.
+        """
+        table, owner, refused = {}, {}, []
+        for action, callback in actions.items():
+            key = canonical_key(keymap.get(action, ""))
+            if not key:
+                continue
+            if key in table:
+                print(f"Key '{key}' is already bound to {owner[key]} in {scope}; {action} left unbound")
+                refused.append(action)
+                continue
+            table[key] = callback
+            owner[key] = action
+        self.tables[scope] = table
+        return refused
+
+    def activate(self, scope: str, owner=None):
+        """Make a scope live; if owner is given, drop it when that widget is destroyed"""
+        if scope in self.active:
+            self.active.remove(scope)
+        self.active.append(scope)
+        if owner is not None and self.owners.get(scope) is not owner:
+            self.owners[scope] = owner
+            owner.bind("<Destroy>", lambda e: e.widget is owner and self.deactivate(scope, owner), add="+")
+
+    def deactivate(self, scope: str, owner=None):
+        """Drop a scope; with `owner`, only if that widget still owns it (it was destroyed)"""
+        if owner is not None:
+            if self.owners.get(scope) is not owner:
+                return
+            del self.owners[scope]
+        if scope in self.active:
+            self.active.remove(scope)
+
+    def dispatch(self, event, scopes=None):
+        if self.capture is not None:
+            self.capture(event)
+            return "break"
+        key = event_key(event)
+        if key is None:
+            return None
+        # Let plain characters reach text fields; Enter, Esc and chords still dispatch
+        if is_printable(key):
+            try:
+                focused = self.root.focus_get()
+            except KeyError:   # focus inside a popdown Tk created itself
+                focused = None
+            if focused is not None and focused.winfo_class() in ("Entry", "TEntry", "Text", "TCombobox"):
+                return None
+        for scope in (scopes or reversed(self.active)):
+            callback = self.tables.get(scope, {}).get(key)
+            if callback is not None:
+                callback()
+                return "break"
+        return None
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+leaderboard_sqlite.py
+
+SQLite leaderboard backend for Clash Royale — Guess Who?
+Every game result is a row in `games`; a trigger folds each insert into a
+per-player row in `players` (keyed by normalized name), so games, wins and
+win rate always come from recorded history. An index on (score, best_time)
+answers top-N queries without scanning, which keeps a kiosk with hundreds
+of thousands of results responsive. Offers the same interface as
+LeaderboardStore so LeaderboardManager can use either.
+"""
+
+import sqlite3
+import time
+from typing import List, Optional
+
+from leaderboard_store import DEFAULT_TOP_N, LeaderboardStore, normalize_name
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player_key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    time REAL NOT NULL,
+    won INTEGER NOT NULL,
+    played_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_player ON games(player_key);
+
+CREATE TABLE IF NOT EXISTS players (
+    key TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL DEFAULT 0,
+    games INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    best_time REAL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS players_rank ON players(score DESC, best_time);
+
+CREATE TRIGGER IF NOT EXISTS games_to_players AFTER INSERT ON games BEGIN
+    INSERT INTO players (key, name, score, games, wins, best_time)
+    VALUES (NEW.player_key, NEW.name,
+            CASE WHEN NEW.won THEN NEW.score ELSE 0 END,
+            1, NEW.won,
+            CASE WHEN NEW.won THEN NEW.time END)
+    ON CONFLICT(key) DO UPDATE SET
+        games = games + 1,
+        wins = wins + NEW.won,
+        score = CASE WHEN NEW.won AND NEW.score > score THEN NEW.score ELSE score END,
+        best_time = CASE WHEN NEW.won AND (best_time IS NULL OR NEW.time < best_time)
+                         THEN NEW.time ELSE best_time END;
+END;
+"""
+
+_PLAYER_COLUMNS = "name, score, games, wins, best_time"
+
+
+def _row_to_entry(row) -> dict:
+    name, score, games, wins, best_time = row
+    return {'name': name, 'score': score, 'games': games, 'wins': wins,
+            'win_rate': round(100 * wins / games) if games else 0,
+            'best_time': best_time if best_time is not None else 0}
+
+
+class SQLiteLeaderboardStore:
+    """Leaderboard kept in a WAL-mode SQLite database"""
+
+    def __init__(self, db_file: str = "leaderboard.db", top_n: int = DEFAULT_TOP_N,
+                 import_from: str = None, defaults=None):
+        self.db_file = db_file
+        self.top_n = top_n
+        self.conn = sqlite3.connect(db_file)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        if self._empty():
+            self._import(import_from, defaults)
+
+    def close(self):
+        self.conn.close()
+
+    # ---------- LOADING ----------
+    def _empty(self) -> bool:
+        return self.conn.execute("SELECT 1 FROM players LIMIT 1").fetchone() is None
+
+    def _import(self, json_file: Optional[str], defaults):
+        """Seed a new database from the JSON leaderboard (or the defaults)"""
+        entries = []
+        if json_file:
+            # Reuse the JSON store's loader so its log is replayed as well (there
+            # may be no snapshot yet if the log was never compacted)
+            entries = LeaderboardStore(json_file).sorted_players()
+        if not entries:
+            entries = [LeaderboardStore._from_legacy(entry) for entry in defaults or []]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO players (key, name, score, games, wins, best_time) VALUES (?, ?, ?, ?, ?, ?)",
+                [(normalize_name(e['name']), e['name'], e['score'], e['games'], e['wins'], e['best_time'])
+                 for e in entries])
+
+    # ---------- UPDATES ----------
+    def record_result(self, name: str, score: int, elapsed: float, won: bool = True) -> dict:
+        """Insert one game result; the trigger updates the player's aggregates"""
+        name = name.strip() or "Anonymous"
+        key = normalize_name(name)
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT INTO games (player_key, name, score, time, won, played_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, name, score, elapsed, int(won), time.time()))
+        except sqlite3.Error as e:
+            print(f"Error saving leaderboard: {e}")
+        return self.get_player(name)
+
+    # ---------- QUERIES ----------
+    def top_players(self, n: int = None) -> List[dict]:
+        """Best players by score, read straight off the rank index"""
+        rows = self.conn.execute(
+            f"SELECT {_PLAYER_COLUMNS} FROM players WHERE best_time IS NOT NULL "
+            "ORDER BY score DESC, best_time LIMIT ?", (n or self.top_n,))
+        return [_row_to_entry(row) for row in rows]
+
+    def sorted_players(self) -> List[dict]:
+        """Every player, best first"""
+        rows = self.conn.execute(f"SELECT {_PLAYER_COLUMNS} FROM players ORDER BY score DESC, best_time")
+        return [_row_to_entry(row) for row in rows]
+
+    def get_player(self, name: str) -> Optional[dict]:
+        row = self.conn.execute(f"SELECT {_PLAYER_COLUMNS} FROM players WHERE key = ?",
+                                (normalize_name(name),)).fetchone()
+        return _row_to_entry(row) if row else None
+
+    def history(self, name: str, limit: int = 50) -> List[dict]:
+        """A player's most recent games"""
+        rows = self.conn.execute(
+            "SELECT score, time, won, played_at FROM games WHERE player_key = ? ORDER BY id DESC LIMIT ?",
+            (normalize_name(name), limit))
+        return [{'score': s, 'time': t, 'won': bool(w), 'at': at} for s, t, w, at in rows]
+
+    def qualifies(self, score: int) -> bool:
+        """Whether a score would make the top-N board"""
+        row = self.conn.execute(
+            "SELECT score FROM players WHERE best_time IS NOT NULL "
+            "ORDER BY score DESC, best_time LIMIT 1 OFFSET ?", (self.top_n - 1,)).fetchone()
+        return row is None or score > row[0]
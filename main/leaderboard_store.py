@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+leaderboard_store.py
+
+Crash-safe leaderboard storage for Clash Royale — Guess Who?
+Each game result is appended to a log; the per-player snapshot is only
+rewritten on periodic compaction, via a temp file and an atomic rename.
+A bounded heap keeps the top-N players, so submitting a score costs
+O(log N) and reading the board costs O(N).
+"""
+
+import heapq
+import json
+import os
+import time
+from typing import Dict, List, Optional
+
+COMPACT_EVERY = 50
+DEFAULT_TOP_N = 10
+
+
+def normalize_name(name: str) -> str:
+    """Case- and whitespace-insensitive player key"""
+    return " ".join(name.split()).lower()
+
+
+def atomic_write_json(path: str, data):
+    """Write JSON to a temp file, fsync it, then rename over the target"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class TopN:
+    """Min-heap of the N best (score, name) pairs, one entry per player"""
+
+    def __init__(self, n: int = DEFAULT_TOP_N):
+        self.n = n
+        self.heap = []           # (score, -best_time, key)
+        self.members: Dict[str, tuple] = {}
+
+    def offer(self, key: str, score: int, best_time: float):
+        entry = (score, -best_time, key)
+        current = self.members.get(key)
+        if current is not None:
+            if entry <= current:
+                return
+            # Replace the player's entry; the heap holds at most N items
+            self.heap.remove(current)
+            heapq.heapify(self.heap)
+        elif len(self.heap) >= self.n:
+            if entry <= self.heap[0]:
+                return
+            evicted = heapq.heapreplace(self.heap, entry)
+            del self.members[evicted[2]]
+            self.members[key] = entry
+            return
+        heapq.heappush(self.heap, entry)
+        self.members[key] = entry
+
+    def keys(self) -> List[str]:
+        """Player keys, best first"""
+        return [key for _, _, key in sorted(self.heap, reverse=True)]
+
+    def threshold(self) -> Optional[int]:
+        """Lowest score on a full board, or None while there is room"""
+        return self.heap[0][0] if len(self.heap) >= self.n else None
+
+
+class LeaderboardStore:
+    """Append-only result log plus compacted per-player snapshot"""
+
+    def __init__(self, snapshot_file: str = "leaderboard.json", log_file: str = None,
+                 top_n: int = DEFAULT_TOP_N, compact_every: int = COMPACT_EVERY, defaults=None):
+        self.snapshot_file = snapshot_file
+        self.log_file = log_file or os.path.splitext(snapshot_file)[0] + ".log"
+        self.compact_every = compact_every
+        self.top_n = top_n
+        self.players: Dict[str, dict] = {}
+        self.top = TopN(top_n)
+        self.last_seq = 0
+        self.pending = 0
+        self.load(defaults)
+
+    # ---------- LOADING ----------
+    def load(self, defaults=None):
+        """Load the snapshot, then replay results logged since the last compaction"""
+        self.players.clear()
+        self.top = TopN(self.top_n)
+        self.last_seq = 0
+        snapshot = None
+        try:
+            if os.path.exists(self.snapshot_file):
+                with open(self.snapshot_file, 'r') as f:
+                    snapshot = json.load(f)
+        except Exception as e:
+            print(f"Error loading leaderboard: {e}")
+
+        if isinstance(snapshot, dict):
+            self.last_seq = snapshot.get("last_seq", 0)
+            entries = snapshot.get("players", [])
+        elif isinstance(snapshot, list):
+            entries = snapshot  # plain list of players (original format)
+        else:
+            entries = []
+        if not entries and not os.path.exists(self.log_file):
+            entries = list(defaults or [])
+        for entry in entries:
+            self._add_player(self._from_legacy(entry))
+
+        self.pending = 0
+        for record in self._read_log():
+            if record.get("seq", 0) > self.last_seq:
+                self._apply(record)
+                self.last_seq = record["seq"]
+                self.pending += 1
+
+    @staticmethod
+    def _from_legacy(entry: dict) -> dict:
+        if 'time' in entry and 'score' not in entry:
+            # Oldest format: only a name and a time
+            best_time = entry.get('time', 60)
+            return {'name': entry.get('name', 'Anonymous'), 'score': max(1000 - int(best_time * 10), 100),
+                    'games': 1, 'wins': 1, 'win_rate': 100, 'best_time': best_time}
+        entry = dict(entry)
+        entry.setdefault('name', 'Anonymous')
+        entry.setdefault('score', 0)
+        entry.setdefault('games', 1)
+        entry.setdefault('best_time', 0)
+        if 'wins' not in entry:
+            entry['wins'] = round(entry['games'] * entry.get('win_rate', 100) / 100)
+        entry['win_rate'] = round(100 * entry['wins'] / entry['games']) if entry['games'] else 0
+        return entry
+
+    def _read_log(self):
+        try:
+            with open(self.log_file, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        # A torn final line from a crash mid-append; skip it
+                        continue
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Error reading leaderboard log: {e}")
+
+    def _add_player(self, entry: dict):
+        key = normalize_name(entry['name'])
+        self.players[key] = entry
+        # Players with only losses have no best time and stay off the board
+        if entry['best_time'] is not None:
+            self.top.offer(key, entry['score'], entry['best_time'])
+
+    # ---------- UPDATES ----------
+    def _apply(self, record: dict):
+        """Fold one game result into the player aggregates and the top-N heap"""
+        key = normalize_name(record['name'])
+        won = record.get('won', True)
+        player = self.players.get(key)
+        if player is None:
+            player = {'name': record['name'], 'score': 0, 'games': 0, 'wins': 0,
+                      'win_rate': 0, 'best_time': None}
+            self.players[key] = player
+        player['games'] += 1
+        if won:
+            player['wins'] += 1
+            player['score'] = max(player['score'], record['score'])
+            if player['best_time'] is None or record['time'] < player['best_time']:
+                player['best_time'] = record['time']
+        player['win_rate'] = round(100 * player['wins'] / player['games'])
+        if player['best_time'] is not None:
+            self.top.offer(key, player['score'], player['best_time'])
+
+    def record_result(self, name: str, score: int, elapsed: float, won: bool = True) -> dict:
+        """Append one game result; returns the player's updated entry"""
+        name = name.strip() or "Anonymous"
+        record = {'seq': self.last_seq + 1, 'name': name, 'score': score, 'time': elapsed,
+                  'won': won, 'at': time.time()}
+        try:
+            with open(self.log_file, 'a') as f:
+                f.write(json.dumps(record) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            print(f"Error saving leaderboard: {e}")
+        self.last_seq = record['seq']
+        self._apply(record)
+        self.pending += 1
+        if self.pending >= self.compact_every:
+            self.compact()
+        return self.players[normalize_name(name)]
+
+    def compact(self):
+        """Rewrite the snapshot atomically, then start a fresh log"""
+        snapshot = {"last_seq": self.last_seq, "players": self.sorted_players()}
+        try:
+            atomic_write_json(self.snapshot_file, snapshot)
+        except Exception as e:
+            print(f"Error compacting leaderboard: {e}")
+            return
+        # The snapshot records last_seq, so a crash before this truncate only
+        # leaves already-applied records behind, which load() skips
+        try:
+            open(self.log_file, 'w').close()
+        except Exception as e:
+            print(f"Error truncating leaderboard log: {e}")
+        self.pending = 0
+
+    # ---------- QUERIES ----------
+    def top_players(self, n: int = None) -> List[dict]:
+        """Best players by score, from the maintained heap"""
+        keys = self.top.keys()
+        return [self.players[k] for k in (keys if n is None else keys[:n])]
+
+    def sorted_players(self) -> List[dict]:
+        """Every player, best first"""
+        return sorted(self.players.values(), reverse=True,
+                      key=lambda p: (p.get('score', 0), -(p.get('best_time') or 0)))
+
+    def get_player(self, name: str) -> Optional[dict]:
+        return self.players.get(normalize_name(name))
+
+    def qualifies(self, score: int) -> bool:
+        """Whether a score would make the top-N board"""
+        threshold = self.top.threshold()
+        return threshold is None or score > threshold
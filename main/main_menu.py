@@ -6,12 +6,24 @@ Enhanced Clash Royale Main Menu with Leaderboard, Instructions, and Settings
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
+import atexit
 import json
 import os
-from PIL import Image, ImageTk
+import threading
+
+from leaderboard_store import LeaderboardStore
+from services import get_services, LEADERBOARD_CHANGED, SETTINGS_CHANGED
+from background import BackgroundRenderer
+from keybindings import KeyBindings, MODIFIER_KEYSYMS, canonical_key, event_key
+from modals import MODAL_SCOPE, ModalCache, show_leaderboard
+
+# "json" (append-only log + snapshot) or "sqlite" (leaderboard.db, for kiosks)
+LEADERBOARD_BACKEND = os.environ.get("CLASH_LEADERBOARD_BACKEND", "json")
+# Seconds of quiet before pending settings changes are written
+SETTINGS_SAVE_DELAY = 0.5
 
 class KeybindRecorder:
     """Handles keybind recording and validation"""
@@ -26,7 +38,6 @@ class KeybindRecorder:
         
     def start_recording(self, action, button, modal_window=None):
         """Start recording a keybind for the specified action"""
-        print(f"Starting recording for action: {action}")  # Debug
         self.recording = True
         self.current_action = action
         self.current_button = button
@@ -34,43 +45,31 @@ class KeybindRecorder:
         # Update button appearance
         button.configure(text="Press key...", bootstyle="warning")
         
-        # Bind to the modal window if provided, otherwise use parent
+        # The dispatcher hands every key to us until recording stops; it is
+        # attached to the modal window as well as the parent
         self.bound_widget = modal_window if modal_window else self.parent
-        
-        print(f"Binding to widget: {self.bound_widget}")  # Debug
-        self.bound_widget.bind('<Key>', self.on_key_press)
         self.bound_widget.focus_force()
+        KeyBindings.for_window(self.parent).capture = self.on_key_press
     
     def on_key_press(self, event):
         """Handle key press during recording"""
-        print(f"Key pressed: {event.keysym}, Recording: {self.recording}")  # Debug
         
         if not self.recording:
             return
             
-        # Prevent certain keys from being bound
-        forbidden_keys = ['Shift_L', 'Shift_R', 'Control_L', 'Control_R', 
-                         'Alt_L', 'Alt_R', 'Super_L', 'Super_R', 'Caps_Lock']
-        
-        if event.keysym in forbidden_keys:
-            messagebox.showwarning("Invalid Key", f"Cannot bind modifier key: {event.keysym}")
-            self.cancel_recording()
+        # A bare modifier starts a chord (e.g. Ctrl+N); wait for the real key
+        if event.keysym in MODIFIER_KEYSYMS:
             return
         
         # Get the key representation
         key = self.format_key(event)
-        print(f"Formatted key: {key}")  # Debug
         
         if key:
             # Stop recording
             self.recording = False
-            
-            # Unbind the key event
-            if self.bound_widget:
-                self.bound_widget.unbind('<Key>')
+            KeyBindings.for_window(self.parent).capture = None
             
             # Update the keybind through callback
-            print(f"Calling callback with action={self.current_action}, key={key}")  # Debug
             self.callback(self.current_action, key)
             
             # Reset
@@ -81,6 +80,7 @@ class KeybindRecorder:
     def cancel_recording(self):
         """Cancel the current recording"""
         self.recording = False
+        KeyBindings.for_window(self.parent).capture = None
         if self.current_button:
             # Get the callback's parent object to access settings_manager
             try:
@@ -90,10 +90,6 @@ class KeybindRecorder:
             except:
                 self.current_button.configure(text="Error", bootstyle="danger")
         
-        # Unbind the key event
-        if self.bound_widget:
-            self.bound_widget.unbind('<Key>')
-        
         # Rebind global keybinds
         try:
             self.callback.__self__.setup_keybinds()
@@ -104,37 +100,23 @@ class KeybindRecorder:
     
     def format_key(self, event):
         """Format key event into readable string"""
-        # Handle special keys
-        special_keys = {
-            'Return': 'Enter',
-            'Escape': 'Esc',
-            'space': 'Space',
-            'Tab': 'Tab',
-            'BackSpace': 'Backspace',
-            'Delete': 'Del',
-            'Up': 'Up',
-            'Down': 'Down',
-            'Left': 'Left',
-            'Right': 'Right'
-        }
-        
-        if event.keysym in special_keys:
-            return special_keys[event.keysym]
-        elif len(event.keysym) == 1 and event.keysym.isalnum():
-            return event.keysym.upper()
-        elif event.keysym.startswith('F') and event.keysym[1:].isdigit():
-            return event.keysym
-        else:
-            # For any other key, use the keysym as-is
-            return event.keysym
+        # Same canonical form the dispatcher uses, including modifiers
+        return event_key(event)
 
 class SettingsManager:
     """Manages game settings and keybinds"""
     
-    def __init__(self):
+    def __init__(self, events=None, save_delay=SETTINGS_SAVE_DELAY):
         self.settings_file = "data/settings.json"
+        self.events = events
+        self.save_delay = save_delay
+        # Write-behind state: the latest serialized settings waiting to be written
+        self._lock = threading.Lock()
+        self._pending = None
+        self._timer = None
         self.ensure_data_dir()
         self.load_settings()
+        atexit.register(self.flush)
     
     def ensure_data_dir(self):
         """Ensure data directory exists"""
@@ -149,11 +131,14 @@ class SettingsManager:
                 "leaderboard": "L",
                 "settings": "S",
                 "submit": "Enter",
-                "close": "Esc"
+                "close": "Esc",
+                "hint": "Ctrl+H",
+                "guess": "Ctrl+G"
             },
             "sound_enabled": True,
             "animations_enabled": True,
-            "difficulty": "medium"
+            "difficulty": "medium",
+            "player_name": "Anonymous"
         }
     
     def load_settings(self):
@@ -169,25 +154,49 @@ class SettingsManager:
             self.settings = self.get_default_settings()
     
     def save_settings(self):
-        """Save settings to file"""
-        try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
-        except Exception as e:
-            print(f"Error saving settings: {e}")
+        """Save settings to file (debounced; changes within save_delay cost one write)"""
+        snapshot = json.dumps(self.settings, indent=2)
+        with self._lock:
+            self._pending = snapshot
+            if self._timer is None:
+                self._timer = threading.Timer(self.save_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if self.events:
+            self.events.publish(SETTINGS_CHANGED, settings=self.settings)
+    
+    def flush(self):
+        """Write any pending settings now (called by the timer and on shutdown)"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            snapshot, self._pending = self._pending, None
+            if snapshot is None:
+                return
+            tmp_path = self.settings_file + ".tmp"
+            try:
+                with open(tmp_path, 'w') as f:
+                    f.write(snapshot)
+                os.replace(tmp_path, self.settings_file)
+            except Exception as e:
+                print(f"Error saving settings: {e}")
     
     def get_keybind(self, action):
         """Get keybind for action"""
-        return self.settings.get("keybinds", {}).get(action, "")
+        return (self.settings.get("keybinds", {}).get(action)
+                or self.get_default_settings()["keybinds"].get(action, ""))
     
     def set_keybind(self, action, key):
         """Set keybind for action"""
         if "keybinds" not in self.settings:
             self.settings["keybinds"] = {}
         
-        # Check if key is already used
-        for existing_action, existing_key in self.settings["keybinds"].items():
-            if existing_key == key and existing_action != action:
+        # Check if key is already used, including actions still on their default key
+        key = canonical_key(key)
+        actions = set(self.get_default_settings()["keybinds"]) | set(self.settings["keybinds"])
+        for existing_action in sorted(actions):
+            if existing_action != action and canonical_key(self.get_keybind(existing_action)) == key:
                 return False, f"Key '{key}' is already assigned to {existing_action}"
         
         self.settings["keybinds"][action] = key
@@ -202,35 +211,26 @@ class SettingsManager:
 class LeaderboardManager:
     """Manages leaderboard data"""
     
-    def __init__(self):
+    def __init__(self, backend=LEADERBOARD_BACKEND, events=None):
         self.leaderboard_file = "leaderboard.json"
+        self.events = events
+        self.database_file = "leaderboard.db"
+        self.backend = backend
         self.load_leaderboard()
     
     def load_leaderboard(self):
         """Load leaderboard from file"""
-        try:
-            if os.path.exists(self.leaderboard_file):
-                with open(self.leaderboard_file, 'r') as f:
-                    data = json.load(f)
-                    # Convert old format if needed
-                    if isinstance(data, list) and data and isinstance(data[0], dict) and 'time' in data[0]:
-                        # Old format - convert to new format
-                        self.leaderboard = []
-                        for entry in data:
-                            self.leaderboard.append({
-                                'name': entry.get('name', 'Anonymous'),
-                                'score': max(1000 - int(entry.get('time', 60) * 10), 100),
-                                'games': 1,
-                                'win_rate': 100,
-                                'best_time': entry.get('time', 60)
-                            })
-                    else:
-                        self.leaderboard = data
-            else:
-                self.leaderboard = self.get_default_leaderboard()
-        except Exception as e:
-            print(f"Error loading leaderboard: {e}")
-            self.leaderboard = self.get_default_leaderboard()
+        if self.backend == "sqlite":
+            from leaderboard_sqlite import SQLiteLeaderboardStore
+            self.store = SQLiteLeaderboardStore(self.database_file, import_from=self.leaderboard_file,
+                                                defaults=self.get_default_leaderboard())
+        else:
+            self.store = LeaderboardStore(self.leaderboard_file, defaults=self.get_default_leaderboard())
+    
+    @property
+    def leaderboard(self):
+        """Every player on record"""
+        return self.store.sorted_players()
     
     def get_default_leaderboard(self):
         """Get default leaderboard"""
@@ -242,71 +242,67 @@ class LeaderboardManager:
             {"name": "TowerTaker", "score": 2050, "games": 93, "win_rate": 85, "best_time": 28.9}
         ]
     
-    def get_sorted_leaderboard(self):
-        """Get leaderboard sorted by score"""
-        return sorted(self.leaderboard, key=lambda x: x.get('score', 0), reverse=True)
+    def get_sorted_leaderboard(self, limit=None):
+        """Get leaderboard sorted by score (top `limit` entries come from the heap)"""
+        if limit is not None and limit <= self.store.top_n:
+            return self.store.top_players(limit)
+        return self.store.sorted_players()[:limit]
+    
+    def qualifies(self, score):
+        """Whether a score would make the top of the board"""
+        return self.store.qualifies(score)
+    
+    def record_result(self, name, score, elapsed_time, won=True):
+        """Append a game result and return the player's updated entry"""
+        entry = self.store.record_result(name, score, elapsed_time, won)
+        if self.events:
+            self.events.publish(LEADERBOARD_CHANGED, entry=entry)
+        return entry
 
 class ClashRoyaleMainMenu:
     """Enhanced Main Menu with all functionality"""
     
-    def __init__(self, root, on_play=None, on_how_to_play=None, on_leaderboard=None, on_settings=None):
+    def __init__(self, root, on_play=None, on_how_to_play=None, on_leaderboard=None, on_settings=None,
+                 services=None, parent=None):
         self.root = root
+        self.frame = parent or root   # container the menu is built into
         self.on_play = on_play
         self.on_how_to_play = on_how_to_play
         self.on_leaderboard = on_leaderboard
         self.on_settings = on_settings
         
-        # Initialize managers
-        self.settings_manager = SettingsManager()
-        self.leaderboard_manager = LeaderboardManager()
+        # Shared, already-loaded managers
+        self.services = services or get_services()
+        self.settings_manager = self.services.settings
+        self.leaderboard_manager = self.services.leaderboard
         self.keybind_recorder = KeybindRecorder(root, self.update_keybind)
         
-        # Variables
-        self.current_modal = None
+        # Dialogs are built on first use, then hidden and reused
+        self.modals = ModalCache.for_window(root)
         
         self.create_ui()
         self.setup_keybinds()
     
     def create_ui(self):
         """Create the main menu UI"""
-        # Debug information
-        import os
-        print(f"Current directory: {os.getcwd()}")
-        print(f"Files in current directory: {os.listdir('.')}")
-        print(f"Files in parent directory: {os.listdir('..')}")
-        print(f"Looking for: ../clash_royale_background.png")
-        print(f"File exists: {os.path.exists('../clash_royale_background.png')}")
-        
-        # Try to load background image
-        try:
-            # Load the background image (look in parent directory)
-            bg_image = Image.open("../clash_royale_background.png")
-            print("Successfully loaded background image!")
-            # Resize to fit window
-            bg_image = bg_image.resize((1000, 800), Image.LANCZOS)
-            self.bg_photo = ImageTk.PhotoImage(bg_image)
-            
-            # Create canvas for background
-            canvas = tk.Canvas(self.root, width=1000, height=800, highlightthickness=0)
-            canvas.pack(fill="both", expand=True)
-            canvas.create_image(0, 0, image=self.bg_photo, anchor="nw")
-            
-            # Create frame on top of canvas with transparency effect
-            main_frame = ttk.Frame(canvas, style='Transparent.TFrame')
-            canvas.create_window(500, 400, window=main_frame, anchor="center")
-            
-        except Exception as e:
-            print(f"Could not load background image: {e}")
-            import traceback
-            traceback.print_exc()
-            # Fallback to gradient background
+        # Background canvas; the image is decoded once and cached per size
+        canvas = tk.Canvas(self.frame, highlightthickness=0, bg='#2c3e50')
+        canvas.pack(fill="both", expand=True)
+        
+        # Create frame on top of canvas with transparency effect
+        main_frame = ttk.Frame(canvas, style='Transparent.TFrame')
+        window = canvas.create_window(0, 0, window=main_frame, anchor="center")
+        self.background = BackgroundRenderer(
+            canvas, on_resize=lambda w, h: canvas.coords(window, w // 2, h // 2))
+        if not self.background.available:
+            # Fallback to plain background
             self.root.configure(bg='#2c3e50')
-            main_frame = ttk.Frame(self.root, padding=40)
-            main_frame.pack(fill="both", expand=True)
+            main_frame.configure(padding=40)
         
         # Create semi-transparent container for menu items
         container = ttk.Frame(main_frame, padding=40, relief="raised", borderwidth=2)
         container.pack()
+        self.container = container
         
         # Configure style for better visibility on background
         style = ttk.Style()
@@ -386,79 +382,33 @@ class ClashRoyaleMainMenu:
     
     def setup_keybinds(self):
         """Setup global keybinds"""
-        # Clear any existing keybinds
-        self.root.unbind('<KeyPress>')
-        
-        # Create mapping of keys to actions
-        self.keybind_map = {}
-        for action in ["new_game", "instructions", "leaderboard", "settings", "close"]:
-            key = self.settings_manager.get_keybind(action).lower()
-            self.keybind_map[key] = action
-        
-        def on_key_press(event):
-            # Don't handle if we're recording a keybind
-            if self.keybind_recorder.recording:
-                return
-            
-            # Don't handle if focus is on an Entry widget (typing)
-            focused_widget = self.root.focus_get()
-            if focused_widget and isinstance(focused_widget, (tk.Entry, tk.Text)):
-                return
-                
-            key = event.keysym.lower()
-            
-            # Check for direct key match
-            if key in self.keybind_map:
-                action = self.keybind_map[key]
-                if action == "new_game":
-                    self.start_game()
-                elif action == "instructions":
-                    self.show_instructions()
-                elif action == "leaderboard":
-                    self.show_leaderboard()
-                elif action == "settings":
-                    self.show_settings()
-                elif action == "close":
-                    self.close_current_modal()
-            
-            # Also check uppercase version for letter keys
-            elif key.upper() in self.keybind_map:
-                action = self.keybind_map[key.upper()]
-                if action == "new_game":
-                    self.start_game()
-                elif action == "instructions":
-                    self.show_instructions()
-                elif action == "leaderboard":
-                    self.show_leaderboard()
-                elif action == "settings":
-                    self.show_settings()
-                elif action == "close":
-                    self.close_current_modal()
-            
-            # Handle special keys like 'Return' -> 'Enter'
-            special_map = {
-                'return': 'Enter',
-                'escape': 'Esc',
-                'space': 'Space'
-            }
-            if key in special_map:
-                mapped_key = special_map[key].lower()
-                if mapped_key in self.keybind_map:
-                    action = self.keybind_map[mapped_key]
-                    if action == "new_game":
-                        self.start_game()
-                    elif action == "instructions":
-                        self.show_instructions()
-                    elif action == "leaderboard":
-                        self.show_leaderboard()
-                    elif action == "settings":
-                        self.show_settings()
-                    elif action == "close":
-                        self.close_current_modal()
-        
-        self.root.bind('<KeyPress>', on_key_press)
+        # Rebuilding the menu scope's table is all a rebind needs; the single
+        # <KeyPress> handler stays bound
+        actions = {
+            "new_game": self.start_game,
+            "instructions": self.show_instructions,
+            "leaderboard": self.show_leaderboard,
+            "settings": self.show_settings,
+            "close": self.close_current_modal,
+        }
+        self.keybindings = KeyBindings.for_window(self.root)
+        self.keybindings.set_bindings(
+            "menu", {action: self.settings_manager.get_keybind(action) for action in actions}, actions)
+        self.keybindings.activate("menu", owner=self.container)
+        self.keybindings.set_bindings(
+            MODAL_SCOPE, {"close": self.settings_manager.get_keybind("close")}, {"close": self.modals.hide})
         self.root.focus_set()
     
+    def on_show(self):
+        """Screen shown again (menu is reused between games)"""
+        self.keybindings.activate("menu")
+        self.root.focus_set()
+    
+    def on_hide(self):
+        """Screen hidden: menu shortcuts and modals go away with it"""
+        self.close_current_modal()
+        self.keybindings.deactivate("menu")
+    
     def start_game(self):
         """Start the game"""
         if self.on_play:
@@ -467,89 +417,15 @@ class ClashRoyaleMainMenu:
             messagebox.showinfo("Game", "Starting game...")
     
     def show_leaderboard(self):
-        """Show the leaderboard modal"""
-        self.close_current_modal()
-        
-        # Create modal window
-        modal = tk.Toplevel(self.root)
-        modal.title("🏆 Leaderboard")
-        modal.geometry("500x400")
-        modal.transient(self.root)
-        modal.grab_set()
-        modal.configure(bg='#2c3e50')
-        
-        self.current_modal = modal
-        
-        # Header
-        header_frame = ttk.Frame(modal, padding=20)
-        header_frame.pack(fill="x")
-        
-        ttk.Label(
-            header_frame,
-            text="🏆 LEADERBOARD 🏆",
-            font=("Orbitron", 18, "bold"),
-            foreground="#f39c12"
-        ).pack()
-        
-        # Leaderboard content
-        content_frame = ttk.Frame(modal, padding=(20, 0, 20, 20))
-        content_frame.pack(fill="both", expand=True)
-        
-        # Create treeview for leaderboard
-        columns = ("Rank", "Name", "Score", "Games", "Win Rate", "Best Time")
-        tree = ttk.Treeview(content_frame, columns=columns, show="headings", height=12)
-        
-        # Configure columns
-        tree.heading("Rank", text="Rank")
-        tree.heading("Name", text="Player")
-        tree.heading("Score", text="Score")
-        tree.heading("Games", text="Games")
-        tree.heading("Win Rate", text="Win %")
-        tree.heading("Best Time", text="Best Time")
-        
-        tree.column("Rank", width=60, anchor="center")
-        tree.column("Name", width=120, anchor="w")
-        tree.column("Score", width=80, anchor="center")
-        tree.column("Games", width=70, anchor="center")
-        tree.column("Win Rate", width=70, anchor="center")
-        tree.column("Best Time", width=90, anchor="center")
-        
-        # Populate leaderboard
-        leaderboard_data = self.leaderboard_manager.get_sorted_leaderboard()
-        for i, entry in enumerate(leaderboard_data[:10], 1):
-            tree.insert("", "end", values=(
-                f"#{i}",
-                entry.get('name', 'Anonymous'),
-                entry.get('score', 0),
-                entry.get('games', 0),
-                f"{entry.get('win_rate', 0)}%",
-                f"{entry.get('best_time', 0):.1f}s"
-            ))
-        
-        tree.pack(fill="both", expand=True)
-        
-        # Close button
-        ttk.Button(
-            content_frame,
-            text="Close",
-            command=modal.destroy,
-            bootstyle="secondary"
-        ).pack(pady=10)
+        """Show the leaderboard modal (shared with the game screen)"""
+        show_leaderboard(self.root, self.services)
     
     def show_instructions(self):
         """Show the instructions modal"""
-        self.close_current_modal()
-        
-        # Create modal window
-        modal = tk.Toplevel(self.root)
-        modal.title("📖 How to Play")
-        modal.geometry("600x500")
-        modal.transient(self.root)
-        modal.grab_set()
-        modal.configure(bg='#2c3e50')
-        
-        self.current_modal = modal
-        
+        self.modals.show("instructions", self.build_instructions, "📖 How to Play", "600x500")
+    
+    def build_instructions(self, modal):
+        """Lay out the instructions modal (once; it is static)"""
         # Header
         header_frame = ttk.Frame(modal, padding=20)
         header_frame.pack(fill="x")
@@ -638,24 +514,17 @@ Good luck, and may the cards be with you! 🃏"""
         ttk.Button(
             content_frame,
             text="Close",
-            command=modal.destroy,
+            command=self.close_current_modal,
             bootstyle="secondary"
         ).pack(pady=10)
     
     def show_settings(self):
         """Show the settings modal with keybind configuration"""
-        self.close_current_modal()
-        
-        # Create modal window
-        modal = tk.Toplevel(self.root)
-        modal.title("⚙️ Settings")
-        modal.geometry("500x600")
-        modal.transient(self.root)
-        modal.grab_set()
-        modal.configure(bg='#2c3e50')
-        
-        self.current_modal = modal
-        
+        self.modals.show("settings", self.build_settings, "⚙️ Settings", "500x700",
+                         on_hide=self.stop_keybind_recording)
+    
+    def build_settings(self, modal):
+        """Lay out the settings modal once; returns the refresh run on each reopen"""
         # Header
         header_frame = ttk.Frame(modal, padding=20)
         header_frame.pack(fill="x")
@@ -680,7 +549,9 @@ Good luck, and may the cards be with you! 🃏"""
             ("instructions", "Show/Hide Instructions"),
             ("leaderboard", "Show Leaderboard"),
             ("settings", "Open Settings"),
-            ("submit", "Submit Guess"),
+            ("submit", "Ask Question (in game)"),
+            ("hint", "Hint (in game)"),
+            ("guess", "Guess Last Card (in game)"),
             ("close", "Close Modal")
         ]
         
@@ -752,32 +623,35 @@ Good luck, and may the cards be with you! 🃏"""
         ttk.Button(
             content_frame,
             text="Close",
-            command=modal.destroy,
+            command=self.close_current_modal,
             bootstyle="secondary"
         ).pack(pady=10)
+        return self.refresh_settings
+    
+    def refresh_settings(self):
+        """Re-read the values shown in the (reused) settings modal"""
+        for action, button in self.keybind_buttons.items():
+            button.configure(text=self.settings_manager.get_keybind(action), bootstyle="primary")
+        self.sound_var.set(self.settings_manager.settings.get("sound_enabled", True))
+        self.anim_var.set(self.settings_manager.settings.get("animations_enabled", True))
     
     def start_keybind_recording(self, action, button):
         """Start recording a new keybind"""
-        print(f"start_keybind_recording called: action={action}")  # Debug
         # Pass the current modal window to the recorder
         self.keybind_recorder.start_recording(action, button, self.current_modal)
     
     def update_keybind(self, action, key):
         """Update keybind after recording"""
-        print(f"update_keybind called: action={action}, key={key}")  # Debug
         
         success, message = self.settings_manager.set_keybind(action, key)
-        print(f"set_keybind result: success={success}, message={message}")  # Debug
         
         if success:
             # Update the button text
             if action in self.keybind_buttons:
                 self.keybind_buttons[action].configure(text=key, bootstyle="primary")
-                print(f"Updated button text to: {key}")  # Debug
             
             # Re-setup global keybinds
             self.setup_keybinds()
-            print("Re-setup keybinds")  # Debug
         else:
             messagebox.showwarning("Keybind Error", message)
             # Reset button text to original
@@ -811,11 +685,19 @@ Good luck, and may the cards be with you! 🃏"""
         self.settings_manager.settings["animations_enabled"] = self.anim_var.get()
         self.settings_manager.save_settings()
     
+    @property
+    def current_modal(self):
+        """The modal being shown, if any"""
+        return self.modals.window
+    
     def close_current_modal(self):
-        """Close the current modal if any"""
-        if self.current_modal and self.current_modal.winfo_exists():
-            self.current_modal.destroy()
-            self.current_modal = None
+        """Hide the current modal if any (it is kept for the next time)"""
+        self.modals.hide()
+    
+    def stop_keybind_recording(self):
+        """Settings modal hidden by any route: a half-done recording is cancelled"""
+        if self.keybind_recorder.recording:
+            self.keybind_recorder.cancel_recording()
 
 # Test function (for standalone testing)
 def test_main_menu():
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+modals.py
+
+Modal dialogs for Clash Royale — Guess Who?
+Each dialog is built once per window and then hidden with withdraw() and
+brought back with deiconify(), so opening it again costs a grab and a
+redraw instead of a new widget tree. A dialog's builder may return a
+refresh() that runs on every later show; it should only touch what changed
+while the dialog was hidden (the leaderboard diffs its rows).
+"""
+
+import tkinter as tk
+import weakref
+from tkinter import ttk
+from typing import Callable, Dict, Optional
+
+from keybindings import KeyBindings
+from leaderboard_store import DEFAULT_TOP_N, normalize_name
+from services import LEADERBOARD_CHANGED
+
+MODAL_BG = '#2c3e50'
+MODAL_SCOPE = "modal"
+
+
+class ModalCache:
+    """The dialogs of one window, built on first use; at most one is shown"""
+
+    _instances = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def for_window(cls, root) -> "ModalCache":
+        """Shared cache for a top-level window (menu and game use the same dialogs)"""
+        cache = cls._instances.get(root)
+        if cache is None:
+            cache = cls._instances[root] = cls(root)
+        return cache
+
+    def __init__(self, root):
+        self.root = root
+        self.windows: Dict[str, tk.Toplevel] = {}
+        self.refreshers: Dict[str, Optional[Callable]] = {}
+        self.hide_hooks: Dict[str, Optional[Callable]] = {}
+        self.current = None
+        # Dialogs only answer the "modal" scope; the menu rebinds it to the configured close key
+        self.keybindings = KeyBindings.for_window(root)
+        self.keybindings.set_bindings(MODAL_SCOPE, {"close": "Esc"}, {"close": self.hide})
+
+    @property
+    def window(self) -> Optional[tk.Toplevel]:
+        """The dialog currently shown, if any"""
+        return self.windows.get(self.current) if self.current else None
+
+    def show(self, name: str, build: Callable, title: str, geometry: str,
+             on_hide: Callable = None) -> tk.Toplevel:
+        """Show a dialog, building it with build(window) the first time.
+
+        on_hide() runs whenever the dialog is hidden, however that happens
+        (Close button, Esc, the window's close button, another dialog opening).
+        """
+        self.hide()
+        self.hide_hooks[name] = on_hide
+        window = self.windows.get(name)
+        if window is None or not window.winfo_exists():
+            window = tk.Toplevel(self.root)
+            window.withdraw()
+            window.title(title)
+            window.geometry(geometry)
+            window.transient(self.root)
+            window.configure(bg=MODAL_BG)
+            window.protocol("WM_DELETE_WINDOW", self.hide)
+            # The close key still works while the dialog has focus
+            self.keybindings.attach(window, MODAL_SCOPE)
+            self.windows[name] = window
+            self.refreshers[name] = build(window)
+        elif self.refreshers.get(name):
+            self.refreshers[name]()
+        window.deiconify()
+        window.lift()
+        window.grab_set()
+        window.focus_set()
+        self.current = name
+        return window
+
+    def hide(self):
+        """Withdraw the shown dialog; its widgets are kept for next time"""
+        name, window = self.current, self.window
+        if name is None:
+            return
+        self.current = None
+        if window.winfo_exists():
+            window.grab_release()
+            window.withdraw()
+            self.root.focus_set()
+        if self.hide_hooks.get(name):
+            self.hide_hooks[name]()
+
+
+# ---------- LEADERBOARD ----------
+LEADERBOARD_COLUMNS = (
+    # (column, heading, width, anchor)
+    ("Rank", "Rank", 60, "center"),
+    ("Name", "Player", 120, "w"),
+    ("Score", "Score", 80, "center"),
+    ("Games", "Games", 70, "center"),
+    ("Win Rate", "Win %", 70, "center"),
+    ("Best Time", "Best Time", 90, "center"),
+)
+
+
+def leaderboard_row(rank: int, entry: dict) -> tuple:
+    """Treeview values for one leaderboard entry"""
+    return (
+        f"#{rank}",
+        entry.get('name', 'Anonymous'),
+        entry.get('score', 0),
+        entry.get('games', 0),
+        f"{entry.get('win_rate', 0)}%",
+        f"{entry['best_time']:.1f}s" if entry.get('best_time') is not None else "—",
+    )
+
+
+class LeaderboardTable:
+    """Top-N Treeview that only rewrites the rows that changed"""
+
+    def __init__(self, parent, leaderboard_manager, events, limit: int = DEFAULT_TOP_N):
+        self.leaderboard_manager = leaderboard_manager
+        self.limit = limit
+        self.tree = ttk.Treeview(parent, columns=[c[0] for c in LEADERBOARD_COLUMNS],
+                                 show="headings", height=12)
+        for column, heading, width, anchor in LEADERBOARD_COLUMNS:
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=width, anchor=anchor)
+        self.rows: Dict[str, tuple] = {}     # item id (player key) -> values shown
+        self.dirty = True
+
+        # A new score marks the table stale; it is redrawn now if visible,
+        # otherwise the next time the dialog is shown
+        unsubscribe = events.subscribe(LEADERBOARD_CHANGED, self._changed)
+        self.tree.bind("<Destroy>", lambda e: unsubscribe(), add="+")
+        self.refresh()
+
+    def _changed(self, **_):
+        self.dirty = True
+        if self.tree.winfo_viewable():
+            self.refresh()
+
+    def refresh(self):
+        """Bring the rows in line with the store (no-op if nothing changed)"""
+        if not self.dirty:
+            return
+        self.dirty = False
+        wanted = []
+        for rank, entry in enumerate(self.leaderboard_manager.get_sorted_leaderboard(self.limit), 1):
+            wanted.append((normalize_name(entry.get('name', 'Anonymous')), leaderboard_row(rank, entry)))
+
+        keep = {iid for iid, _ in wanted}
+        stale = [iid for iid in self.rows if iid not in keep]
+        if stale:
+            self.tree.delete(*stale)
+            for iid in stale:
+                del self.rows[iid]
+        for position, (iid, values) in enumerate(wanted):
+            if iid not in self.rows:
+                self.tree.insert("", position, iid=iid, values=values)
+            else:
+                if self.rows[iid] != values:
+                    self.tree.item(iid, values=values)
+                if self.tree.index(iid) != position:
+                    self.tree.move(iid, "", position)
+            self.rows[iid] = values
+
+
+def show_leaderboard(root, services, limit: int = DEFAULT_TOP_N) -> tk.Toplevel:
+    """Show the shared leaderboard dialog for a window"""
+    modals = ModalCache.for_window(root)
+
+    def build(modal):
+        header_frame = ttk.Frame(modal, padding=20)
+        header_frame.pack(fill="x")
+        ttk.Label(
+            header_frame,
+            text="🏆 LEADERBOARD 🏆",
+            font=("Orbitron", 18, "bold"),
+            foreground="#f39c12"
+        ).pack()
+
+        content_frame = ttk.Frame(modal, padding=(20, 0, 20, 20))
+        content_frame.pack(fill="both", expand=True)
+        table = LeaderboardTable(content_frame, services.leaderboard, services.events, limit)
+        table.tree.pack(fill="both", expand=True)
+
+        ttk.Button(
+            content_frame,
+            text="Close",
+            command=modals.hide,
+            bootstyle="secondary"
+        ).pack(pady=10)
+        return table.refresh
+
+    return modals.show("leaderboard", build, "🏆 Leaderboard", "560x420")
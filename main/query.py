@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+query.py
+
+Question compiler for Clash Royale — Guess Who?
+Turns an (attribute, operator, value) question into a specialised predicate
+once, instead of re-parsing the value for every card on every question.
+
+Compound questions ("elixir in 3..5 and not flying",
+"role in {support, swarm}") are parsed into a small AST, cached by their
+normalized text, and answered by combining per-leaf candidate bitmasks
+with &, | and ~ -- one pass over all cards at once, however many clauses.
+"""
+
+import operator
+import re
+import weakref
+from functools import lru_cache
+from typing import Any, Callable, List, Tuple
+
+from cards import ATTRIBUTE_TYPES
+
+OPERATORS = ["=", ":", "<", "<=", ">", ">="]
+TRUE_WORDS = {"true", "1", "yes", "y", "t"}
+FALSE_WORDS = {"false", "0", "no", "n", "f"}
+
+_ORDERING = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+class QueryError(ValueError):
+    """A question that cannot be compiled (bad attribute, operator or value)"""
+
+
+class CompiledQuery:
+    """A parsed question: a predicate over attribute values plus cached masks"""
+
+    def __init__(self, attr: str, op: str, value: Any, predicate: Callable[[Any], bool]):
+        self.attr = attr
+        self.op = op
+        self.value = value
+        self.predicate = predicate
+        self._masks = weakref.WeakKeyDictionary()
+
+    def __call__(self, card_val) -> bool:
+        return self.predicate(card_val)
+
+    def mask(self, index) -> int:
+        """Mask of the cards in index that satisfy the question"""
+        if index not in self._masks:
+            self._masks[index] = index.mask_where(self.attr, self.predicate)
+        return self._masks[index]
+
+    def __repr__(self):
+        return f"CompiledQuery({self.attr} {self.op} {self.value!r})"
+
+
+def normalize_question(attr: str, op: str, raw: str) -> Tuple[str, str, str]:
+    """Canonical cache key for a question"""
+    op = op.strip()
+    if op == "==":
+        op = "="
+    return attr.strip().lower(), op, str(raw).strip().lower()
+
+
+@lru_cache(maxsize=64)
+def compile_predicate(kind: type, op: str, text: str) -> Tuple[Any, Callable[[Any], bool]]:
+    """Compile operator and (normalised) value text for one attribute type"""
+    if op not in OPERATORS:
+        raise QueryError(f"Unknown operator '{op}'")
+
+    if kind is bool:
+        if op not in ("=", ":"):
+            raise QueryError(f"Operator '{op}' does not apply to yes/no properties")
+        if text in TRUE_WORDS:
+            value = True
+        elif text in FALSE_WORDS:
+            value = False
+        else:
+            raise QueryError(f"'{text}' is not a yes/no value (try True or False)")
+        return value, lambda v: v == value
+
+    if kind is int:
+        try:
+            value = int(text)
+        except ValueError:
+            raise QueryError(f"'{text}' is not a whole number") from None
+        if op == "=":
+            return value, lambda v: v == value
+        if op == ":":
+            digits = str(value)
+            return value, lambda v: digits in str(v)
+        compare = _ORDERING[op]
+        return value, lambda v: compare(v, value)
+
+    if not text:
+        raise QueryError("Please enter a value to compare against")
+    if op == "=":
+        return text, lambda v: str(v).lower() == text
+    if op == ":":
+        return text, lambda v: text in str(v).lower()
+    raise QueryError(f"Operator '{op}' only applies to numeric properties")
+
+
+@lru_cache(maxsize=256)
+def _compile_question(attr: str, op: str, text: str) -> CompiledQuery:
+    if attr not in ATTRIBUTE_TYPES:
+        raise QueryError(f"Unknown property '{attr}'")
+    try:
+        value, predicate = compile_predicate(ATTRIBUTE_TYPES[attr], op, text)
+    except QueryError as e:
+        raise QueryError(f"Cannot compare {attr} with '{text}': {e}") from None
+    return CompiledQuery(attr, op, value, predicate)
+
+
+def compile_question(attr: str, op: str, raw: str) -> CompiledQuery:
+    """Compile a question, reusing the cached result for repeated questions.
+
+    Raises QueryError once for an invalid question rather than per card.
+    """
+    return _compile_question(*normalize_question(attr, op, raw))
+
+
+# ---------- EXPRESSIONS ----------
+KEYWORDS = {"and", "or", "not", "in"}
+_COMPARISONS = {"=", "==", ":", "<", "<=", ">", ">=", "!="}
+_TOKEN = re.compile(r"""\s*(?:
+    (?P<range>\.\.)
+  | (?P<punct>[(){},])
+  | (?P<op><=|>=|==|!=|=|:|<|>)
+  | "(?P<dq>[^"]*)"
+  | '(?P<sq>[^']*)'
+  | (?P<word>[^\s(){},<>=:!"'.]+(?:\.(?!\.)[^\s(){},<>=:!"'.]+)*)
+)""", re.VERBOSE)
+
+
+class AllOf:
+    """Conjunction: AND of the children's masks"""
+
+    def __init__(self, children):
+        self.children = children
+
+    def mask(self, index) -> int:
+        result = index.full_mask
+        for child in self.children:
+            result &= child.mask(index)
+            if not result:
+                break
+        return result
+
+    def __repr__(self):
+        return "(" + " and ".join(map(repr, self.children)) + ")"
+
+
+class AnyOf:
+    """Disjunction: OR of the children's masks"""
+
+    def __init__(self, children):
+        self.children = children
+
+    def mask(self, index) -> int:
+        result = 0
+        for child in self.children:
+            result |= child.mask(index)
+        return result
+
+    def __repr__(self):
+        return "(" + " or ".join(map(repr, self.children)) + ")"
+
+
+class Negation:
+    """NOT: complement of the child's mask within the index"""
+
+    def __init__(self, child):
+        self.child = child
+
+    def mask(self, index) -> int:
+        return index.full_mask & ~self.child.mask(index)
+
+    def __repr__(self):
+        return f"not {self.child!r}"
+
+
+class CompiledExpression:
+    """A parsed compound question; answers with one mask evaluation per index"""
+
+    def __init__(self, text: str, root):
+        self.text = text
+        self.root = root
+        self._masks = weakref.WeakKeyDictionary()
+
+    def mask(self, index) -> int:
+        """Mask of the cards in index that satisfy the whole expression"""
+        if index not in self._masks:
+            self._masks[index] = self.root.mask(index)
+        return self._masks[index]
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return f"CompiledExpression({self.root!r})"
+
+
+def tokenize(text: str) -> List[Tuple[str, str]]:
+    """Split an expression into (kind, text) tokens"""
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if not match or match.end() == pos:
+            raise QueryError(f"Unexpected '{text[pos:].strip()[:10]}' in question")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind in ("dq", "sq"):
+            kind = "value"
+        elif kind == "word" and value in KEYWORDS:
+            kind = value
+        tokens.append((kind, value))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive descent: or > and > not > comparison / (expr)"""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self, offset: int = 0):
+        i = self.pos + offset
+        return self.tokens[i] if i < len(self.tokens) else (None, None)
+
+    def take(self, kind: str = None, value: str = None) -> str:
+        tok_kind, tok_value = self.peek()
+        if tok_kind is None:
+            raise QueryError("Question ends too early")
+        if (kind and tok_kind != kind) or (value and tok_value != value):
+            raise QueryError(f"Expected {value or kind} but found '{tok_value}'")
+        self.pos += 1
+        return tok_value
+
+    def at(self, kind: str, value: str = None) -> bool:
+        tok_kind, tok_value = self.peek()
+        return tok_kind == kind and (value is None or tok_value == value)
+
+    def parse(self):
+        if not self.tokens:
+            raise QueryError("Please enter a question")
+        node = self.parse_or()
+        if self.pos < len(self.tokens):
+            raise QueryError(f"Unexpected '{self.peek()[1]}' in question")
+        return node
+
+    def parse_or(self):
+        children = [self.parse_and()]
+        while self.at("or"):
+            self.take()
+            children.append(self.parse_and())
+        return children[0] if len(children) == 1 else AnyOf(children)
+
+    def parse_and(self):
+        children = [self.parse_not()]
+        while self.at("and"):
+            self.take()
+            children.append(self.parse_not())
+        return children[0] if len(children) == 1 else AllOf(children)
+
+    def parse_not(self):
+        if self.at("not"):
+            self.take()
+            return Negation(self.parse_not())
+        return self.parse_atom()
+
+    def value(self) -> str:
+        kind, text = self.peek()
+        if kind not in ("word", "value"):
+            raise QueryError(f"Expected a value but found '{text}'" if text else "Question ends too early")
+        self.pos += 1
+        return text
+
+    def parse_atom(self):
+        if self.at("punct", "("):
+            self.take()
+            node = self.parse_or()
+            self.take("punct", ")")
+            return node
+
+        attr = self.take("word")
+        if attr not in ATTRIBUTE_TYPES:
+            raise QueryError(f"Unknown property '{attr}'")
+
+        if self.at("op"):
+            op = self.take()
+            if op not in _COMPARISONS:
+                raise QueryError(f"Unknown operator '{op}'")
+            raw = self.value()
+            if op == "!=":
+                return Negation(_compile_question(attr, "=", raw))
+            return _compile_question(attr, "=" if op == "==" else op, raw)
+
+        negate = False
+        if self.at("not") and self.peek(1)[0] == "in":
+            self.take()
+            negate = True
+        if self.at("in"):
+            self.take()
+            node = self.parse_membership(attr)
+            return Negation(node) if negate else node
+
+        # A bare yes/no property reads as "is it?" ("not flying")
+        if ATTRIBUTE_TYPES[attr] is bool:
+            return _compile_question(attr, "=", "true")
+        raise QueryError(f"Expected an operator after '{attr}'")
+
+    def parse_membership(self, attr: str):
+        if self.at("punct", "{"):
+            self.take()
+            values = [self.value()]
+            while self.at("punct", ","):
+                self.take()
+                values.append(self.value())
+            self.take("punct", "}")
+            leaves = [_compile_question(attr, "=", v) for v in values]
+            return leaves[0] if len(leaves) == 1 else AnyOf(leaves)
+
+        low = self.value()
+        self.take("range")
+        high = self.value()
+        return AllOf([_compile_question(attr, ">=", low), _compile_question(attr, "<=", high)])
+
+
+def normalize_expression(text: str) -> str:
+    """Canonical cache key for an expression"""
+    return " ".join(str(text).split()).lower()
+
+
+@lru_cache(maxsize=256)
+def _compile_expression(text: str) -> CompiledExpression:
+    return CompiledExpression(text, _Parser(tokenize(text)).parse())
+
+
+def compile_expression(text: str) -> CompiledExpression:
+    """Parse a compound question, reusing the cached AST for repeated text.
+
+    Raises QueryError for syntax errors and invalid comparisons.
+    """
+    return _compile_expression(normalize_expression(text))
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+screens.py
+
+Screen switching for Clash Royale — Guess Who?
+Each screen (main menu, game) is built once into its own frame and then
+shown or hidden with pack/pack_forget, so moving between them keeps their
+widgets, images and timers instead of destroying and rebuilding them.
+Screens may define on_show()/on_hide() to (de)activate per-screen state
+such as key bindings.
+"""
+
+from tkinter import ttk
+from typing import Callable, Dict
+
+
+class ScreenManager:
+    """Builds screens lazily, once, and keeps exactly one of them packed"""
+
+    def __init__(self, root):
+        self.root = root
+        self.factories: Dict[str, Callable] = {}
+        self.frames: Dict[str, ttk.Frame] = {}
+        self.screens: Dict[str, object] = {}
+        self.current = None
+
+    def register(self, name: str, factory: Callable):
+        """factory(parent_frame) -> screen object"""
+        self.factories[name] = factory
+
+    def built(self, name: str) -> bool:
+        return name in self.screens
+
+    def show(self, name: str):
+        """Show a screen, building it on first use; returns the screen object"""
+        if name == self.current:
+            return self.screens[name]
+        if self.current is not None:
+            self._call(self.screens[self.current], "on_hide")
+            self.frames[self.current].pack_forget()
+        if name not in self.screens:
+            frame = ttk.Frame(self.root)
+            self.frames[name] = frame
+            frame.pack(fill="both", expand=True)
+            self.screens[name] = self.factories[name](frame)
+        else:
+            self.frames[name].pack(fill="both", expand=True)
+        self.frames[name].tkraise()
+        self.current = name
+        self._call(self.screens[name], "on_show")
+        return self.screens[name]
+
+    @staticmethod
+    def _call(screen, hook: str):
+        method = getattr(screen, hook, None)
+        if method is not None:
+            method()
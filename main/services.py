@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+services.py
+
+Application-wide services for Clash Royale — Guess Who?
+The settings and leaderboard stores are loaded once per process and shared
+by every screen, and an event bus tells open views when they change, so
+switching between the menu and the game never goes back to disk.
+"""
+
+from collections import defaultdict
+from typing import Callable, Dict, List
+
+# Event names
+LEADERBOARD_CHANGED = "leaderboard_changed"   # payload: entry=<player dict>
+SETTINGS_CHANGED = "settings_changed"         # payload: settings=<settings dict>
+
+
+class EventBus:
+    """Minimal synchronous publish/subscribe"""
+
+    def __init__(self):
+        self.subscribers: Dict[str, List[Callable]] = defaultdict(list)
+
+    def subscribe(self, event: str, callback: Callable) -> Callable:
+        """Register a callback; returns a function that unsubscribes it"""
+        self.subscribers[event].append(callback)
+
+        def unsubscribe():
+            if callback in self.subscribers[event]:
+                self.subscribers[event].remove(callback)
+        return unsubscribe
+
+    def publish(self, event: str, **payload):
+        for callback in list(self.subscribers[event]):
+            try:
+                callback(**payload)
+            except Exception as e:
+                print(f"Error in {event} handler: {e}")
+
+
+class Services:
+    """Lazily created, process-wide managers plus the event bus"""
+
+    def __init__(self):
+        self.events = EventBus()
+        self._settings = None
+        self._leaderboard = None
+
+    @property
+    def settings(self):
+        if self._settings is None:
+            from main_menu import SettingsManager
+            self._settings = SettingsManager(events=self.events)
+        return self._settings
+
+    @property
+    def leaderboard(self):
+        if self._leaderboard is None:
+            from main_menu import LeaderboardManager
+            self._leaderboard = LeaderboardManager(events=self.events)
+        return self._leaderboard
+
+    def flush(self):
+        """Persist anything still buffered (call before the window closes)"""
+        if self._settings is not None:
+            self._settings.flush()
+
+
+_services = None
+
+
+def get_services() -> Services:
+    """The shared registry, created on first use"""
+    global _services
+    if _services is None:
+        _services = Services()
+    return _services
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+simulator.py
+
+Monte Carlo simulator for Clash Royale — Guess Who?
+Plays many headless games with pluggable questioning strategies across a
+process pool and reports how many turns each strategy needs to find the
+secret card. Workers send back histograms, never individual games, so
+memory stays flat no matter how many games are played.
+
+Usage: python simulator.py --games 100000 --workers 8
+"""
+
+import argparse
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from game_engine import GameEngine
+from query import compile_question
+
+MAX_TURNS = 200
+
+
+# ---------- STRATEGIES ----------
+def _split(question, total):
+    _, _, _, yes = question
+    return min(yes, total - yes)
+
+
+def random_strategy(engine: GameEngine, rng: random.Random):
+    """Any question that splits the remaining cards, chosen uniformly"""
+    questions = list(engine.hint_solver.questions())
+    return rng.choice(questions) if questions else None
+
+
+def greedy_strategy(engine: GameEngine, rng: random.Random):
+    """Most balanced 'property = value' question (no ranges), like a careful player"""
+    total = engine.remaining
+    best = None
+    for question in engine.hint_solver.questions():
+        if question[1] == "=" and (best is None or _split(question, total) > _split(best, total)):
+            best = question
+    return best
+
+
+def entropy_strategy(engine: GameEngine, rng: random.Random):
+    """Highest expected information gain over every question, ranges included"""
+    suggestion = engine.hint()
+    return suggestion and (suggestion.attr, suggestion.op, suggestion.value, suggestion.yes)
+
+
+STRATEGIES: Dict[str, Callable] = {
+    "random": random_strategy,
+    "greedy": greedy_strategy,
+    "entropy": entropy_strategy,
+}
+
+
+def play_game(engine: GameEngine, strategy: Callable, rng: random.Random) -> int:
+    """Play one game to the end; return the number of turns (questions + guesses)"""
+    engine.new_game()
+    while engine.questions_asked + engine.guesses_made < MAX_TURNS:
+        question = strategy(engine, rng) if engine.remaining > 1 else None
+        if question is not None:
+            attr, op, value, _ = question
+            engine.ask_query(compile_question(attr, op, str(value)))
+            continue
+        # Nothing left to ask: guess one of the remaining cards
+        if engine.guess(rng.choice(engine.candidates)).correct:
+            break
+    return engine.questions_asked + engine.guesses_made
+
+
+# ---------- AGGREGATES ----------
+class Distribution:
+    """Histogram of turns-to-solve for one strategy"""
+
+    def __init__(self, counts: Dict[int, int] = None):
+        self.counts = Counter(counts or {})
+
+    def merge(self, counts: Dict[int, int]):
+        self.counts.update(counts)
+
+    @property
+    def games(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def mean(self) -> float:
+        games = self.games
+        return sum(k * v for k, v in self.counts.items()) / games if games else 0.0
+
+    def percentile(self, pct: float) -> int:
+        target = pct / 100 * self.games
+        running = 0
+        for turns in sorted(self.counts):
+            running += self.counts[turns]
+            if running >= target:
+                return turns
+        return 0
+
+    def summary(self) -> str:
+        if not self.counts:
+            return "no games"
+        return (f"games={self.games} mean={self.mean:.2f} p50={self.percentile(50)} "
+                f"p90={self.percentile(90)} max={max(self.counts)}")
+
+
+# ---------- WORKERS ----------
+_worker_engine = None
+
+
+def _run_chunk(strategy_name: str, games: int, seed: int) -> Tuple[str, Dict[int, int]]:
+    """Worker entry point: play a chunk of games, return only the histogram"""
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = GameEngine()
+    rng = random.Random(seed)
+    _worker_engine.rng = rng
+    strategy = STRATEGIES[strategy_name]
+    counts = Counter(play_game(_worker_engine, strategy, rng) for _ in range(games))
+    return strategy_name, dict(counts)
+
+
+def _chunks(games: int, strategies: Iterable[str], chunk_size: int, seed: int) -> Iterator[Tuple[str, int, int]]:
+    """Round-robin the strategies so every partial aggregate covers all of them"""
+    seeds = random.Random(seed)
+    for start in range(0, games, chunk_size):
+        size = min(chunk_size, games - start)
+        for name in strategies:
+            yield name, size, seeds.getrandbits(64)
+
+
+def iter_simulate(games: int, strategies: Iterable[str] = tuple(STRATEGIES), workers: int = None,
+                  chunk_size: int = 2000, seed: int = None) -> Iterator[Dict[str, Distribution]]:
+    """Run the simulation, yielding the running aggregates after every chunk.
+
+    At most two chunks per worker are in flight, so memory does not grow
+    with the number of games.
+    """
+    strategies = list(strategies)
+    for name in strategies:
+        if name not in STRATEGIES:
+            raise ValueError(f"Unknown strategy '{name}' (choose from {', '.join(STRATEGIES)})")
+    workers = workers or os.cpu_count() or 1
+    results = {name: Distribution() for name in strategies}
+    pending_chunks = _chunks(games, strategies, chunk_size, seed)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = set()
+        for _ in range(workers * 2):
+            chunk = next(pending_chunks, None)
+            if chunk:
+                in_flight.add(pool.submit(_run_chunk, *chunk))
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, counts = future.result()
+                results[name].merge(counts)
+                chunk = next(pending_chunks, None)
+                if chunk:
+                    in_flight.add(pool.submit(_run_chunk, *chunk))
+            yield results
+
+
+def simulate(games: int, strategies: Iterable[str] = tuple(STRATEGIES), workers: int = None,
+             chunk_size: int = 2000, seed: int = None,
+             on_progress: Optional[Callable[[Dict[str, Distribution]], None]] = None) -> Dict[str, Distribution]:
+    """Play games per strategy and return the turns-to-solve distributions"""
+    results = {}
+    for results in iter_simulate(games, strategies, workers, chunk_size, seed):
+        if on_progress:
+            on_progress(results)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate Guess Who games with different strategies")
+    parser.add_argument("--games", type=int, default=10000, help="games per strategy")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--strategies", nargs="+", default=list(STRATEGIES), choices=list(STRATEGIES))
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    last_report = 0.0
+
+    def report(results):
+        nonlocal last_report
+        now = time.perf_counter()
+        if now - last_report >= 1.0:
+            last_report = now
+            done = sum(d.games for d in results.values())
+            print(f"  ... {done} games in {now - start:.1f}s")
+
+    results = simulate(args.games, args.strategies, args.workers, args.chunk_size, args.seed, report)
+    elapsed = time.perf_counter() - start
+    total = sum(d.games for d in results.values())
+    print(f"Played {total} games in {elapsed:.1f}s ({total / elapsed:,.0f} games/s)")
+    for name, distribution in results.items():
+        print(f"{name:>8}: {distribution.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+startup_profile.py
+
+Cold-start benchmark for Clash Royale — Guess Who?
+The game calls mark() at the end of each startup phase; marks are free
+unless CLASH_STARTUP_REPORT=1. Running this module launches the game that
+way several times, and reports how long each phase took, measured from
+process start to the first interactive menu frame.
+
+    python main/startup_profile.py --runs 5
+"""
+
+import os
+import sys
+import time
+
+REPORT_ENV = "CLASH_STARTUP_REPORT"
+ENABLED = os.environ.get(REPORT_ENV) == "1"
+PREFIX = "STARTUP"
+
+_marks = []
+
+
+def mark(phase: str):
+    """Record the end of a startup phase (no-op unless profiling)"""
+    if ENABLED:
+        _marks.append((phase, time.time()))
+
+
+def report():
+    """Print the recorded marks for the benchmark runner to parse"""
+    for phase, stamp in _marks:
+        print(f"{PREFIX} {phase} {stamp:.6f}", flush=True)
+
+
+# ---------- BENCHMARK ----------
+def run_once(script: str):
+    """Launch the game once; returns [(phase, seconds spent in it)]"""
+    import subprocess
+    env = dict(os.environ, **{REPORT_ENV: "1"})
+    started = time.time()
+    # The game resolves card images, settings and the leaderboard from the repo root
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(script)))
+    proc = subprocess.run([sys.executable, os.path.abspath(script)], env=env, capture_output=True, text=True,
+                          cwd=repo_root, timeout=120)
+    phases, previous = [], started
+    for line in proc.stdout.splitlines():
+        if line.startswith(PREFIX + " "):
+            _, phase, stamp = line.split()
+            phases.append((phase, float(stamp) - previous))
+            previous = float(stamp)
+    if not phases:
+        raise RuntimeError(f"no startup marks from {script}:\n{proc.stderr.strip()}")
+    return phases
+
+
+def main():
+    import argparse
+    import statistics
+    parser = argparse.ArgumentParser(description="Measure time from process start to the first menu frame")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--script", default=os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                         "clash_royale_game.py"))
+    args = parser.parse_args()
+
+    runs = [run_once(args.script) for _ in range(args.runs)]
+    names = [phase for phase, _ in runs[0]]
+    print(f"{'phase':<16}{'median ms':>12}{'min ms':>10}")
+    for i, name in enumerate(names):
+        samples = [run[i][1] * 1000 for run in runs if len(run) > i]
+        print(f"{name:<16}{statistics.median(samples):>12.1f}{min(samples):>10.1f}")
+    totals = [sum(t for _, t in run) * 1000 for run in runs]
+    print(f"{'total':<16}{statistics.median(totals):>12.1f}{min(totals):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+thumbnail_cache.py
+
+Persistent thumbnail cache for Clash Royale — Guess Who?
+Resized RGBA thumbnails are stored as raw pixel files keyed by the source
+file's identity (path, mtime, size) plus the thumbnail size and fade flag,
+so later games skip WebP decoding and LANCZOS resampling entirely. The
+cache is capped in bytes and evicts least recently used entries.
+"""
+
+import hashlib
+import os
+import struct
+import threading
+from typing import Optional
+
+from PIL import Image
+
+MAGIC = b"CRTH"
+_HEADER = struct.Struct("<4sHH")   # magic, width, height
+DEFAULT_CACHE_DIR = os.path.join("data", "thumb_cache")
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+class ThumbnailCache:
+    """Content-addressed on-disk store of raw RGBA thumbnails with LRU eviction"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.total_bytes = None  # computed lazily on first write
+
+    def key(self, path: str, size, fade: bool) -> Optional[str]:
+        """Cache key for a source image, or None if the file is missing"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        ident = f"{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}|{size[0]}x{size[1]}|{int(bool(fade))}"
+        return hashlib.sha1(ident.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".rgba")
+
+    def get(self, path: str, size, fade: bool = False) -> Optional[Image.Image]:
+        """Cached thumbnail, or None on a miss"""
+        key = self.key(path, size, fade)
+        if key is None:
+            return None
+        entry = self._path(key)
+        try:
+            with open(entry, "rb") as f:
+                data = f.read()
+            magic, width, height = _HEADER.unpack_from(data, 0)
+            if magic != MAGIC or len(data) != _HEADER.size + width * height * 4:
+                raise ValueError("corrupt thumbnail cache entry")
+            os.utime(entry)  # mark as recently used
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Discarding thumbnail cache entry {key}: {e}")
+            self._remove(entry)
+            return None
+        return Image.frombytes("RGBA", (width, height), data[_HEADER.size:])
+
+    def put(self, path: str, size, fade: bool, image: Image.Image):
+        """Store a thumbnail (written atomically), evicting old entries if over the cap"""
+        key = self.key(path, size, fade)
+        if key is None:
+            return
+        image = image.convert("RGBA")
+        payload = _HEADER.pack(MAGIC, image.width, image.height) + image.tobytes()
+        entry = self._path(key)
+        tmp = f"{entry}.{threading.get_ident()}.tmp"
+        try:
+            replaced = os.path.getsize(entry)   # overwriting: don't count the old entry twice
+        except OSError:
+            replaced = 0
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, entry)
+        except OSError as e:
+            print(f"Error writing thumbnail cache: {e}")
+            self._remove(tmp)
+            return
+
+        with self.lock:
+            if self.total_bytes is None:
+                self.total_bytes = self._scan_size()
+            else:
+                self.total_bytes += len(payload) - replaced
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def _scan_size(self) -> int:
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".rgba"):
+                try:
+                    total += os.path.getsize(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+        return total
+
+    def _evict(self):
+        """Delete least recently used entries until under 90% of the cap"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".rgba"):
+                full = os.path.join(self.cache_dir, name)
+                try:
+                    st = os.stat(full)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, full))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for _, size, full in entries:
+            if total <= target:
+                break
+            if self._remove(full):
+                total -= size
+        self.total_bytes = total
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
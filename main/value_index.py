@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+value_index.py
+
+Live value suggestions for Clash Royale — Guess Who?
+Wraps the index's attribute -> value -> bitset map with the current
+candidate mask, so per-value counts and "would eliminate N cards" previews
+are a few big-int ANDs and popcounts. Counts are cached per candidate mask
+and only recomputed after a question actually eliminates cards; nothing
+here walks the candidate list.
+"""
+
+import difflib
+from typing import Any, Dict, List, Optional, Tuple
+
+from candidate_set import CandidateIndex, CandidateSet, popcount
+from cards import ATTRIBUTE_TYPES
+from query import QueryError, compile_expression, compile_question, normalize_question
+
+
+def value_text(value: Any) -> str:
+    """How a value is typed into the question bar"""
+    return str(value)
+
+
+class ValueIndex:
+    """Attribute -> value -> candidate bitset, with counts kept in step with the game"""
+
+    def __init__(self, index: CandidateIndex, candidate_set: CandidateSet):
+        self.index = index
+        self.candidate_set = candidate_set
+        self._counts: Dict[str, Tuple[int, Dict[Any, int]]] = {}
+
+    def live_mask(self, attr: str, value: Any) -> int:
+        """Candidates still in play that hold this value"""
+        return self.index.value_masks[attr].get(value, 0) & self.candidate_set.mask
+
+    def counts(self, attr: str) -> Dict[Any, int]:
+        """Value -> number of remaining candidates holding it (values with none are dropped)"""
+        mask = self.candidate_set.mask
+        cached = self._counts.get(attr)
+        if cached is not None and cached[0] == mask:
+            return cached[1]
+        counts = {}
+        for value, value_mask in self.index.value_masks[attr].items():
+            n = popcount(value_mask & mask)
+            if n:
+                counts[value] = n
+        self._counts[attr] = (mask, counts)
+        return counts
+
+    def completions(self, attr: str, prefix: str = "") -> List[Tuple[str, int]]:
+        """(value text, remaining count) for values starting with prefix, most common first"""
+        prefix = prefix.strip().lower()
+        matches = [(value_text(v), n) for v, n in self.counts(attr).items()
+                   if value_text(v).lower().startswith(prefix)]
+        matches.sort(key=lambda item: (-item[1], item[0]))
+        return matches
+
+    def split(self, query) -> Tuple[int, int]:
+        """(matching, not matching) among the remaining candidates for a compiled question"""
+        mask = self.candidate_set.mask
+        yes = popcount(query.mask(self.index) & mask)
+        return yes, popcount(mask) - yes
+
+    def _unknown_value(self, attr: str, op: str, raw: str) -> Optional[str]:
+        """Warning for an exact text match against a value no card has (usually a typo)"""
+        attr, op, text = normalize_question(attr, op, raw)
+        if op != "=" or ATTRIBUTE_TYPES.get(attr) is not str:
+            return None
+        known = [value_text(v).lower() for v in self.index.value_masks.get(attr, {})]
+        # A prefix of a known value is most likely still being typed
+        if any(v.startswith(text) for v in known):
+            return None
+        close = difflib.get_close_matches(text, known, n=1)
+        hint = f" — did you mean {close[0]}?" if close else ""
+        return f"⚠ No card has {attr} '{raw.strip()}'{hint}"
+
+    def preview(self, attr: str, op: str, raw: str, expression: bool = False) -> Optional[str]:
+        """'Would eliminate' text for a question being typed, or None if there is nothing to show"""
+        if not raw.strip():
+            return None
+        try:
+            query = compile_expression(raw) if expression else compile_question(attr, op, raw)
+        except QueryError as e:
+            return f"⚠ {e}"
+        if not expression:
+            typo = self._unknown_value(attr, op, raw)
+            if typo:
+                return typo
+        yes, no = self.split(query)
+        if not yes or not no:
+            return f"Would eliminate 0 cards — all {yes + no} answer the same"
+        return f"Yes → would eliminate {no} cards · No → would eliminate {yes} cards"
@@ -0,0 +1,55 @@
+import random
+
+from candidate_set import CandidateIndex, CandidateSet, iter_bits, mask_from_positions, popcount
+from cards import ATTRIBUTES, CARDS, CARD_TABLE
+
+INDEX = CandidateIndex(CARDS, ATTRIBUTES)
+
+
+def test_popcount_matches_bin():
+    rng = random.Random(7)
+    for _ in range(100):
+        mask = rng.getrandbits(rng.randrange(1, 500))
+        assert popcount(mask) == bin(mask).count("1")
+    assert popcount(0) == 0
+
+
+def test_iter_bits_round_trips_positions():
+    rng = random.Random(11)
+    positions = sorted(rng.sample(range(5000), 300))
+    assert list(iter_bits(mask_from_positions(positions, 5000))) == positions
+    assert list(iter_bits(0)) == []
+    assert list(iter_bits(1 << 4096)) == [4096]
+
+
+def test_index_from_table_matches_card_list():
+    table_index = CandidateIndex.from_table(CARD_TABLE)
+    assert table_index.full_mask == INDEX.full_mask
+    assert table_index.value_masks == INDEX.value_masks
+
+
+def test_mask_where_unions_matching_values():
+    mask = INDEX.mask_where("elixir", lambda v: v <= 3)
+    assert {c.name for c in INDEX.cards_in(mask)} == {c.name for c in CARDS if c.elixir <= 3}
+
+
+def test_answer_keeps_matching_side_and_returns_removed():
+    flying = INDEX.value_masks["flying"][True]
+    yes = CandidateSet(INDEX)
+    removed = yes.answer(flying, True)
+    assert yes.mask == flying
+    assert removed == INDEX.full_mask & ~flying
+
+    no = CandidateSet(INDEX)
+    assert no.answer(flying, False) == flying
+    assert all(not card.flying for card in no)
+
+
+def test_discard_and_reset():
+    candidates = CandidateSet(INDEX)
+    card = CARDS[3]
+    assert candidates.discard(card) == INDEX.bit(card)
+    assert card not in candidates and len(candidates) == len(CARDS) - 1
+    assert candidates.discard(card) == 0
+    candidates.reset()
+    assert card in candidates and len(candidates) == len(CARDS)
@@ -0,0 +1,82 @@
+import os
+
+import pytest
+
+from candidate_set import CandidateIndex
+from cards import ATTRIBUTES, CARDS
+from decision_tree import LEAF, DecisionTree, cache_path, load_decision_tree
+
+INDEX = CandidateIndex(CARDS, ATTRIBUTES)
+
+
+@pytest.fixture(scope="module")
+def tree():
+    return DecisionTree.build(INDEX)
+
+
+def test_bytes_round_trip(tree):
+    loaded = DecisionTree.from_bytes(INDEX, tree.to_bytes())
+    assert loaded.questions == tree.questions
+    assert loaded.nodes == tree.nodes
+    assert loaded.by_mask == tree.by_mask
+
+
+def test_long_question_values_round_trip(tree):
+    attr, op, _ = tree.questions[0]
+    long_tree = DecisionTree(INDEX, [(attr, op, "x" * 1000)] + tree.questions[1:], tree.nodes)
+    loaded = DecisionTree.from_bytes(INDEX, long_tree.to_bytes())
+    assert loaded.questions[0] == (attr, op, "x" * 1000)
+
+
+def test_file_for_another_pool_is_rejected(tree):
+    smaller = CandidateIndex(CARDS[:-1], ATTRIBUTES)
+    with pytest.raises(ValueError):
+        DecisionTree.from_bytes(smaller, tree.to_bytes())
+    with pytest.raises(ValueError):
+        DecisionTree.from_bytes(INDEX, b"XXXX" + tree.to_bytes()[4:])
+
+
+def test_following_the_tree_isolates_every_card(tree):
+    for card in CARDS:
+        bit = INDEX.bit(card)
+        mask, questions = INDEX.full_mask, 0
+        while True:
+            node = tree.by_mask[mask]
+            question = tree.nodes[node][0]
+            if question == LEAF:
+                break
+            q_mask = tree.question_masks[question]
+            mask &= q_mask if q_mask & bit else ~q_mask
+            questions += 1
+        assert mask & bit
+        assert questions <= len(CARDS)
+    assert tree.expected_depth() < len(CARDS) / 2
+
+
+def test_suggest_matches_the_tree(tree):
+    suggestion = tree.suggest(INDEX.full_mask)
+    assert (suggestion.attr, suggestion.op, suggestion.value) == tree.question_for(INDEX.full_mask)
+    assert suggestion.total == len(CARDS)
+    assert 0 < suggestion.yes < suggestion.total
+    assert tree.suggest(0) is None
+
+
+def test_load_builds_once_then_reads_the_cache(tmp_path):
+    cache_dir = str(tmp_path)
+    built = load_decision_tree(INDEX, cache_dir)
+    path = cache_path(INDEX, cache_dir)
+    assert os.path.exists(path)
+
+    with open(path, "rb") as f:
+        data = f.read()
+    assert DecisionTree.from_bytes(INDEX, data).nodes == built.nodes
+    assert load_decision_tree(INDEX, cache_dir).nodes == built.nodes
+
+
+def test_corrupt_cache_file_is_rebuilt(tmp_path):
+    cache_dir = str(tmp_path)
+    path = cache_path(INDEX, cache_dir)
+    with open(path, "wb") as f:
+        f.write(b"garbage")
+    tree = load_decision_tree(INDEX, cache_dir)
+    assert tree.question_for(INDEX.full_mask) is not None
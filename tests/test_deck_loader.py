@@ -0,0 +1,118 @@
+import json
+import os
+
+import pytest
+
+from cards import CARD_TABLE, CARDS
+from deck_loader import DeckError, compile_deck, export_table, load_deck, read_deck, read_stamp, validate
+
+ROWS = [
+    {"name": "Knight", "rarity": "Common", "type": "troop", "elixir": 3, "melee": True,
+     "flying": False, "target": "ground", "role": "defense", "image_file": "knight.webp"},
+    {"name": "Minions", "rarity": "common", "type": "troop", "elixir": "3", "melee": "no",
+     "flying": "yes", "target": "both", "role": "swarm"},
+    {"name": "Fireball", "rarity": "rare", "card_type": "spell", "elixir": 4, "melee": "false",
+     "flying": "0", "target": "both", "role": "support", "image": "fireball.webp"},
+]
+
+
+def write_json(path, rows):
+    path.write_text(json.dumps(rows))
+    return str(path)
+
+
+def test_binary_round_trip_of_the_built_in_pool(tmp_path):
+    target = str(tmp_path / "builtin.crdk")
+    export_table(CARD_TABLE, target)
+    table = read_deck(target)
+    assert list(table) == CARDS
+    for attr in ("rarity", "elixir", "melee", "flying"):
+        assert table.value_masks(attr) == CARD_TABLE.value_masks(attr)
+
+
+def test_json_source_is_validated_and_normalized(tmp_path):
+    table = load_deck(write_json(tmp_path / "deck.json", ROWS), cache_dir=str(tmp_path / "cache"))
+    knight, minions, fireball = list(table)
+    assert knight.rarity == "common" and knight.melee and knight.image_file == "knight.webp"
+    assert minions.elixir == 3 and minions.flying and not minions.melee
+    assert minions.image_file is None
+    assert fireball.card_type == "spell" and fireball.image_file == "fireball.webp"
+
+
+def test_wrapped_json_and_csv_load_the_same_cards(tmp_path):
+    wrapped = tmp_path / "wrapped.json"
+    wrapped.write_text(json.dumps({"cards": ROWS[:2]}))
+    csv_path = tmp_path / "deck.csv"
+    csv_path.write_text(
+        "name,rarity,type,elixir,melee,flying,target,role,image_file\n"
+        "Knight,common,troop,3,true,false,ground,defense,knight.webp\n"
+        "Minions,common,troop,3,no,yes,both,swarm,\n"
+    )
+    cache = str(tmp_path / "cache")
+    assert list(load_deck(str(wrapped), cache_dir=cache)) == list(load_deck(str(csv_path), cache_dir=cache))
+
+
+def test_blank_flag_cells_read_as_false(tmp_path):
+    csv_path = tmp_path / "blank.csv"
+    csv_path.write_text(
+        "name,rarity,type,elixir,melee,flying,target,role\n"
+        "Knight,common,troop,3,true,,ground,defense\n"
+        "Zap,common,spell,2,,,both,support\n"
+    )
+    knight, zap = list(load_deck(str(csv_path), cache_dir=str(tmp_path / "cache")))
+    assert knight.melee and not knight.flying
+    assert not zap.melee and not zap.flying
+
+
+def test_compiled_deck_is_reused_until_the_source_changes(tmp_path):
+    source = write_json(tmp_path / "deck.json", ROWS)
+    cache = str(tmp_path / "cache")
+    load_deck(source, cache_dir=cache)
+    compiled = os.path.join(cache, "deck.crdk")
+    stamp = read_stamp(compiled)
+    mtime = os.stat(compiled).st_mtime_ns
+
+    load_deck(source, cache_dir=cache)
+    assert os.stat(compiled).st_mtime_ns == mtime
+
+    write_json(tmp_path / "deck.json", ROWS[:2])
+    os.utime(source, ns=(mtime + 10**9, mtime + 10**9))
+    assert len(load_deck(source, cache_dir=cache)) == 2
+    assert read_stamp(compiled) != stamp
+
+
+def test_validation_lists_every_bad_card():
+    rows = [
+        ROWS[0],
+        dict(ROWS[0]),                           # duplicate name
+        dict(ROWS[1], elixir="lots"),
+        dict(ROWS[2], flying="maybe"),
+        dict(ROWS[2], name="", rarity=""),
+    ]
+    with pytest.raises(DeckError) as excinfo:
+        validate(rows)
+    message = str(excinfo.value)
+    assert message.startswith("4 invalid card(s)")
+    assert "card 2: duplicate card name 'Knight'" in message
+    assert "card 3: elixir must be a whole number" in message
+    assert "card 4: flying must be true or false" in message
+    assert "card 5: name is required" in message
+
+
+def test_empty_deck_and_unknown_format_are_rejected(tmp_path):
+    with pytest.raises(DeckError, match="no cards"):
+        validate([])
+    other = tmp_path / "deck.txt"
+    other.write_text("Knight")
+    with pytest.raises(DeckError, match="unsupported deck format"):
+        load_deck(str(other), cache_dir=str(tmp_path))
+
+
+def test_truncated_binary_deck_is_rejected(tmp_path):
+    target = compile_deck(write_json(tmp_path / "deck.json", ROWS), str(tmp_path / "deck.crdk"))
+    with open(target, "rb") as f:
+        data = f.read()
+    with open(target, "wb") as f:
+        f.write(data[:-5])
+    with pytest.raises(DeckError, match="truncated or corrupt"):
+        read_deck(target)
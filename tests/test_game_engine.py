@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from cards import CARDS
+from game_engine import MIN_SCORE, GameEngine, score_for
+from query import QueryError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def engine(clock):
+    return GameEngine(rng=random.Random(1), clock=clock)
+
+
+def test_score_for():
+    assert score_for(0) == 1000
+    assert score_for(12.5) == 875
+    assert score_for(90) == MIN_SCORE
+    assert score_for(10_000) == MIN_SCORE
+
+
+def test_ask_eliminates_cards_that_disagree_with_the_secret(engine):
+    result = engine.ask("elixir", "<=", 3)
+    assert result.answer == (engine.secret.elixir <= 3)
+    assert all((card.elixir <= 3) == result.answer for card in engine.candidates)
+    assert engine.remaining + len(result.removed(engine.index)) == len(CARDS)
+    assert engine.secret in engine.candidate_set
+
+
+def test_invalid_question_raises(engine):
+    with pytest.raises(QueryError):
+        engine.ask("colour", "=", "blue")
+    assert engine.questions_asked == 0
+
+
+def test_correct_guess_scores_elapsed_time(engine, clock):
+    clock.now += 12.5
+    result = engine.guess(engine.secret)
+    assert result.correct and result.elapsed == 12.5 and result.score == 875
+    assert engine.finished and not engine.in_progress
+    clock.now += 30
+    assert engine.elapsed == 12.5
+
+
+def test_wrong_guess_discards_the_card(engine):
+    wrong = next(card for card in CARDS if card.name != engine.secret.name)
+    result = engine.guess(wrong)
+    assert not result.correct and result.score is None
+    assert wrong not in engine.candidate_set and not engine.finished
+
+
+def test_in_progress_only_after_a_move(engine):
+    assert not engine.in_progress
+    engine.ask("flying", "=", True)
+    assert engine.in_progress
+    engine.reset()
+    assert not engine.in_progress
+
+
+def test_give_up_ends_the_round(engine, clock):
+    engine.ask("type", "=", "spell")
+    clock.now += 7.25
+    assert engine.give_up() == 7.25
+    assert engine.finished and not engine.in_progress
+
+
+def test_new_game_puts_every_card_back(engine):
+    engine.ask("type", "=", "troop")
+    engine.new_game(CARDS[0])
+    assert engine.secret is CARDS[0]
+    assert engine.remaining == len(CARDS) and engine.questions_asked == 0
+
+
+def test_following_hints_finds_the_secret(engine):
+    for secret in CARDS:
+        engine.new_game(secret)
+        while engine.remaining > 1:
+            suggestion = engine.hint()
+            engine.ask(suggestion.attr, suggestion.op, suggestion.value_text)
+        assert engine.candidates == [secret]
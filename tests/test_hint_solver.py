@@ -0,0 +1,63 @@
+import math
+
+import pytest
+
+from candidate_set import CandidateIndex, popcount
+from cards import ATTRIBUTES, CARDS
+from hint_solver import HintSolver, split_entropy
+from query import compile_question
+
+INDEX = CandidateIndex(CARDS, ATTRIBUTES)
+
+
+def brute_force_gain(mask):
+    """Best split entropy over every question, counted card by card"""
+    total = popcount(mask)
+    best = 0.0
+    for attr, value_masks in INDEX.value_masks.items():
+        for value in value_masks:
+            ops = ["=", "<="] if type(value) is int else ["="]
+            for op in ops:
+                yes = popcount(compile_question(attr, op, str(value)).mask(INDEX) & mask)
+                best = max(best, split_entropy(yes, total))
+    return best
+
+
+def test_split_entropy():
+    assert split_entropy(5, 10) == 1.0
+    assert split_entropy(0, 10) == split_entropy(10, 10) == 0.0
+    assert split_entropy(1, 4) == pytest.approx(-(0.25 * math.log2(0.25) + 0.75 * math.log2(0.75)))
+    assert split_entropy(3, 10) == pytest.approx(split_entropy(7, 10))
+
+
+def test_best_question_has_the_highest_gain():
+    solver = HintSolver(INDEX)
+    best = solver.best_question()
+    assert best.gain == pytest.approx(brute_force_gain(INDEX.full_mask))
+    match_mask = compile_question(best.attr, best.op, best.value_text).mask(INDEX)
+    assert best.yes == popcount(match_mask) and best.no == len(CARDS) - best.yes
+
+
+def test_remove_matches_rebuilding_from_scratch():
+    solver = HintSolver(INDEX)
+    troops = compile_question("type", "=", "troop").mask(INDEX)
+    solver.remove(INDEX.full_mask & ~troops)
+    solver.remove(INDEX.bit(CARDS[0]))
+    rebuilt = HintSolver(INDEX, troops & ~INDEX.bit(CARDS[0]))
+    assert solver.mask == rebuilt.mask
+    assert solver.total == rebuilt.total
+    assert solver.histograms == rebuilt.histograms
+    assert solver.best_question().gain == pytest.approx(brute_force_gain(solver.mask))
+
+
+def test_remove_ignores_cards_already_gone():
+    solver = HintSolver(INDEX)
+    solver.remove(INDEX.bit(CARDS[0]))
+    before = (solver.total, {attr: dict(hist) for attr, hist in solver.histograms.items()})
+    solver.remove(INDEX.bit(CARDS[0]))
+    assert (solver.total, solver.histograms) == before
+
+
+def test_no_suggestion_once_one_card_is_left():
+    solver = HintSolver(INDEX, INDEX.bit(CARDS[5]))
+    assert solver.best_question() is None
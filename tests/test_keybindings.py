@@ -0,0 +1,132 @@
+from types import SimpleNamespace
+
+import pytest
+
+from keybindings import ALT_MASK, KeyBindings, canonical_key, event_key, is_printable
+
+
+class FakeWidget:
+    """Just enough of a Tk widget for KeyBindings: bind, focus_get, winfo_class"""
+
+    def __init__(self, widget_class="Frame"):
+        self.handlers = {}
+        self.widget_class = widget_class
+        self.focused = None
+
+    def bind(self, sequence, func, add=None):
+        self.handlers.setdefault(sequence, []).append(func)
+
+    def focus_get(self):
+        return self.focused
+
+    def winfo_class(self):
+        return self.widget_class
+
+    def destroy(self):
+        for func in self.handlers.get("<Destroy>", []):
+            func(SimpleNamespace(widget=self))
+
+
+def key(keysym, state=0):
+    return SimpleNamespace(keysym=keysym, state=state)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("h", "H"),
+    ("Return", "Enter"),
+    ("escape", "Esc"),
+    ("f5", "F5"),
+    ("ctrl+n", "Ctrl+N"),
+    ("Shift+control+N", "Ctrl+N"),
+    ("shift+h", "H"),
+    ("Shift+Tab", "Shift+Tab"),
+    ("Ctrl++", "Ctrl++"),
+    ("", ""),
+])
+def test_canonical_key(text, expected):
+    assert canonical_key(text) == expected
+
+
+def test_event_key_matches_canonical_names():
+    assert event_key(key("n", 0x4)) == canonical_key("Ctrl+N")
+    assert event_key(key("N", 0x1 | 0x4)) == canonical_key("ctrl+shift+n")
+    assert event_key(key("Return")) == "Enter"
+    assert event_key(key("x", ALT_MASK)) == "Alt+X"
+    assert event_key(key("Control_L", 0x4)) is None
+
+
+def test_is_printable():
+    assert is_printable("H") and is_printable("Space")
+    assert not is_printable("Enter") and not is_printable("Ctrl+H")
+
+
+@pytest.fixture
+def root():
+    return FakeWidget()
+
+
+@pytest.fixture
+def bindings(root):
+    return KeyBindings(root)
+
+
+def test_set_bindings_refuses_duplicate_keys(bindings, capsys):
+    refused = bindings.set_bindings("game", {"hint": "h", "help": "H", "new": "Ctrl+N"},
+                                    {"hint": lambda: None, "help": lambda: None, "new": lambda: None})
+    assert refused == ["help"]
+    assert set(bindings.tables["game"]) == {"H", "Ctrl+N"}
+    assert "already bound to hint" in capsys.readouterr().out
+
+
+def test_dispatch_uses_the_most_recent_scope(bindings):
+    calls = []
+    bindings.set_bindings("menu", {"go": "Enter"}, {"go": lambda: calls.append("menu")})
+    bindings.set_bindings("game", {"go": "Enter"}, {"go": lambda: calls.append("game")})
+    bindings.activate("menu")
+    bindings.activate("game")
+    assert bindings.dispatch(key("Return")) == "break"
+    bindings.deactivate("game")
+    bindings.dispatch(key("Return"))
+    assert calls == ["game", "menu"]
+    assert bindings.dispatch(key("q")) is None
+
+
+def test_printable_keys_reach_text_fields(bindings, root):
+    calls = []
+    bindings.set_bindings("game", {"hint": "h", "ask": "Enter"},
+                          {"hint": lambda: calls.append("hint"), "ask": lambda: calls.append("ask")})
+    bindings.activate("game")
+    root.focused = FakeWidget("TEntry")
+    assert bindings.dispatch(key("h")) is None
+    assert bindings.dispatch(key("Return")) == "break"
+    assert calls == ["ask"]
+
+
+def test_capture_takes_every_key(bindings):
+    captured = []
+    bindings.set_bindings("game", {"hint": "h"}, {"hint": lambda: captured.append("hint")})
+    bindings.activate("game")
+    bindings.capture = captured.append
+    event = key("h")
+    assert bindings.dispatch(event) == "break"
+    assert captured == [event]
+
+
+def test_attach_dispatches_one_scope_in_a_dialog(bindings):
+    calls = []
+    bindings.set_bindings("modal", {"close": "Esc"}, {"close": lambda: calls.append("close")})
+    bindings.set_bindings("game", {"hint": "h"}, {"hint": lambda: calls.append("hint")})
+    bindings.activate("game")
+    dialog = FakeWidget("Toplevel")
+    bindings.attach(dialog, "modal")
+    handler, = dialog.handlers["<KeyPress>"]
+    assert handler(key("h")) is None
+    assert handler(key("Escape")) == "break"
+    assert calls == ["close"]
+
+
+def test_scope_owned_by_a_widget_is_dropped_when_it_is_destroyed(bindings):
+    screen = FakeWidget()
+    bindings.activate("game", owner=screen)
+    screen.destroy()
+    assert bindings.active == []
@@ -0,0 +1,73 @@
+import pytest
+
+from leaderboard_sqlite import SQLiteLeaderboardStore
+from leaderboard_store import LeaderboardStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteLeaderboardStore(str(tmp_path / "leaderboard.db"), top_n=3)
+    yield store
+    store.close()
+
+
+def test_trigger_aggregates_per_player(store):
+    store.record_result("Alice", 800, 20.0)
+    store.record_result("  alice ", 900, 25.0)
+    player = store.record_result("ALICE", 0, 40.0, won=False)
+    assert player["games"] == 3 and player["wins"] == 2 and player["win_rate"] == 67
+    assert player["score"] == 900 and player["best_time"] == 20.0
+    assert [game["won"] for game in store.history("alice")] == [False, True, True]
+
+
+def test_top_players_ranks_by_score_then_time(store):
+    for name, score, elapsed in [("A", 500, 30.0), ("B", 700, 20.0), ("C", 500, 12.0), ("D", 300, 5.0)]:
+        store.record_result(name, score, elapsed)
+    assert [p["name"] for p in store.top_players()] == ["B", "C", "A"]
+    assert [p["name"] for p in store.top_players(2)] == ["B", "C"]
+    assert [p["name"] for p in store.sorted_players()] == ["B", "C", "A", "D"]
+
+
+def test_players_with_only_losses_stay_off_the_board(store):
+    store.record_result("Quitter", 0, 12.0, won=False)
+    store.record_result("Alice", 800, 20.0)
+    assert [p["name"] for p in store.top_players()] == ["Alice"]
+    assert store.get_player("quitter")["games"] == 1
+
+
+def test_qualifies_against_a_full_board(store):
+    assert store.qualifies(1)
+    for name, score in [("A", 500), ("B", 600), ("C", 700)]:
+        store.record_result(name, score, 10.0)
+    store.record_result("Loser", 0, 5.0, won=False)
+    assert not store.qualifies(500)
+    assert store.qualifies(501)
+
+
+def test_new_database_imports_the_json_leaderboard(tmp_path):
+    json_store = LeaderboardStore(str(tmp_path / "leaderboard.json"), compact_every=1000)
+    json_store.record_result("Alice", 800, 20.0)
+    json_store.record_result("Bob", 700, 30.0)
+
+    store = SQLiteLeaderboardStore(str(tmp_path / "leaderboard.db"),
+                                   import_from=str(tmp_path / "leaderboard.json"))
+    try:
+        assert [p["name"] for p in store.top_players()] == ["Alice", "Bob"]
+        # Importing only happens into an empty database
+        store.record_result("Carol", 900, 15.0)
+        store.close()
+        store = SQLiteLeaderboardStore(str(tmp_path / "leaderboard.db"),
+                                       import_from=str(tmp_path / "leaderboard.json"))
+        assert store.get_player("Alice")["games"] == 1
+        assert [p["name"] for p in store.top_players()] == ["Carol", "Alice", "Bob"]
+    finally:
+        store.close()
+
+
+def test_defaults_seed_an_empty_database(tmp_path):
+    store = SQLiteLeaderboardStore(str(tmp_path / "leaderboard.db"),
+                                   defaults=[{"name": "Old", "time": 20}])
+    try:
+        assert store.get_player("Old")["score"] == 800
+    finally:
+        store.close()
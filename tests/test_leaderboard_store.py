@@ -0,0 +1,133 @@
+import json
+
+from leaderboard_store import LeaderboardStore, TopN, normalize_name
+
+
+def make_store(tmp_path, **kwargs):
+    return LeaderboardStore(str(tmp_path / "leaderboard.json"), **kwargs)
+
+
+def test_topn_keeps_best_n_one_entry_per_player():
+    top = TopN(3)
+    for key, score in [("a", 100), ("b", 300), ("c", 200), ("d", 50), ("e", 250)]:
+        top.offer(key, score, 10.0)
+    assert top.keys() == ["b", "e", "c"]
+    assert top.threshold() == 200
+
+    # A better result replaces the player's entry instead of adding one
+    top.offer("c", 400, 10.0)
+    assert top.keys() == ["c", "b", "e"]
+    # A worse result for a player on the board changes nothing
+    top.offer("b", 10, 99.0)
+    assert top.keys() == ["c", "b", "e"]
+
+
+def test_topn_breaks_score_ties_on_faster_time():
+    top = TopN(2)
+    top.offer("slow", 500, 30.0)
+    top.offer("fast", 500, 12.0)
+    assert top.keys() == ["fast", "slow"]
+
+
+def test_topn_threshold_is_none_while_there_is_room():
+    top = TopN(3)
+    top.offer("a", 100, 1.0)
+    assert top.threshold() is None
+
+
+def test_record_result_aggregates_per_player(tmp_path):
+    store = make_store(tmp_path)
+    store.record_result("Alice", 800, 20.0)
+    store.record_result("  alice ", 900, 25.0)
+    store.record_result("ALICE", 0, 40.0, won=False)
+
+    player = store.get_player("Alice")
+    assert player["games"] == 3
+    assert player["wins"] == 2
+    assert player["win_rate"] == 67
+    assert player["score"] == 900
+    assert player["best_time"] == 20.0
+    assert normalize_name("  ALICE ") == "alice"
+
+
+def test_log_is_replayed_on_load(tmp_path):
+    store = make_store(tmp_path, compact_every=1000)
+    store.record_result("Alice", 800, 20.0)
+    store.record_result("Bob", 700, 30.0)
+
+    reloaded = make_store(tmp_path)
+    assert [p["name"] for p in reloaded.top_players()] == ["Alice", "Bob"]
+    assert reloaded.last_seq == 2
+
+
+def test_compaction_writes_snapshot_and_truncates_log(tmp_path):
+    store = make_store(tmp_path, compact_every=2)
+    store.record_result("Alice", 800, 20.0)
+    store.record_result("Bob", 700, 30.0)
+
+    with open(tmp_path / "leaderboard.json") as f:
+        snapshot = json.load(f)
+    assert snapshot["last_seq"] == 2
+    assert {p["name"] for p in snapshot["players"]} == {"Alice", "Bob"}
+    assert (tmp_path / "leaderboard.log").read_text() == ""
+
+    store.record_result("Carol", 900, 15.0)
+    reloaded = make_store(tmp_path)
+    assert [p["name"] for p in reloaded.top_players()] == ["Carol", "Alice", "Bob"]
+
+
+def test_records_already_in_the_snapshot_are_not_applied_twice(tmp_path):
+    store = make_store(tmp_path, compact_every=1000)
+    store.record_result("Alice", 800, 20.0)
+    log = (tmp_path / "leaderboard.log").read_text()
+    store.compact()
+    # A crash between writing the snapshot and truncating leaves the old log behind
+    (tmp_path / "leaderboard.log").write_text(log)
+
+    reloaded = make_store(tmp_path)
+    assert reloaded.get_player("Alice")["games"] == 1
+
+
+def test_corrupt_log_lines_are_skipped(tmp_path):
+    store = make_store(tmp_path, compact_every=1000)
+    store.record_result("Alice", 800, 20.0)
+    with open(tmp_path / "leaderboard.log", "a") as f:
+        f.write('{"seq": 2, "name": "Bo')   # torn write
+
+    reloaded = make_store(tmp_path)
+    assert reloaded.get_player("Alice")["games"] == 1
+    assert reloaded.get_player("Bo") is None
+
+
+def test_legacy_list_snapshot_loads(tmp_path):
+    (tmp_path / "leaderboard.json").write_text(json.dumps([
+        {"name": "Old", "time": 20},
+        {"name": "Newer", "score": 850, "games": 4, "win_rate": 50, "best_time": 18.0},
+    ]))
+    store = make_store(tmp_path)
+    assert store.get_player("Old")["score"] == 800
+    newer = store.get_player("Newer")
+    assert newer["wins"] == 2
+    assert [p["name"] for p in store.sorted_players()] == ["Newer", "Old"]
+
+
+def test_qualifies_against_a_full_board(tmp_path):
+    store = make_store(tmp_path, top_n=2)
+    assert store.qualifies(1)
+    store.record_result("A", 500, 10.0)
+    store.record_result("B", 600, 10.0)
+    assert not store.qualifies(500)
+    assert store.qualifies(501)
+
+
+def test_players_with_only_losses_survive_compaction(tmp_path):
+    store = make_store(tmp_path, compact_every=1000)
+    store.record_result("Quitter", 0, 12.0, won=False)
+    store.record_result("Alice", 800, 20.0)
+    store.compact()
+
+    reloaded = make_store(tmp_path)
+    quitter = reloaded.get_player("Quitter")
+    assert quitter["games"] == 1 and quitter["wins"] == 0
+    assert quitter["best_time"] is None
+    assert [p["name"] for p in reloaded.top_players()] == ["Alice"]
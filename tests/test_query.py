@@ -0,0 +1,83 @@
+import re
+
+import pytest
+
+from candidate_set import CandidateIndex
+from cards import ATTRIBUTES, CARDS
+from query import QueryError, compile_expression, compile_question, tokenize
+
+INDEX = CandidateIndex(CARDS, ATTRIBUTES)
+
+
+def names(text):
+    return {card.name for card in INDEX.cards_in(compile_expression(text).mask(INDEX))}
+
+
+def where(predicate):
+    return {card.name for card in CARDS if predicate(card)}
+
+
+def test_single_comparison_matches_compile_question():
+    assert compile_expression("rarity = rare").mask(INDEX) == compile_question("rarity", "=", "rare").mask(INDEX)
+
+
+def test_and_binds_tighter_than_or():
+    assert names("type = spell or rarity = epic and flying") == \
+        where(lambda c: c.card_type == "spell" or (c.rarity == "epic" and c.flying))
+
+
+def test_parentheses_override_precedence():
+    assert names("(type = spell or rarity = epic) and elixir <= 4") == \
+        where(lambda c: (c.card_type == "spell" or c.rarity == "epic") and c.elixir <= 4)
+
+
+def test_not_applies_to_the_next_term_only():
+    assert names("not flying and elixir > 3") == where(lambda c: not c.flying and c.elixir > 3)
+    assert names("not (flying and elixir > 3)") == where(lambda c: not (c.flying and c.elixir > 3))
+    assert names("not not melee") == where(lambda c: c.melee)
+
+
+def test_negated_comparisons():
+    assert names("rarity != common") == where(lambda c: c.rarity != "common")
+    assert names("target not in {ground, air}") == where(lambda c: c.target not in ("ground", "air"))
+
+
+def test_membership_and_ranges():
+    assert names("role in {defense, swarm}") == where(lambda c: c.role in ("defense", "swarm"))
+    assert names("elixir in 3..5") == where(lambda c: 3 <= c.elixir <= 5)
+
+
+def test_keywords_and_values_are_case_insensitive():
+    assert names("Rarity = RARE AND NOT Flying") == where(lambda c: c.rarity == "rare" and not c.flying)
+
+
+def test_repeated_text_reuses_the_compiled_expression():
+    assert compile_expression("elixir  >= 4") is compile_expression("ELIXIR >= 4")
+
+
+def test_tokenize_splits_ranges_and_quoted_values():
+    assert tokenize('elixir in 3..5 or role = "win_condition"') == [
+        ("word", "elixir"), ("in", "in"), ("word", "3"), ("range", ".."), ("word", "5"),
+        ("or", "or"), ("word", "role"), ("op", "="), ("value", "win_condition"),
+    ]
+
+
+@pytest.mark.parametrize("text, message", [
+    ("", "Please enter a question"),
+    ("colour = red", "Unknown property 'colour'"),
+    ("rarity", "Expected an operator after 'rarity'"),
+    ("rarity =", "Question ends too early"),
+    ("(flying", "Question ends too early"),
+    ("flying)", "Unexpected ')'"),
+    ("flying and", "Question ends too early"),
+    ("elixir in {3, 4", "Question ends too early"),
+    ("rarity = rare ~", "Unexpected '~'"),
+])
+def test_syntax_errors(text, message):
+    with pytest.raises(QueryError, match=re.escape(message)):
+        compile_expression(text)
+
+
+def test_invalid_values_are_reported():
+    with pytest.raises(QueryError):
+        compile_expression("elixir > lots")
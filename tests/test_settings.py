@@ -0,0 +1,78 @@
+import json
+import time
+
+import pytest
+
+pytest.importorskip("ttkbootstrap")
+
+from main_menu import SettingsManager
+from services import EventBus, SETTINGS_CHANGED
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # SettingsManager keeps its file at data/settings.json under the working directory
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def saved(workdir):
+    with open(workdir / "data" / "settings.json") as f:
+        return json.load(f)
+
+
+def test_changes_are_written_once_on_flush(workdir):
+    settings = SettingsManager(save_delay=60)
+    for difficulty in ("easy", "hard", "medium"):
+        settings.settings["difficulty"] = difficulty
+        settings.save_settings()
+    assert not (workdir / "data" / "settings.json").exists()
+    settings.flush()
+    assert saved(workdir)["difficulty"] == "medium"
+    assert settings._timer is None and settings._pending is None
+
+
+def test_timer_writes_after_the_delay(workdir):
+    settings = SettingsManager(save_delay=0.01)
+    settings.settings["player_name"] = "Ada"
+    settings.save_settings()
+    deadline = time.monotonic() + 5
+    while settings._timer is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert saved(workdir)["player_name"] == "Ada"
+
+
+def test_flush_with_nothing_pending_writes_nothing(workdir):
+    SettingsManager(save_delay=60).flush()
+    assert not (workdir / "data" / "settings.json").exists()
+
+
+def test_saved_settings_are_loaded_back(workdir):
+    settings = SettingsManager(save_delay=60)
+    settings.settings["sound_enabled"] = False
+    settings.save_settings()
+    settings.flush()
+    assert SettingsManager(save_delay=60).settings["sound_enabled"] is False
+
+
+def test_save_publishes_settings_changed(workdir):
+    events = EventBus()
+    seen = []
+    events.subscribe(SETTINGS_CHANGED, lambda settings: seen.append(settings["difficulty"]))
+    settings = SettingsManager(events=events, save_delay=60)
+    settings.settings["difficulty"] = "hard"
+    settings.save_settings()
+    settings.flush()
+    assert seen == ["hard"]
+
+
+def test_set_keybind_refuses_keys_in_use(workdir):
+    settings = SettingsManager(save_delay=60)
+    ok, message = settings.set_keybind("hint", "n")
+    assert not ok and "new_game" in message
+    assert settings.set_keybind("hint", "ctrl+j") == (True, "Keybind updated successfully")
+    assert settings.get_keybind("hint") == "Ctrl+J"
+    ok, message = settings.set_keybind("guess", "Ctrl+J")
+    assert not ok and "hint" in message
+    settings.flush()
+    assert saved(workdir)["keybinds"]["hint"] == "Ctrl+J"
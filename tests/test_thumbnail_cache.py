@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from thumbnail_cache import ThumbnailCache
+
+SIZE = (10, 10)
+ENTRY_BYTES = 8 + SIZE[0] * SIZE[1] * 4   # header + RGBA pixels
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Source image files; only their identity (path, mtime, size) feeds the cache key"""
+    paths = {}
+    for name in "abc":
+        path = tmp_path / f"{name}.webp"
+        path.write_bytes(name.encode())
+        paths[name] = str(path)
+    return paths
+
+
+def thumb(color):
+    return Image.new("RGBA", SIZE, color)
+
+
+def entry_path(cache, source, fade=False):
+    return cache._path(cache.key(source, SIZE, fade))
+
+
+def set_last_used(cache, source, when):
+    os.utime(entry_path(cache, source), (when, when))
+
+
+def test_round_trip(tmp_path, sources):
+    cache = ThumbnailCache(str(tmp_path / "cache"))
+    image = thumb((200, 10, 10, 128))
+    cache.put(sources["a"], SIZE, False, image)
+    assert cache.get(sources["a"], SIZE).tobytes() == image.tobytes()
+    assert cache.get(sources["a"], SIZE, fade=True) is None
+    assert cache.get(sources["a"], (20, 20)) is None
+    assert cache.get(str(tmp_path / "missing.webp"), SIZE) is None
+
+
+def test_changed_source_misses(tmp_path, sources):
+    cache = ThumbnailCache(str(tmp_path / "cache"))
+    cache.put(sources["a"], SIZE, False, thumb("red"))
+    with open(sources["a"], "ab") as f:
+        f.write(b"new art")
+    assert cache.get(sources["a"], SIZE) is None
+
+
+def test_evicts_least_recently_used(tmp_path, sources):
+    cache = ThumbnailCache(str(tmp_path / "cache"), max_bytes=2 * ENTRY_BYTES + 100)
+    cache.put(sources["a"], SIZE, False, thumb("red"))
+    cache.put(sources["b"], SIZE, False, thumb("green"))
+    set_last_used(cache, sources["a"], 1000)
+    set_last_used(cache, sources["b"], 2000)
+    # Reading "a" makes it the most recently used, so "b" goes first
+    assert cache.get(sources["a"], SIZE) is not None
+
+    cache.put(sources["c"], SIZE, False, thumb("blue"))
+    assert not os.path.exists(entry_path(cache, sources["b"]))
+    assert cache.get(sources["a"], SIZE) is not None
+    assert cache.get(sources["c"], SIZE) is not None
+    assert cache.total_bytes == 2 * ENTRY_BYTES
+
+
+def test_overwriting_an_entry_is_not_counted_twice(tmp_path, sources):
+    cache = ThumbnailCache(str(tmp_path / "cache"), max_bytes=2 * ENTRY_BYTES + 100)
+    cache.put(sources["a"], SIZE, False, thumb("red"))
+    cache.put(sources["b"], SIZE, False, thumb("green"))
+    cache.put(sources["b"], SIZE, False, thumb("blue"))
+    assert cache.total_bytes == 2 * ENTRY_BYTES
+    assert os.path.exists(entry_path(cache, sources["a"]))
+
+
+def test_corrupt_entry_is_discarded(tmp_path, sources, capsys):
+    cache = ThumbnailCache(str(tmp_path / "cache"))
+    cache.put(sources["a"], SIZE, False, thumb("red"))
+    entry = entry_path(cache, sources["a"])
+    with open(entry, "r+b") as f:
+        f.truncate(20)
+    assert cache.get(sources["a"], SIZE) is None
+    assert not os.path.exists(entry)
+    assert "Discarding thumbnail cache entry" in capsys.readouterr().out
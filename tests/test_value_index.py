@@ -0,0 +1,50 @@
+import pytest
+
+from candidate_set import CandidateIndex, CandidateSet
+from cards import ATTRIBUTES, CARDS
+from query import compile_question
+from value_index import ValueIndex
+
+INDEX = CandidateIndex(CARDS, ATTRIBUTES)
+
+
+@pytest.fixture
+def values():
+    return ValueIndex(INDEX, CandidateSet(INDEX))
+
+
+def test_prefix_of_known_value_is_not_a_typo(values):
+    assert not values.preview("rarity", "=", "rar").startswith("⚠")
+    assert not values.preview("rarity", "=", "Leg").startswith("⚠")
+
+
+def test_unknown_value_suggests_closest(values):
+    assert values.preview("rarity", "=", "rarre") == "⚠ No card has rarity 'rarre' — did you mean rare?"
+
+
+def test_completions_most_common_first(values):
+    assert values.completions("rarity") == [("common", 6), ("rare", 6), ("epic", 4), ("legendary", 4)]
+    assert values.completions("type", " S") == [("spell", 2)]
+
+
+def test_counts_follow_eliminations(values):
+    spells = compile_question("type", "=", "spell").mask(INDEX)
+    values.candidate_set.answer(spells, False)
+    assert values.completions("type") == [("troop", 16), ("building", 2)]
+    assert values.completions("type", "sp") == []
+
+
+def test_preview_counts_both_answers(values):
+    assert values.preview("elixir", "<=", "3") == "Yes → would eliminate 13 cards · No → would eliminate 7 cards"
+    assert values.preview("flying", "", "flying", expression=True) == \
+        "Yes → would eliminate 15 cards · No → would eliminate 5 cards"
+
+
+def test_preview_of_question_that_cannot_split(values):
+    values.candidate_set.answer(compile_question("type", "=", "spell").mask(INDEX), True)
+    assert values.preview("type", "=", "spell") == "Would eliminate 0 cards — all 2 answer the same"
+
+
+def test_preview_reports_parse_errors_and_ignores_blank(values):
+    assert values.preview("", "", "rarity = rare and", expression=True) == "⚠ Question ends too early"
+    assert values.preview("rarity", "=", "   ") is None